@@ -0,0 +1,56 @@
+"""
+Negotiated compression of large JSON responses.
+
+JSON responses of at least COMPRESSION_MIN_SIZE bytes are compressed with the
+best encoding the client accepts: brotli when the optional `brotli` package is
+installed, otherwise gzip. Job lists are highly repetitive, so both shrink
+them by more than 80%. Smaller responses are sent as they are, because the
+saving would not pay for the CPU time. Streamed responses (the notification
+stream, file downloads) are never touched.
+
+Responses that could be compressed carry `Vary: Accept-Encoding`. ETags from
+conditional.py are weak, so they still match whichever encoding a client got.
+"""
+import gzip
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip is offered
+    brotli = None
+
+
+COMPRESSIBLE_MIMETYPES = ('application/json',)
+
+
+class ResponseCompression:
+
+    def __init__(self, app):
+        self.min_size = app.config['COMPRESSION_MIN_SIZE']
+        self.gzip_level = app.config['COMPRESSION_GZIP_LEVEL']
+        self.brotli_quality = app.config['COMPRESSION_BROTLI_QUALITY']
+        self.encodings = ['br', 'gzip'] if brotli is not None else ['gzip']
+        app.after_request(self._compress)
+
+    def _compress(self, response):
+        if (response.is_streamed or response.direct_passthrough or response.status_code in (204, 304)
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES or 'Content-Encoding' in response.headers):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        encoding = request.accept_encodings.best_match(self.encodings)
+        if encoding is None:
+            return response
+
+        response.set_data(self.encode(data, encoding))
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+    def encode(self, data, encoding):
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality)
+        return gzip.compress(data, compresslevel=self.gzip_level, mtime=0)
@@ -0,0 +1,42 @@
+"""
+Conditional GET for endpoints whose payload only changes when a version counter does.
+
+A view decorated with @conditional_get(versions) is served with an ETag built
+from the counters returned by versions(), the endpoint, its URL arguments and
+its query string. When the client's If-None-Match already holds that ETag the
+view is not called at all: the answer is an empty 304, and the only SQL the
+request runs is whatever versions() needs to read the counters.
+
+ETags are weak, because the same payload may be sent gzip or brotli encoded
+(see compression.py). Responses carry Cache-Control: private, no-cache, so
+browsers keep the body and revalidate it on every use. Counters must be
+bumped in the same transaction as the writes that change the payload.
+"""
+from functools import wraps
+import hashlib
+
+from flask import current_app, request
+
+
+def compute_etag(*parts):
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def conditional_get(versions):
+    """versions() returns a tuple of everything the view's payload depends on (e.g. the user id and counters)."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = compute_etag(request.endpoint, sorted(kwargs.items()),
+                                sorted(request.args.items(multi=True)), tuple(versions()))
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
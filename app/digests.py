@@ -0,0 +1,57 @@
+"""
+Email digests of in-app notifications.
+
+Instead of one email per event, pending notifications of users who opted into
+email delivery are collected on a fixed interval and sent as a single digest
+per user through the email outbox (see mailer.py). The queries live with the
+models in main.py (send_notification_digests); this module holds the digest
+text and the background scheduler.
+"""
+import logging
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+def compose_digest(first_name, notifications):
+    """Returns (subject, body) for a digest of the given notifications (objects with title, message and link)."""
+    count = len(notifications)
+    subject = f"You have {count} new notification{'s' if count != 1 else ''}"
+    lines = [f"Hi {first_name or 'there'},", "", f"{subject}:", ""]
+    for notification in notifications:
+        lines.append(f"- {notification.title}: {notification.message}")
+        if notification.link:
+            lines.append(f"  {notification.link}")
+    lines += ["", "You are receiving this email because email notifications are enabled in your settings."]
+    return subject, "\n".join(lines)
+
+
+class DigestScheduler:
+    """
+    Runs `job` inside an app context on a daemon thread: once when started, for digests that fell due
+    while the app was down, and then every NOTIFICATION_DIGEST_INTERVAL_SECONDS.
+    """
+
+    def __init__(self, app, job):
+        self.app = app
+        self.job = job
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Starts the scheduler thread if it is not already running in this process."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='digest-scheduler', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self.app.app_context():
+                try:
+                    self.job()
+                except Exception:
+                    logger.exception("Error sending notification digests")
+            time.sleep(self.app.config['NOTIFICATION_DIGEST_INTERVAL_SECONDS'])
@@ -0,0 +1,173 @@
+"""
+Eligibility engine for job browsing.
+
+Each job's JobRequired* rows are compiled once into a compact, lower-cased
+matcher (see compile_job). A seeker's profile is reduced the same way (see
+build_user_profile), and evaluate_catalog() then checks the profile against a
+whole list of matchers in a single pass. Requirement predicates are shared
+across the catalog, so a predicate such as "skill including 'python'" is only
+evaluated once per request no matter how many jobs ask for it.
+
+The rules mirror the original inline checks in browse_jobs() exactly.
+"""
+from collections import namedtuple
+from datetime import datetime
+import threading
+
+
+DEGREE_LEVELS = {"High School": 1, "Associate's": 2, "Bachelor's": 3, "Master's": 4, "Doctoral": 5}
+
+# Level used for a required degree whose name is not in DEGREE_LEVELS (nobody can satisfy it).
+UNKNOWN_DEGREE_LEVEL = 99
+
+# required_degree_level: highest level among required degrees (0 when none).
+# skills: tuple of (match_type, title) predicates.
+# certificates: tuple of (title_match_type, title, issuer_match_type, issuer) predicates.
+# experiences: tuple of (years_required, role_match_type, role_title, country_match_type, country) predicates.
+# All strings are lower-cased; an empty or missing requirement string is stored as None.
+JobMatcher = namedtuple('JobMatcher', [
+    'job_id', 'version', 'required_degree_level', 'skills', 'certificates', 'experiences'
+])
+
+# Lower-cased view of a seeker's profile, built once per request.
+UserProfile = namedtuple('UserProfile', [
+    'skill_titles', 'certificates', 'experiences', 'total_experience_years', 'max_degree_level'
+])
+
+
+def _lower(value):
+    return value.lower() if value else None
+
+
+def _matches(match_type, needle, haystack):
+    """Same semantics as the original checks: a missing needle always matches."""
+    if needle is None:
+        return True
+    if match_type == 'exact':
+        return needle == haystack
+    if match_type == 'including':
+        return needle in haystack
+    return False
+
+
+def compile_job(job):
+    """Compiles a JobPosting's required rows into a JobMatcher."""
+    required_degrees = [req for req in job.required_degrees if req.is_required]
+    required_degree_level = max(
+        [DEGREE_LEVELS.get(req.degree_level, UNKNOWN_DEGREE_LEVEL) for req in required_degrees], default=0)
+
+    skills = tuple(
+        (req.title_match_type, req.skill_title.lower())
+        for req in job.required_skills if req.is_required
+    )
+    certificates = tuple(
+        (req.title_match_type, _lower(req.certificate_title), req.issuer_match_type, _lower(req.issuer))
+        for req in job.required_certificates if req.is_required
+    )
+    experiences = tuple(
+        (req.years_required, req.role_title_match_type, _lower(req.role_title),
+         req.country_match_type, _lower(req.country))
+        for req in job.required_experiences if req.is_required
+    )
+
+    return JobMatcher(job.id, job.updated_at, required_degree_level, skills, certificates, experiences)
+
+
+def build_user_profile(skills, certificates, experiences, degrees):
+    """
+    Reduces a seeker's profile rows to the lower-cased values the matchers compare against.
+    An ongoing experience counts up to the current calendar year, so results stored from these profiles go stale
+    when the year changes; `flask refresh-eligibility-year` recomputes the users concerned.
+    """
+    current_year = datetime.now().year
+    total_experience_years = sum(
+        (exp.end_date.year - exp.start_date.year if exp.end_date else current_year - exp.start_date.year)
+        for exp in experiences
+    )
+    return UserProfile(
+        skill_titles=frozenset(s.title.lower() for s in skills),
+        certificates=frozenset((c.title.lower(), c.issuer.lower()) for c in certificates),
+        experiences=frozenset((e.position_title.lower(), e.country.lower() if e.country else "") for e in experiences),
+        total_experience_years=total_experience_years,
+        max_degree_level=max([DEGREE_LEVELS.get(d.degree.value, 0) for d in degrees], default=0)
+    )
+
+
+def evaluate_catalog(profile, matchers):
+    """
+    Evaluates one profile against many JobMatchers.
+    Returns a dict of job_id -> bool (the user's eligibility for that job).
+    """
+    skill_memo = {}
+    certificate_memo = {}
+    experience_memo = {}
+
+    def skill_ok(predicate):
+        result = skill_memo.get(predicate)
+        if result is None:
+            match_type, title = predicate
+            result = any(_matches(match_type, title, user_title) for user_title in profile.skill_titles)
+            skill_memo[predicate] = result
+        return result
+
+    def certificate_ok(predicate):
+        result = certificate_memo.get(predicate)
+        if result is None:
+            title_type, title, issuer_type, issuer = predicate
+            result = any(
+                _matches(title_type, title, user_title) and _matches(issuer_type, issuer, user_issuer)
+                for user_title, user_issuer in profile.certificates
+            )
+            certificate_memo[predicate] = result
+        return result
+
+    def experience_ok(predicate):
+        result = experience_memo.get(predicate)
+        if result is None:
+            years_required, role_type, role_title, country_type, country = predicate
+            result = profile.total_experience_years >= years_required and any(
+                _matches(role_type, role_title, user_title) and _matches(country_type, country, user_country)
+                for user_title, user_country in profile.experiences
+            )
+            experience_memo[predicate] = result
+        return result
+
+    results = {}
+    for matcher in matchers:
+        results[matcher.job_id] = (
+            profile.max_degree_level >= matcher.required_degree_level
+            and all(skill_ok(p) for p in matcher.skills)
+            and all(certificate_ok(p) for p in matcher.certificates)
+            and all(experience_ok(p) for p in matcher.experiences)
+        )
+    return results
+
+
+class MatcherCatalog:
+    """
+    Process-wide cache of compiled JobMatchers keyed by job id.
+    Entries are versioned by JobPosting.updated_at, so a job edited by another
+    worker process misses on the next lookup instead of being served stale, and
+    callers only need to load the requirements of the jobs that missed.
+    """
+
+    def __init__(self):
+        self._matchers = {}
+        self._lock = threading.Lock()
+
+    def put(self, job):
+        matcher = compile_job(job)
+        with self._lock:
+            self._matchers[job.id] = matcher
+        return matcher
+
+    def lookup(self, job_id, version):
+        """Returns the cached matcher for job_id if it was compiled from that version, else None."""
+        matcher = self._matchers.get(job_id)
+        if matcher is None or matcher.version != version:
+            return None
+        return matcher
+
+    def discard(self, job_id):
+        with self._lock:
+            self._matchers.pop(job_id, None)
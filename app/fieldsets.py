@@ -0,0 +1,30 @@
+"""
+Sparse fieldsets for list endpoints.
+
+A client that only needs a few attributes of each item names them in the
+`fields` query parameter, e.g. GET /api/jobs?fields=id,title. The endpoint
+returns only those keys and, where it can, skips loading what was left out.
+Unknown names are rejected instead of ignored, so a typo shows up as a 400
+rather than as a silently missing key.
+"""
+
+
+def parse_fields(args, allowed):
+    """Returns the requested field names in order, or None for all of them. Raises ValueError for unknown names."""
+    raw = args.get('fields')
+    if raw is None:
+        return None
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    if not fields:
+        raise ValueError('No fields requested')
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def select_fields(items, fields):
+    """Trims each item dict to the requested fields (all of them when fields is None)."""
+    if fields is None:
+        return items
+    return [{name: item[name] for name in fields} for item in items]
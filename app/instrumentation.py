@@ -0,0 +1,118 @@
+"""
+Structured logging and sampled per-request instrumentation.
+
+configure_logging() sends every log record through a QueueHandler, so request
+threads only append to an in-memory queue. A QueueListener thread formats the
+records as one JSON object per line and writes them to stderr.
+
+RequestInstrumentation logs one record per sampled request. The record holds
+the total time, the number of SQL statements and the time spent in them, and
+the time spent encoding JSON. With REQUEST_METRICS_SAMPLE_RATE = 0 nothing is
+registered at all: no request hooks, no SQL listeners, unwrapped JSON provider.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import time
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+request_logger = logging.getLogger('meritus.requests')
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per record. Structured fields are passed as extra={'fields': {...}}."""
+
+    def format(self, record):
+        entry = {
+            'ts': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level):
+    """Routes all logging through a non-blocking queue. Call it before anything logs."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter())
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    # Flush what is still queued when the process exits.
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    return listener
+
+
+class JSONTimingMixin:
+    """Adds the time spent encoding JSON to the current sampled request. Mixed into the app's JSON provider."""
+
+    def dumps(self, obj, **kwargs):
+        metrics = g.get('request_metrics') if has_request_context() else None
+        if metrics is None:
+            return super().dumps(obj, **kwargs)
+        started = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            metrics['serialize_ms'] += (time.perf_counter() - started) * 1000
+
+
+class RequestInstrumentation:
+
+    def __init__(self, app):
+        self.sample_rate = app.config['REQUEST_METRICS_SAMPLE_RATE']
+        if self.sample_rate <= 0:
+            return
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        # Set up the JSON provider (see jsonprovider.py) before this, it is extended rather than replaced.
+        provider_class = type(app.json)
+        app.json = type(f'Instrumented{provider_class.__name__}', (JSONTimingMixin, provider_class), {})(app)
+        event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    def _start(self):
+        if self.sample_rate >= 1 or random.random() < self.sample_rate:
+            g.request_metrics = {'started': time.perf_counter(), 'db_queries': 0, 'db_ms': 0.0, 'serialize_ms': 0.0}
+
+    def _finish(self, response):
+        metrics = g.pop('request_metrics', None)
+        if metrics is not None:
+            request_logger.info('request', extra={'fields': {
+                'method': request.method,
+                'path': request.path,
+                'endpoint': request.endpoint,
+                'status': response.status_code,
+                'duration_ms': round((time.perf_counter() - metrics['started']) * 1000, 2),
+                'db_queries': metrics['db_queries'],
+                'db_ms': round(metrics['db_ms'], 2),
+                'serialize_ms': round(metrics['serialize_ms'], 2),
+                'response_bytes': response.calculate_content_length(),
+            }})
+        return response
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and 'request_metrics' in g:
+            conn.info['query_started'] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.pop('query_started', None)
+        if started is not None and has_request_context() and 'request_metrics' in g:
+            metrics = g.request_metrics
+            metrics['db_queries'] += 1
+            metrics['db_ms'] += (time.perf_counter() - started) * 1000
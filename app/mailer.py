@@ -0,0 +1,141 @@
+"""
+Asynchronous outbound email.
+
+Requests never talk to the SMTP server. They add a row to the outbox table in
+their own transaction and call OutboxSender.wake() after committing. A
+background thread (one per process, started with the first request the process
+serves) drains the outbox in batches: right away when it starts, after each
+wake() and every MAIL_OUTBOX_POLL_SECONDS. Each batch is sent over a single
+reused SMTP connection. Failed messages are retried with exponential backoff
+until max_attempts is reached, and are then marked 'failed'. With
+BACKGROUND_WORKERS off, no thread is started and drain() is left to a scheduled
+`flask send-outbox`.
+
+The outbox model must provide: id, sender, recipient, subject, body, status
+('pending' / 'sent' / 'failed'), attempts, next_attempt_at, last_error and sent_at.
+"""
+from datetime import datetime, timedelta
+import logging
+import smtplib
+import threading
+
+from flask_mail import Message
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxSender:
+
+    def __init__(self, app, db, mail, model):
+        self.app = app
+        self.db = db
+        self.mail = mail
+        self.model = model
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def batch_size(self):
+        return self.app.config['MAIL_OUTBOX_BATCH_SIZE']
+
+    @property
+    def max_attempts(self):
+        return self.app.config['MAIL_OUTBOX_MAX_ATTEMPTS']
+
+    @property
+    def retry_seconds(self):
+        return self.app.config['MAIL_OUTBOX_RETRY_SECONDS']
+
+    def enqueue(self, recipient, subject, body, sender=None):
+        """Adds a message to the caller's session. It is sent once the caller commits and calls wake()."""
+        message = self.model(
+            sender=sender or self.app.config['MAIL_DEFAULT_SENDER'],
+            recipient=recipient,
+            subject=subject,
+            body=body,
+            status='pending',
+            attempts=0,
+            next_attempt_at=datetime.utcnow()
+        )
+        self.db.session.add(message)
+        return message
+
+    def wake(self):
+        """Starts the background sender if needed and asks it to drain the outbox now."""
+        if not self.app.config['BACKGROUND_WORKERS']:
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='outbox-sender', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def drain(self):
+        """Sends batches until no message is due. Must run inside an app context. Returns the number of messages handled."""
+        total = 0
+        while True:
+            handled = self.send_batch()
+            total += handled
+            if handled < self.batch_size:
+                return total
+
+    def send_batch(self):
+        """Claims up to batch_size due messages and sends them over one SMTP connection."""
+        model = self.model
+        now = datetime.utcnow()
+        # SKIP LOCKED lets several processes drain the same outbox without sending a message twice.
+        messages = model.query.filter(
+            model.status == 'pending',
+            model.next_attempt_at <= now
+        ).order_by(model.id).limit(self.batch_size).with_for_update(skip_locked=True).all()
+        if not messages:
+            self.db.session.rollback()
+            return 0
+
+        remaining = list(messages)
+        try:
+            with self.mail.connect() as connection:
+                while remaining:
+                    message = remaining[0]
+                    try:
+                        connection.send(Message(message.subject, sender=message.sender,
+                                                recipients=[message.recipient], body=message.body))
+                    except smtplib.SMTPServerDisconnected:
+                        # The connection is gone: the rest of the batch is retried below.
+                        raise
+                    except Exception as e:
+                        self._schedule_retry(message, e, now)
+                    else:
+                        message.status = 'sent'
+                        message.sent_at = datetime.utcnow()
+                        message.last_error = None
+                    remaining.pop(0)
+        except Exception as e:
+            for message in remaining:
+                self._schedule_retry(message, e, now)
+
+        self.db.session.commit()
+        return len(messages)
+
+    def _schedule_retry(self, message, error, now):
+        message.attempts += 1
+        message.last_error = str(error)[:500]
+        if message.attempts >= self.max_attempts:
+            message.status = 'failed'
+            logger.error("Giving up on outbox email %s to %s: %s", message.id, message.recipient, error)
+        else:
+            message.next_attempt_at = now + timedelta(seconds=self.retry_seconds * 2 ** (message.attempts - 1))
+
+    def _run(self):
+        while True:
+            # Also wake up periodically to pick up retries and messages queued by other processes.
+            self._wakeup.wait(self.app.config['MAIL_OUTBOX_POLL_SECONDS'])
+            self._wakeup.clear()
+            with self.app.app_context():
+                try:
+                    self.drain()
+                except Exception:
+                    self.db.session.rollback()
+                    logger.exception("Error draining the email outbox")
@@ -1,22 +1,41 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, Response, stream_with_context
 from datetime import datetime
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
-from flask_mail import Mail, Message
+from flask_mail import Mail
 from flask_migrate import Migrate
 from itsdangerous import URLSafeTimedSerializer, SignatureExpired
-from werkzeug.security import generate_password_hash, check_password_hash
 import os
 from dotenv import load_dotenv
 from sqlalchemy.sql import func
-from sqlalchemy import or_
+from sqlalchemy import and_, or_, delete, insert, select, update, event, DDL, literal_column, cast, case, false, Float
+from sqlalchemy.orm import defer, load_only, selectinload, undefer, column_property
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects import postgresql, sqlite
 import enum
+from eligibility import MatcherCatalog, build_user_profile, evaluate_catalog
+from pagination import DEFAULT_PAGE_SIZE, KeysetPage
+from notifier import NotificationBroker, stream_events
+from mailer import OutboxSender
+from digests import DigestScheduler, compose_digest
+from search import InvertedIndex, to_prefix_tsquery
+from queryplans import capture_statements, find_seq_scans
+from instrumentation import RequestInstrumentation, configure_logging
+from querybudget import QueryTracker, query_budget
+from usercache import UserCache, UserIdentity
+from passwords import HashingBusy, PasswordHasher
+from conditional import conditional_get
+from compression import ResponseCompression
+from jsonprovider import OrjsonProvider
+from fieldsets import parse_fields, select_fields
+from exports import EXPORT_FORMATS, stream_export
 # from .models import User, JobApplication
 
 
 
 load_dotenv()
 
+configure_logging(os.environ.get('LOG_LEVEL', 'INFO'))
 app = Flask(__name__)
 
 # Configuration
@@ -33,14 +52,73 @@ app.config['MAIL_USERNAME'] = 'your-dev-email@example.com'
 app.config['MAIL_PASSWORD'] = None
 app.config['MAIL_DEFAULT_SENDER'] = 'your-dev-email@example.com'
 
+# Outbound email queue (see mailer.py)
+app.config['MAIL_OUTBOX_BATCH_SIZE'] = 50  # Messages sent per SMTP connection
+app.config['MAIL_OUTBOX_MAX_ATTEMPTS'] = 5
+app.config['MAIL_OUTBOX_RETRY_SECONDS'] = 30  # First retry delay, doubled after every failed attempt
+app.config['MAIL_OUTBOX_POLL_SECONDS'] = 10  # How often the sender checks for due retries
+# Run the email sender and digest scheduler in the app processes; 0 when cron runs send-outbox/send-digests instead
+app.config['BACKGROUND_WORKERS'] = os.environ.get('BACKGROUND_WORKERS', '1') == '1'
+app.config['NOTIFICATION_DIGEST_INTERVAL_SECONDS'] = 900  # How often pending notifications are emailed as digests
+app.config['NOTIFICATION_DIGEST_BATCH_SIZE'] = 1000  # Notifications processed per digest transaction
+
+# Notification stream (Server-Sent Events) configuration
+app.config['NOTIFICATION_STREAM_RESYNC_SECONDS'] = 30  # Re-check the DB this often for changes made by other workers
+app.config['NOTIFICATION_STREAM_MAX_SECONDS'] = 300  # Close streams after this long; the browser reconnects
+
+# Job search where PostgreSQL's tsvector column is not available (see search.py). Only this many best matches are
+# returned, since each is bound as SQL parameters and SQLite limits the number of parameters in a statement
+app.config['SEARCH_FALLBACK_MAX_RESULTS'] = 300
+
+# Streamed exports (see exports.py): rows fetched from the database per round-trip
+app.config['EXPORT_YIELD_PER'] = 1000
+
+# Request metrics (see instrumentation.py): fraction of requests logged with timings and query counts, 0 disables
+app.config['REQUEST_METRICS_SAMPLE_RATE'] = float(os.environ.get('REQUEST_METRICS_SAMPLE_RATE', '0'))
+# SQL query budget and N+1 detection (see querybudget.py), always on in debug and testing mode
+app.config['SQL_QUERY_TRACKING'] = os.environ.get('SQL_QUERY_TRACKING') == '1'
+app.config['SQL_QUERY_BUDGET'] = 20  # Statements per request before a warning; override per view with @query_budget
+app.config['SQL_REPEATED_QUERY_THRESHOLD'] = 3  # The same statement this many times in one request looks like an N+1
+
+# Per-process cache of the identity restored for authenticated requests (see usercache.py)
+app.config['USER_CACHE_SIZE'] = int(os.environ.get('USER_CACHE_SIZE', '10000'))
+app.config['USER_CACHE_TTL_SECONDS'] = 60  # Bounds how long changes made by other workers go unnoticed
+
+# Password hashing (see passwords.py). Hashes made with another algorithm or a lower cost are upgraded at the next
+# login. The default matches Werkzeug 3.1's own pbkdf2 default, which existing hashes were made with
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:1000000')
+app.config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS', str(os.cpu_count() or 2)))
+app.config['PASSWORD_HASH_MAX_PENDING'] = 32  # Hashes admitted at once; more are turned away with a 503
+app.config['PASSWORD_HASH_WAIT_SECONDS'] = 0.2  # How long a request may wait for a free slot
+
+# Compression of JSON responses (see compression.py); responses smaller than COMPRESSION_MIN_SIZE bytes are sent as is
+app.config['COMPRESSION_MIN_SIZE'] = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+app.config['COMPRESSION_GZIP_LEVEL'] = 5  # Level 6+ costs twice the CPU on job lists for ~1.5% smaller output
+app.config['COMPRESSION_BROTLI_QUALITY'] = 5  # Used when the optional brotli package is installed
+
+app.json = OrjsonProvider(app)
+
 db = SQLAlchemy(app)
 migrate = Migrate(app, db)
+request_instrumentation = RequestInstrumentation(app)
+response_compression = ResponseCompression(app)
+query_tracker = QueryTracker(app)
 
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 mail = Mail(app)
+user_cache = UserCache(app.config['USER_CACHE_SIZE'], app.config['USER_CACHE_TTL_SECONDS'])
+password_hasher = PasswordHasher(app.config['PASSWORD_HASH_METHOD'], app.config['PASSWORD_HASH_WORKERS'],
+                                 app.config['PASSWORD_HASH_MAX_PENDING'], app.config['PASSWORD_HASH_WAIT_SECONDS'])
 s = URLSafeTimedSerializer(app.config['SECRET_KEY'])
 
+# Compiled eligibility matchers for job postings, refreshed on create/update
+job_matchers = MatcherCatalog()
+# Wakes up open notification streams when a user's notifications change
+notification_broker = NotificationBroker()
+# In-process full-text index of job postings, used only when the database is not PostgreSQL
+job_search_index = InvertedIndex()
+
 
 # Class #1
 class User(UserMixin, db.Model):
@@ -59,6 +137,8 @@ class User(UserMixin, db.Model):
     company_name = db.Column(db.String(150))
     company_description = db.Column(db.Text)
     industry = db.Column(db.String(100))
+    # Bumped with every write to the user's profile or applications (see conditional.py)
+    profile_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
     experiences = db.relationship('Experience', backref='user', lazy=True, cascade="all, delete-orphan")
     certificates = db.relationship('Certificate', backref='user', lazy=True, cascade="all, delete-orphan")
     degrees = db.relationship('Degree', backref='user', lazy=True, cascade="all, delete-orphan")
@@ -86,6 +166,8 @@ class User(UserMixin, db.Model):
 # Class #2
 class SkillSource(db.Model):
     __tablename__ = 'skill_sources'
+    # The primary key covers lookups by skill; this one finds the skills sourced from an experience/certificate/degree.
+    __table_args__ = (db.Index('ix_skill_sources_source', 'source_type', 'source_id'),)
     skill_id = db.Column(db.Integer, db.ForeignKey('skill.id'), primary_key=True)
     source_id = db.Column(db.Integer, primary_key=True)
     source_type = db.Column(db.String(20), primary_key=True)
@@ -98,49 +180,22 @@ class Skill(db.Model):
     title = db.Column(db.String(150), nullable=False)
     status = db.Column(db.String(20), nullable=False, default='Claimed')
     attestation_count = db.Column(db.Integer, default=0)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     is_public = db.Column(db.Boolean, nullable=False, default=True)
 
     skill_sources = db.relationship('SkillSource', backref='skill', lazy=True, cascade="all, delete-orphan")
 
     def get_acquired_at_sources(self):
         """Get all sources where this skill was acquired"""
-        print("Executing get_acquired_at_sources on class Skill: ", self.skill_sources)
-        sources = []
-
-        for skill_source in self.skill_sources:
-            source_id = skill_source.source_id
-            source_type = skill_source.source_type
-
-            if source_type == 'experience':
-                source = Experience.query.get(source_id)
-                if source:
-                    sources.append({
-                        'id': source.id,
-                        'type': 'Experience',
-                        'title': source.position_title
-                    })
-            elif source_type == 'certificate':
-                source = Certificate.query.get(source_id)
-                if source:
-                    sources.append({
-                        'id': source.id,
-                        'type': 'Certificate',
-                        'title': source.title
-                    })
-            elif source_type == 'degree':
-                source = Degree.query.get(source_id)
-                if source:
-                    sources.append({
-                        'id': source.id,
-                        'type': 'Degree',
-                        'title': f"{source.degree.value} in {source.field_of_study}"
-                    })
-
-        return sources
-
-    def to_dict(self):
-        print("Executing to_dict on class Skill: ", self.status)
+        return resolve_skill_sources([self])[self.id]
+
+    def to_dict(self, acquired_at_sources=None):
+        """
+        acquired_at_sources can be passed in (see resolve_skill_sources) when serializing
+        many skills, so the sources are not fetched once per skill.
+        """
+        if acquired_at_sources is None:
+            acquired_at_sources = self.get_acquired_at_sources()
         status_display = self.status
         if self.status == 'Attested' and self.attestation_count > 0:
             status_display = f"Attested by {self.attestation_count} person{'s' if self.attestation_count != 1 else ''}"
@@ -152,7 +207,7 @@ class Skill(db.Model):
             "status": self.status,
             "status_display": status_display,
             "attestation_count": self.attestation_count,
-            "acquired_at_sources": self.get_acquired_at_sources(),
+            "acquired_at_sources": acquired_at_sources,
             "is_public": self.is_public,
         }
 
@@ -169,13 +224,25 @@ class Experience(db.Model):
     is_present = db.Column(db.Boolean, default=False)
     employment_type = db.Column(db.String(50))
     employment_arrangement = db.Column(db.String(50))
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     is_public = db.Column(db.Boolean, nullable=False, default=True)
     responsibilities = db.Column(db.Text, nullable=True)
     achievements = db.Column(db.Text, nullable=True)
 
+    FIELDS = ('id', 'position_title', 'employer', 'country', 'city', 'start_date', 'end_date', 'is_present',
+              'employment_type', 'employment_arrangement', 'is_public', 'responsibilities', 'achievements')
+    # Free text, left out of the summary projection
+    TEXT_FIELDS = ('responsibilities', 'achievements')
+
     def to_dict(self):
-        print("Executing to_dict on class Experience.")
+        return {
+            **self.to_summary_dict(),
+            'responsibilities': self.responsibilities or '',
+            'achievements': self.achievements or ''
+        }
+
+    def to_summary_dict(self):
+        """to_dict() without the free-text fields. Load with EXPERIENCE_SUMMARY_LOADER."""
         return {
             'id': self.id,
             'position_title': self.position_title,
@@ -187,9 +254,7 @@ class Experience(db.Model):
             'is_present': self.is_present,
             'employment_type': self.employment_type,
             'employment_arrangement': self.employment_arrangement,
-            'is_public': self.is_public,
-            'responsibilities': self.responsibilities or '',
-            'achievements': self.achievements or ''
+            'is_public': self.is_public
         }
 
 
@@ -202,11 +267,10 @@ class Certificate(db.Model):
     expiry_date = db.Column(db.Date, nullable=True)
     credential_id = db.Column(db.String(100))
     credential_url = db.Column(db.String(255))
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     is_public = db.Column(db.Boolean, nullable=False, default=True)
 
     def to_dict(self):
-        print("Executing to_dict on class Certificate.")
         return {
             'id': self.id,
             'title': self.title,
@@ -239,11 +303,10 @@ class Degree(db.Model):
     start_date = db.Column(db.Date, nullable=False)
     end_date = db.Column(db.Date, nullable=False)
     gpa = db.Column(db.String(10))
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     is_public = db.Column(db.Boolean, nullable=False, default=True)
 
     def to_dict(self):
-        print("Executing to_dict on class Degree.")
         return {
             'id': self.id,
             'degree': self.degree.value if self.degree else None,
@@ -258,8 +321,71 @@ class Degree(db.Model):
         }
 
 
+# --- Batched resolution of Skill.acquired_at_sources ---
+def _describe_skill_source(source_type, source):
+    if source_type == 'experience':
+        return {'id': source.id, 'type': 'Experience', 'title': source.position_title}
+    if source_type == 'certificate':
+        return {'id': source.id, 'type': 'Certificate', 'title': source.title}
+    return {'id': source.id, 'type': 'Degree', 'title': f"{source.degree.value} in {source.field_of_study}"}
+
+
+def resolve_skill_sources(skills, loaded=None):
+    """
+    Resolves the acquired_at sources of many skills at once.
+    Issues one query for the SkillSource rows and one IN query per source type,
+    instead of one query per source. Returns a dict of skill_id -> list of source dicts.
+    `loaded` optionally maps a source type to rows the caller already has
+    (e.g. {'experience': experiences}); only sources missing from it are queried.
+    """
+    sources = {skill.id: [] for skill in skills}
+    if not sources:
+        return sources
+
+    links = SkillSource.query.filter(SkillSource.skill_id.in_(sources.keys())).all()
+    ids_by_type = {}
+    for link in links:
+        ids_by_type.setdefault(link.source_type, set()).add(link.source_id)
+
+    resolved = {}
+    for source_type, rows in (loaded or {}).items():
+        for source in rows:
+            resolved[(source_type, source.id)] = _describe_skill_source(source_type, source)
+    for source_type, model in (('experience', Experience), ('certificate', Certificate), ('degree', Degree)):
+        missing = {source_id for source_id in ids_by_type.get(source_type, ())
+                   if (source_type, source_id) not in resolved}
+        if missing:
+            for source in model.query.filter(model.id.in_(missing)):
+                resolved[(source_type, source.id)] = _describe_skill_source(source_type, source)
+
+    for link in links:
+        source = resolved.get((link.source_type, link.source_id))
+        if source:
+            sources[link.skill_id].append(dict(source))
+    return sources
+
+
+# Length of the job description preview in list responses
+DESCRIPTION_PREVIEW_LENGTH = 200
+JOB_REQUIREMENT_FIELDS = ('required_skills', 'required_experiences', 'required_certificates', 'required_degrees')
+IDEMPOTENCY_KEY_MAX_LENGTH = 64
+# Application statuses an employer can set, and the JobPosting counter column that tallies each
+APPLICATION_STATUS_COUNTERS = {
+    'Submitted': 'submitted_count',
+    'Under Review': 'under_review_count',
+    'Rejected': 'rejected_count',
+    'Offer Sent': 'offer_sent_count',
+    'Accepted': 'accepted_count',
+}
+
+
 # Class #7
 class JobPosting(db.Model):
+    __table_args__ = (
+        # Browse (active jobs, newest first) and the employer's own job list
+        db.Index('ix_job_posting_status_created_at', 'status', 'created_at', 'id'),
+        db.Index('ix_job_posting_posted_by_created_at', 'posted_by', 'created_at', 'id'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
@@ -274,17 +400,31 @@ class JobPosting(db.Model):
     posted_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # The start of the description, computed by the database so lists never load the full text.
+    # One character more than the preview, to tell whether it was cut.
+    description_head = column_property(func.substr(description, 1, DESCRIPTION_PREVIEW_LENGTH + 1), deferred=True)
+    # Denormalized counts of the job's non-archived applications, overall and per status. Kept in step by
+    # update_application_counts() in the same transaction as the application writes.
+    application_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    submitted_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    under_review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rejected_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    offer_sent_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    accepted_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     # Relationships
     poster = db.relationship('User', backref='job_postings')
-    required_skills = db.relationship('JobRequiredSkill', backref='job', cascade="all, delete-orphan")
-    required_experiences = db.relationship('JobRequiredExperience', backref='job', cascade="all, delete-orphan")
-    required_certificates = db.relationship('JobRequiredCertificate', backref='job', cascade="all, delete-orphan")
-    required_degrees = db.relationship('JobRequiredDegree', backref='job', cascade="all, delete-orphan")
+    required_skills = db.relationship('JobRequiredSkill', backref='job', cascade="all, delete-orphan",
+                                      order_by='JobRequiredSkill.id')
+    required_experiences = db.relationship('JobRequiredExperience', backref='job', cascade="all, delete-orphan",
+                                           order_by='JobRequiredExperience.id')
+    required_certificates = db.relationship('JobRequiredCertificate', backref='job', cascade="all, delete-orphan",
+                                            order_by='JobRequiredCertificate.id')
+    required_degrees = db.relationship('JobRequiredDegree', backref='job', cascade="all, delete-orphan",
+                                       order_by='JobRequiredDegree.id')
     applications = db.relationship('JobApplication', back_populates='job', lazy=True, cascade="all, delete-orphan")
 
     def to_dict(self):
-        print("Executing to_dict on class JobPosting.")
         return {
             'id': self.id,
             'title': self.title,
@@ -305,10 +445,73 @@ class JobPosting(db.Model):
             'required_degrees': [degree.to_dict() for degree in self.required_degrees]
         }
 
+    SUMMARY_FIELDS = ('id', 'title', 'description_preview', 'company_name', 'location', 'salary_min', 'salary_max',
+                      'employment_type', 'employment_arrangement', 'status', 'application_deadline', 'created_at',
+                      'required_skills', 'required_experiences', 'required_certificates', 'required_degrees')
+
+    def to_summary_dict(self, fields=None):
+        """
+        The list projection: to_dict() with a preview in place of the full description. Load with job_list_loader().
+        Requirement collections missing from `fields` are left out, so they need not be loaded.
+        """
+        head = self.description_head
+        summary = {
+            'id': self.id,
+            'title': self.title,
+            'description_preview': head[:DESCRIPTION_PREVIEW_LENGTH] + '...'
+            if len(head) > DESCRIPTION_PREVIEW_LENGTH else head,
+            'company_name': self.company_name,
+            'location': self.location,
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max,
+            'employment_type': self.employment_type,
+            'employment_arrangement': self.employment_arrangement,
+            'status': self.status,
+            'application_deadline': self.application_deadline.strftime(
+                '%Y-%m-%d') if self.application_deadline else None,
+            'created_at': self.created_at.strftime('%Y-%m-%d %H:%M'),
+        }
+        for name in JOB_REQUIREMENT_FIELDS:
+            if fields is None or name in fields:
+                summary[name] = [requirement.to_dict() for requirement in getattr(self, name)]
+        return summary
+
+    # Only the employer's own list shows these; browse must not, or every application would change its ETag
+    COUNT_FIELDS = ('application_count', 'status_counts')
+
+    def to_counts_dict(self):
+        return {
+            'application_count': self.application_count,
+            'status_counts': {status: getattr(self, column) for status, column in APPLICATION_STATUS_COUNTERS.items()},
+        }
+
+
+# Full-text search column for PostgreSQL (see search.py). It is generated by the database and
+# deliberately not mapped, so the model still works on SQLite. The same DDL ships as a migration.
+event.listen(JobPosting.__table__, 'after_create', DDL(
+    "ALTER TABLE job_posting ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(company_name, '')), 'B') || "
+    "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')) STORED"
+).execute_if(dialect='postgresql'))
+event.listen(JobPosting.__table__, 'after_create', DDL(
+    "CREATE INDEX ix_job_posting_search_vector ON job_posting USING GIN (search_vector)"
+).execute_if(dialect='postgresql'))
+
 
 # Class #8
 class JobApplication(db.Model):
     __tablename__ = 'job_application'
+    __table_args__ = (
+        # A seeker's applications, newest first
+        db.Index('ix_job_application_user_id_applied_at', 'user_id', 'applied_at', 'id'),
+        # One application per seeker and job; apply_to_job inserts with ON CONFLICT against it
+        db.Index('uq_job_application_user_id_job_id', 'user_id', 'job_id', unique=True),
+        # Applications received for a job; the partial index covers the default, non-archived view
+        db.Index('ix_job_application_job_id_applied_at', 'job_id', 'applied_at'),
+        db.Index('ix_job_application_job_id_active', 'job_id', 'applied_at',
+                 postgresql_where=db.text('NOT is_archived')),
+    )
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
@@ -316,13 +519,14 @@ class JobApplication(db.Model):
     status = db.Column(db.String(50), default='Submitted', nullable=False)  # e.g., Submitted, Under Review, etc.
     applied_at = db.Column(db.DateTime(timezone=True), server_default=func.now())
     is_archived = db.Column(db.Boolean, default=False, nullable=False, server_default='false')
+    # The Idempotency-Key the application was submitted with, so a retried request gets the original answer
+    idempotency_key = db.Column(db.String(IDEMPOTENCY_KEY_MAX_LENGTH), nullable=True)
 
     # Relationships to easily access applicant and job details
     applicant = db.relationship('User', back_populates='applications')
     job = db.relationship('JobPosting', back_populates='applications')
 
     def to_dict(self):
-        print("Executing to_dict on class JobApplication.")
         return {
             'id': self.id,
             'user_id': self.user_id,
@@ -337,14 +541,13 @@ class JobApplication(db.Model):
 # Class #9
 class JobRequiredSkill(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False, index=True)
     skill_title = db.Column(db.String(150), nullable=False)
     skill_type = db.Column(db.String(50), nullable=False)  # Technical, Behavioral, Conceptual
     title_match_type = db.Column(db.String(20), nullable=False, default='including')
     is_required = db.Column(db.Boolean, default=True)  # Required vs Preferred
 
     def to_dict(self):
-        print("Executing to_dict on class JobRequiredSkill.")
         return {
             'id': self.id,
             'skill_title': self.skill_title,
@@ -357,7 +560,7 @@ class JobRequiredSkill(db.Model):
 # Class #10
 class JobRequiredExperience(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False, index=True)
     years_required = db.Column(db.Integer, nullable=False)
     industry = db.Column(db.String(100))
     role_title = db.Column(db.String(150))
@@ -367,7 +570,6 @@ class JobRequiredExperience(db.Model):
     is_required = db.Column(db.Boolean, default=True)
 
     def to_dict(self):
-        print("Executing to_dict on class JobRequiredExperience.")
         return {
             'id': self.id,
             'years_required': self.years_required,
@@ -383,7 +585,7 @@ class JobRequiredExperience(db.Model):
 # Class #11
 class JobRequiredCertificate(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False, index=True)
     certificate_title = db.Column(db.String(150), nullable=False)
     title_match_type = db.Column(db.String(20), nullable=False, default='including')
     issuer = db.Column(db.String(150))
@@ -391,7 +593,6 @@ class JobRequiredCertificate(db.Model):
     is_required = db.Column(db.Boolean, default=True)
 
     def to_dict(self):
-        print("Executing to_dict on class JobRequiredCertificate.")
         return {
             'id': self.id,
             'certificate_title': self.certificate_title,
@@ -405,13 +606,12 @@ class JobRequiredCertificate(db.Model):
 # Class #12
 class JobRequiredDegree(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False, index=True)
     degree_level = db.Column(db.String(100), nullable=False)  # Bachelor's, Master's, etc.
     field_of_study = db.Column(db.String(150))
     is_required = db.Column(db.Boolean, default=True)
 
     def to_dict(self):
-        print("Executing to_dict on class JobRequiredDegree.")
         return {
             'id': self.id,
             'degree_level': self.degree_level,
@@ -439,6 +639,11 @@ class NotificationSettings(db.Model):
 # Class #14
 class Notification(db.Model):
     __tablename__ = 'notifications'
+    __table_args__ = (
+        db.Index('ix_notifications_user_id_created_at', 'user_id', 'created_at', 'id'),
+        db.Index('ix_notifications_unread', 'user_id', postgresql_where=db.text('NOT is_read')),
+        db.Index('ix_notifications_undigested', 'user_id', postgresql_where=db.text('digested_at IS NULL')),
+    )
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     message = db.Column(db.String(255), nullable=False)
@@ -446,6 +651,8 @@ class Notification(db.Model):
     link = db.Column(db.String(255), nullable=True)
     created_at = db.Column(db.DateTime(timezone=True), server_default=func.now())
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    # Set once the email digest pipeline has handled the notification (emailed, or skipped for in-app only users)
+    digested_at = db.Column(db.DateTime, nullable=True)
 
     def to_dict(self):
         # print ("Executing to_dict on class Notification.")
@@ -462,13 +669,15 @@ class Notification(db.Model):
 # Class #15
 class Test(db.Model):
     __tablename__ = 'tests'
+    __table_args__ = (db.Index('ix_tests_user_id_created_at', 'user_id', 'created_at', 'id'),)
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     test_type = db.Column(db.String(50), nullable=False)  # 'Questionnaire' or 'Exam'
     title = db.Column(db.String(200), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
-    questions = db.relationship('Question', backref='test', lazy=True, cascade="all, delete-orphan")
+    questions = db.relationship('Question', backref='test', lazy=True, cascade="all, delete-orphan",
+                                order_by=lambda: (Question.position, Question.id))
     user = db.relationship('User', backref='tests')
 
     def to_dict(self):
@@ -478,7 +687,7 @@ class Test(db.Model):
             'test_type': self.test_type,
             'title': self.title,
             'created_at': self.created_at.strftime('%B %d, %Y'),
-            'question_count': len(self.questions)
+            'question_count': self.question_count
         }
 
     def to_detailed_dict(self):
@@ -491,13 +700,15 @@ class Test(db.Model):
 class Question(db.Model):
     __tablename__ = 'questions'
     id = db.Column(db.Integer, primary_key=True)
-    test_id = db.Column(db.Integer, db.ForeignKey('tests.id'), nullable=False)
+    test_id = db.Column(db.Integer, db.ForeignKey('tests.id'), nullable=False, index=True)
     question_type = db.Column(db.String(50), nullable=False)  # 'multiple-choice' or 'descriptive'
     question_text = db.Column(db.Text, nullable=False)
     char_limit = db.Column(db.Integer, nullable=True) # For descriptive questions
+    position = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Order within the test
 
     # For multiple-choice questions
-    answers = db.relationship('Answer', backref='question', lazy=True, cascade="all, delete-orphan")
+    answers = db.relationship('Answer', backref='question', lazy=True, cascade="all, delete-orphan",
+                              order_by=lambda: (Answer.position, Answer.id))
 
     def to_dict(self):
         return {
@@ -514,69 +725,649 @@ class Question(db.Model):
 class Answer(db.Model):
     __tablename__ = 'answers'
     id = db.Column(db.Integer, primary_key=True)
-    question_id = db.Column(db.Integer, db.ForeignKey('questions.id'), nullable=False)
+    question_id = db.Column(db.Integer, db.ForeignKey('questions.id'), nullable=False, index=True)
     answer_text = db.Column(db.Text, nullable=False)
+    position = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # Order within the question
 
     def to_dict(self):
         return {'id': self.id, 'answer_text': self.answer_text}
 
 
+# Loaded with every Test as a correlated subquery, so listing tests does not load their questions.
+Test.question_count = column_property(
+    select(func.count(Question.id)).where(Question.test_id == Test.id).correlate_except(Question).scalar_subquery())
+
+
+# Class #18
+class JobEligibility(db.Model):
+    """Materialized (user, job) pairs for which the user meets every required item of the job."""
+    __tablename__ = 'job_eligibility'
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    job_id = db.Column(db.Integer, db.ForeignKey('job_posting.id', ondelete='CASCADE'), primary_key=True, index=True)
+    computed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# Class #19
+class EmailOutbox(db.Model):
+    """Outbound emails waiting to be sent by the background OutboxSender."""
+    __tablename__ = 'email_outbox'
+    __table_args__ = (db.Index('ix_email_outbox_status_next_attempt_at', 'status', 'next_attempt_at'),)
+    id = db.Column(db.Integer, primary_key=True)
+    sender = db.Column(db.String(100))
+    recipient = db.Column(db.String(100), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, sent, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.String(500))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+
+# Class #20
+class VersionCounter(db.Model):
+    """Named counters for data that is not owned by a single user, e.g. the job catalog."""
+    __tablename__ = 'version_counter'
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+
+outbox = OutboxSender(app, db, mail, EmailOutbox)
+
+
+def send_notification_digests():
+    """
+    Emails one digest per user covering their unread, not yet digested notifications.
+    Users without a NotificationSettings row get the model default (email_and_in_app).
+    Every processed notification is stamped with digested_at in the same transaction that
+    queues the digest, so nothing is emailed twice. Returns the number of digests queued.
+    """
+    digests = 0
+    batch_size = app.config['NOTIFICATION_DIGEST_BATCH_SIZE']
+    while True:
+        rows = db.session.query(Notification, User.email, User.first_name, NotificationSettings.delivery_method)\
+            .join(User, Notification.user_id == User.id)\
+            .outerjoin(NotificationSettings, NotificationSettings.user_id == Notification.user_id)\
+            .filter(Notification.digested_at.is_(None))\
+            .order_by(Notification.user_id, Notification.created_at, Notification.id)\
+            .limit(batch_size)\
+            .with_for_update(of=Notification, skip_locked=True).all()
+        if not rows:
+            db.session.rollback()
+            break
+
+        now = datetime.utcnow()
+        pending_by_user = {}
+        for notification, email, first_name, delivery_method in rows:
+            notification.digested_at = now
+            if notification.is_read or (delivery_method or 'email_and_in_app') != 'email_and_in_app':
+                continue
+            pending_by_user.setdefault((notification.user_id, email, first_name), []).append(notification)
+
+        for (user_id, email, first_name), notifications in pending_by_user.items():
+            subject, body = compose_digest(first_name, notifications)
+            outbox.enqueue(email, subject, body)
+        db.session.commit()
+        digests += len(pending_by_user)
+        if len(rows) < batch_size:
+            break
+
+    if digests:
+        outbox.wake()
+    return digests
+
+
+digest_scheduler = DigestScheduler(app, send_notification_digests)
+_background_workers_started = False
+
+
+@app.before_request
+def start_background_workers():
+    """
+    Starts the process's email sender and digest scheduler with the first request it serves. Their first
+    passes send what is already due, such as outbox messages left pending or waiting for a retry, and
+    digests of notifications from before the app was last stopped.
+    """
+    global _background_workers_started
+    if _background_workers_started or not app.config['BACKGROUND_WORKERS']:
+        return
+    _background_workers_started = True
+    outbox.wake()
+    digest_scheduler.start()
+
+
+# --- Loader strategies for JobPosting queries ---
+# JobPosting.to_dict() and the eligibility matchers read all four requirement tables,
+# so they are selectin-loaded: one extra query per table for the whole result set
+# instead of four lazy loads per job. Use as query.options(*JOB_LIST_LOADER).
+_JOB_REQUIREMENTS_SELECTIN = tuple(selectinload(getattr(JobPosting, name)) for name in JOB_REQUIREMENT_FIELDS)
+# Lists serialize with to_summary_dict(): the description preview instead of the full text.
+_JOB_SUMMARY_COLUMNS = (defer(JobPosting.description), undefer(JobPosting.description_head))
+JOB_LIST_LOADER = _JOB_SUMMARY_COLUMNS + _JOB_REQUIREMENTS_SELECTIN
+JOB_DETAIL_LOADER = _JOB_REQUIREMENTS_SELECTIN
+# Only what compile_job() reads: the version column and the requirement rows.
+JOB_ELIGIBILITY_LOADER = (load_only(JobPosting.id, JobPosting.updated_at),) + _JOB_REQUIREMENTS_SELECTIN
+EXPERIENCE_SUMMARY_LOADER = (defer(Experience.responsibilities), defer(Experience.achievements))
+TEST_DETAIL_LOADER = (selectinload(Test.questions).selectinload(Question.answers),)
+# Only the columns build_user_profile() reads
+_PROFILE_COLUMNS = {
+    Skill: (Skill.user_id, Skill.title),
+    Certificate: (Certificate.user_id, Certificate.title, Certificate.issuer),
+    Experience: (Experience.user_id, Experience.position_title, Experience.country, Experience.start_date,
+                 Experience.end_date),
+    Degree: (Degree.user_id, Degree.degree),
+}
+
+
+def job_list_loader(fields=None):
+    """JOB_LIST_LOADER without the requirement collections a sparse fieldset leaves out."""
+    if fields is None:
+        return JOB_LIST_LOADER
+    return _JOB_SUMMARY_COLUMNS + tuple(selectinload(getattr(JobPosting, name))
+                                        for name in JOB_REQUIREMENT_FIELDS if name in fields)
+
+
+# --- Requirements writer for create_job/update_job ---
+# How an item of each submitted requirement list maps onto its table's columns
+def _skill_values(skill):
+    return {'skill_title': skill['title'], 'skill_type': skill['type'],
+            'title_match_type': skill.get('title_match_type', 'including'),
+            'is_required': skill.get('is_required', True)}
+
+
+def _experience_values(exp):
+    return {'years_required': exp['years_required'], 'industry': exp.get('industry'),
+            'role_title': exp.get('role_title'), 'role_title_match_type': exp.get('role_title_match_type', 'including'),
+            'country': exp.get('country'), 'country_match_type': exp.get('country_match_type', 'including'),
+            'is_required': exp.get('is_required', True)}
+
+
+def _certificate_values(cert):
+    return {'certificate_title': cert['title'], 'title_match_type': cert.get('title_match_type', 'including'),
+            'issuer': cert.get('issuer'), 'issuer_match_type': cert.get('issuer_match_type', 'including'),
+            'is_required': cert.get('is_required', True)}
+
+
+def _degree_values(degree):
+    return {'degree_level': degree['level'], 'field_of_study': degree.get('field_of_study'),
+            'is_required': degree.get('is_required', True)}
+
+
+JOB_REQUIREMENT_WRITERS = {
+    'required_skills': (JobRequiredSkill, _skill_values),
+    'required_experiences': (JobRequiredExperience, _experience_values),
+    'required_certificates': (JobRequiredCertificate, _certificate_values),
+    'required_degrees': (JobRequiredDegree, _degree_values),
+}
+
+
+def write_job_requirements(job, data, existing=True):
+    """
+    Makes the job's requirement tables match the submitted lists, inside the caller's transaction. The stored rows
+    (in id order) are reused for the submitted items in order: only rows whose values differ are updated, any left
+    over are deleted and items left over are added with one multi-row insert per table, so ids keep following the
+    submitted order. A missing list clears its table. existing=False skips reading the stored rows, for a job that
+    was just created. The job's requirement collections are set to the rows as written, so reading them needs no
+    query. Returns True if any row changed.
+    """
+    changed = False
+    for name, (model, to_values) in JOB_REQUIREMENT_WRITERS.items():
+        submitted = [to_values(item) for item in data.get(name, [])]
+        stored = db.session.scalars(select(model).where(model.job_id == job.id).order_by(model.id)).all() \
+            if existing else []
+
+        overwritten = [(row, values) for row, values in zip(stored, submitted)
+                       if any(getattr(row, column) != value for column, value in values.items())]
+        if overwritten:
+            db.session.execute(update(model), [dict(values, id=row.id) for row, values in overwritten])
+            # Bulk updates by primary key leave loaded objects alone
+            for row, values in overwritten:
+                for column, value in values.items():
+                    set_committed_value(row, column, value)
+        removed = {row.id for row in stored[len(submitted):]}
+        if removed:
+            db.session.execute(delete(model).where(model.id.in_(removed)),
+                               execution_options={'synchronize_session': False})
+        inserted = []
+        if len(submitted) > len(stored):
+            # One multi-row insert assigns ids in the order of its rows, while RETURNING may list them in any order
+            inserted = sorted(db.session.scalars(insert(model).returning(model), [
+                dict(values, job_id=job.id) for values in submitted[len(stored):]
+            ]).all(), key=lambda row: row.id)
+        changed = changed or bool(overwritten or removed or inserted)
+        set_committed_value(job, name, stored[:len(submitted)] + inserted)
+    return changed
+
+
+# --- Questions writer for create_test/update_test ---
+def _question_values(q_data, position):
+    return {'question_type': q_data['question_type'], 'question_text': q_data['question_text'],
+            'char_limit': q_data.get('char_limit'), 'position': position}
+
+
+def _submitted_answers(q_data):
+    """A question's answers as (id, text) pairs. Each is a plain string (a new answer) or {id, answer_text}."""
+    if q_data['question_type'] != 'multiple-choice':
+        return []
+    answers = []
+    for answer in q_data.get('answers', []):
+        answer_id, text = (answer.get('id'), answer.get('answer_text')) if isinstance(answer, dict) else (None, answer)
+        if text:  # Ensure the answer string is not empty
+            answers.append((answer_id, text))
+    return answers
+
+
+def write_test_questions(test, questions, existing=True):
+    """
+    Makes the test's questions and answers match the submitted ones, inside the caller's transaction.
+    Submitted questions and answers that carry the id of one of the test's rows keep that row, which is
+    only updated if it changed; rows left out are deleted. All new questions are added with one multi-row
+    insert, and all new answers with another. existing=False skips reading the stored rows, for a new test.
+    """
+    stored_questions, stored_answers = {}, {}
+    if existing:
+        for row in db.session.execute(
+                select(Question.id, Question.question_type, Question.question_text, Question.char_limit,
+                       Question.position).where(Question.test_id == test.id)):
+            stored_questions[row.id] = row._asdict()
+        for row in db.session.execute(
+                select(Answer.id, Answer.question_id, Answer.answer_text, Answer.position)
+                .join(Question, Answer.question_id == Question.id).where(Question.test_id == test.id)):
+            stored_answers.setdefault(row.question_id, {})[row.id] = row._asdict()
+
+    question_updates, new_questions, answer_updates, new_answers = [], [], [], []
+    # Answers of new questions wait for the ids the question insert returns
+    new_question_answers = []
+    for position, q_data in enumerate(questions):
+        values = _question_values(q_data, position)
+        stored = stored_questions.pop(q_data.get('id'), None)
+        if stored is None:
+            new_questions.append(dict(values, test_id=test.id))
+            new_question_answers.append(_submitted_answers(q_data))
+            continue
+        if any(stored[name] != value for name, value in values.items()):
+            question_updates.append(dict(values, id=stored['id']))
+
+        answers = stored_answers.pop(stored['id'], {})
+        for answer_position, (answer_id, text) in enumerate(_submitted_answers(q_data)):
+            stored_answer = answers.pop(answer_id, None)
+            if stored_answer is None:
+                new_answers.append({'question_id': stored['id'], 'answer_text': text, 'position': answer_position})
+            elif (stored_answer['answer_text'], stored_answer['position']) != (text, answer_position):
+                answer_updates.append({'id': answer_id, 'answer_text': text, 'position': answer_position})
+        # What is left of this question's answers was removed
+        stored_answers.setdefault(stored['id'], {}).update(answers)
+
+    # Questions left in stored_questions were removed, and their answers with them
+    stale_answer_ids = [answer_id for answers in stored_answers.values() for answer_id in answers]
+    if stale_answer_ids:
+        db.session.execute(delete(Answer).where(Answer.id.in_(stale_answer_ids)),
+                           execution_options={'synchronize_session': False})
+    if stored_questions:
+        db.session.execute(delete(Question).where(Question.id.in_(list(stored_questions))),
+                           execution_options={'synchronize_session': False})
+    if question_updates:
+        db.session.execute(update(Question), question_updates)
+    if answer_updates:
+        db.session.execute(update(Answer), answer_updates)
+    if new_questions:
+        # Positions are unique within the test, so they tell which returned id belongs to which question
+        # (asking for the rows in parameter order instead would make some databases insert them one at a time)
+        answers_by_position = {values['position']: answers
+                               for values, answers in zip(new_questions, new_question_answers)}
+        for question_id, position in db.session.execute(insert(Question).returning(Question.id, Question.position),
+                                                        new_questions):
+            new_answers.extend({'question_id': question_id, 'answer_text': text, 'position': answer_position}
+                               for answer_position, (_, text) in enumerate(answers_by_position[position]))
+    if new_answers:
+        db.session.execute(insert(Answer), new_answers)
+    db.session.expire(test, ['questions', 'question_count'])
+
+
+# --- Helpers for job full-text search ---
+def _uses_postgres_search():
+    return db.engine.dialect.name == 'postgresql'
+
+
+def index_job_for_search(job):
+    """Keeps the in-process search index in sync with a job write (PostgreSQL maintains search_vector itself)."""
+    if not _uses_postgres_search() and job_search_index.is_built:
+        job_search_index.add(job.id, job.title, job.company_name, job.description)
+
+
+def apply_job_search(query, term):
+    """
+    Restricts a JobPosting query to jobs matching the search term and returns (query, rank),
+    where rank is a SQL expression to order by (higher is better). Without PostgreSQL, only the best
+    SEARCH_FALLBACK_MAX_RESULTS matches are kept. A term without words (e.g. "!!!") keeps the old substring match on title and description, with no rank.
+    """
+    if not to_prefix_tsquery(term):
+        return query.filter(or_(JobPosting.title.ilike(f'%{term}%'), JobPosting.description.ilike(f'%{term}%'))), None
+    if _uses_postgres_search():
+        tsquery = func.to_tsquery('english', to_prefix_tsquery(term))
+        search_vector = literal_column('job_posting.search_vector')
+        rank = cast(func.ts_rank(search_vector, tsquery), Float)
+        return query.filter(search_vector.op('@@')(tsquery)), rank
+
+    if not job_search_index.is_built:
+        for job in db.session.query(JobPosting.id, JobPosting.title, JobPosting.company_name, JobPosting.description):
+            job_search_index.add(job.id, job.title, job.company_name, job.description)
+        job_search_index.is_built = True
+    scores = job_search_index.search(term, limit=app.config['SEARCH_FALLBACK_MAX_RESULTS'])
+    if not scores:
+        return query.filter(false()), literal_column('0.0')
+    return query.filter(JobPosting.id.in_(scores)), case(scores, value=JobPosting.id, else_=0.0)
+
+
+# --- Helpers for maintaining the job_eligibility table ---
+# Users (and stale jobs) loaded per query, which keeps IN lists well below SQLite's bound-parameter limit.
+ELIGIBILITY_BATCH_SIZE = 500
+
+# VersionCounter holding the calendar year the stored eligibility was last computed for (see build_user_profile).
+ELIGIBILITY_YEAR = 'eligibility_year'
+
+
+def load_user_profiles(user_ids):
+    """Builds eligibility profiles for a batch of users with one query per profile table."""
+    rows = {user_id: ([], [], [], []) for user_id in user_ids}
+    if not rows:
+        return {}
+    for index, model in enumerate((Skill, Certificate, Experience, Degree)):
+        for item in model.query.options(load_only(*_PROFILE_COLUMNS[model])).filter(model.user_id.in_(rows.keys())):
+            rows[item.user_id][index].append(item)
+    return {user_id: build_user_profile(*items) for user_id, items in rows.items()}
+
+
+def active_job_matchers(*criteria):
+    """
+    Returns (posted_by, JobMatcher) for every active job matching criteria. Only the ids and versions of the jobs
+    are queried; requirements are loaded just for the jobs whose cached matcher is missing or out of date.
+    """
+    jobs = db.session.query(JobPosting.id, JobPosting.updated_at, JobPosting.posted_by)\
+        .filter(JobPosting.status == 'active', *criteria).all()
+    matchers = {job.id: job_matchers.lookup(job.id, job.updated_at) for job in jobs}
+    stale_ids = [job_id for job_id, matcher in matchers.items() if matcher is None]
+    for start in range(0, len(stale_ids), ELIGIBILITY_BATCH_SIZE):
+        batch = stale_ids[start:start + ELIGIBILITY_BATCH_SIZE]
+        for job in JobPosting.query.options(*JOB_ELIGIBILITY_LOADER).filter(JobPosting.id.in_(batch)):
+            matchers[job.id] = job_matchers.put(job)
+    return [(job.posted_by, matchers[job.id]) for job in jobs if matchers[job.id] is not None]
+
+
+def _write_eligibility(pairs):
+    # Two refreshes of the same pair can still both insert it (e.g. a rebuild and a profile write); the second skips it
+    if pairs:
+        now = datetime.utcnow()
+        db.session.execute(insert_ignoring_conflicts(JobEligibility, ['user_id', 'job_id']), [
+            {'user_id': user_id, 'job_id': job_id, 'computed_at': now} for user_id, job_id in pairs
+        ])
+
+
+def _refresh_users(user_ids, matchers, batch_size=ELIGIBILITY_BATCH_SIZE):
+    """Replaces the stored eligibility of user_ids against matchers ((posted_by, JobMatcher) pairs), batch by batch."""
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start:start + batch_size]
+        JobEligibility.query.filter(JobEligibility.user_id.in_(batch)).delete(synchronize_session=False)
+        pairs = []
+        for user_id, profile in load_user_profiles(batch).items():
+            eligibility = evaluate_catalog(profile, [
+                matcher for posted_by, matcher in matchers if posted_by != user_id
+            ])
+            pairs.extend((user_id, job_id) for job_id, is_eligible in eligibility.items() if is_eligible)
+        _write_eligibility(pairs)
+
+
+# Concurrency: every job write calls bump_catalog_version() before refresh_job_eligibility(), which holds an exclusive
+# lock on the job catalog's version row until commit, and every other refresh starts with share_lock_job_catalog().
+# A user refresh and a job refresh therefore never overlap: whichever starts second waits for the first to commit and
+# then reads its writes (each statement gets a fresh snapshot under READ COMMITTED), so no (user, job) pair is left
+# computed from an old profile or an old job. User refreshes only share the lock, so profile writes still run
+# concurrently with each other; refreshes for one user take turns on the user row that bump_profile_version() updates.
+# SQLite ignores the row locks and gets the same guarantee from its single database-wide writer.
+def refresh_job_eligibility(job):
+    """
+    Recomputes the eligibility of every other user for a single job, in batches of users. Runs inside the caller's
+    transaction, after bump_catalog_version().
+    """
+    matcher = job_matchers.put(job)
+    JobEligibility.query.filter_by(job_id=job.id).delete(synchronize_session=False)
+    if job.status != 'active':
+        return
+    user_ids = [row.id for row in db.session.query(User.id).filter(User.id != job.posted_by).order_by(User.id)]
+    for start in range(0, len(user_ids), ELIGIBILITY_BATCH_SIZE):
+        profiles = load_user_profiles(user_ids[start:start + ELIGIBILITY_BATCH_SIZE])
+        _write_eligibility([
+            (user_id, job.id) for user_id, profile in profiles.items()
+            if evaluate_catalog(profile, [matcher])[job.id]
+        ])
+
+
+def refresh_user_eligibility(user_id):
+    """
+    Recomputes a user's eligibility against every active job. Runs inside the caller's transaction, after
+    bump_profile_version(), whose row lock on the user makes concurrent refreshes for one user take turns.
+    """
+    share_lock_job_catalog()
+    JobEligibility.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+    matchers = [matcher for posted_by, matcher in active_job_matchers(JobPosting.posted_by != user_id)]
+    profile = load_user_profiles([user_id])[user_id]
+    eligibility = evaluate_catalog(profile, matchers)
+    _write_eligibility([(user_id, job_id) for job_id, is_eligible in eligibility.items() if is_eligible])
+
+
+def rebuild_eligibility_table(batch_size=ELIGIBILITY_BATCH_SIZE):
+    """
+    Recomputes the whole job_eligibility table, loading every active job once and users in batches.
+    Runs inside the caller's transaction. Returns the number of users processed.
+    """
+    share_lock_job_catalog()
+    JobEligibility.query.delete(synchronize_session=False)
+    user_ids = [row.id for row in db.session.query(User.id).order_by(User.id)]
+    _refresh_users(user_ids, active_job_matchers(), batch_size)
+    set_eligibility_year(datetime.now().year)
+    return len(user_ids)
+
+
+def refresh_eligibility_year():
+    """
+    Recomputes the users with an ongoing experience (whose years of experience grow with the calendar year) if the
+    stored eligibility was computed in an earlier year. Runs inside the caller's transaction and is a no-op when
+    nothing changed, so it is safe to run daily. Returns the number of users refreshed.
+    """
+    year = datetime.now().year
+    db.session.execute(insert_ignoring_conflicts(VersionCounter, ['name']), [{'name': ELIGIBILITY_YEAR, 'value': 0}])
+    # Locking the counter makes overlapping runs take turns; the second one then finds the year already stored
+    counter = VersionCounter.query.filter_by(name=ELIGIBILITY_YEAR).with_for_update().one()
+    if counter.value >= year:
+        return 0
+    share_lock_job_catalog()
+    user_ids = [row.user_id for row in db.session.query(Experience.user_id).filter(Experience.end_date.is_(None))
+                .distinct().order_by(Experience.user_id)]
+    _refresh_users(user_ids, active_job_matchers())
+    counter.value = year
+    return len(user_ids)
+
+
+def set_eligibility_year(year):
+    """Records the calendar year the stored eligibility was computed for. Runs inside the caller's transaction."""
+    db.session.execute(insert_ignoring_conflicts(VersionCounter, ['name']), [{'name': ELIGIBILITY_YEAR, 'value': 0}])
+    db.session.execute(update(VersionCounter).where(VersionCounter.name == ELIGIBILITY_YEAR).values(value=year))
+
+
+# --- Committing writes whose objects are serialized afterwards ---
+def commit_keeping_state():
+    """
+    Commits without expiring the session's objects, so a write endpoint can serialize what it just wrote
+    without reloading each row (and collection) with a fresh SELECT. Only for objects whose values all come
+    from Python: server defaults and columns set to SQL expressions are not read back.
+    """
+    session = db.session()
+    session.expire_on_commit = False
+    try:
+        session.commit()
+    finally:
+        session.expire_on_commit = True
+
+
+# --- Version counters behind the ETags of the profile endpoints and browse_jobs (see conditional.py) ---
+JOB_CATALOG_VERSION = 'job_catalog'
+
+
+def bump_profile_version(user_id):
+    """Runs inside the caller's transaction, so the new version is visible together with the write."""
+    db.session.execute(update(User).where(User.id == user_id).values(profile_version=User.profile_version + 1))
+
+
+def share_lock_job_catalog():
+    """
+    Takes a shared lock on the job catalog's version row until the transaction ends, which waits for any job write
+    in progress (see bump_catalog_version) and holds off new ones. Runs inside the caller's transaction.
+    """
+    query = select(VersionCounter.name).where(VersionCounter.name == JOB_CATALOG_VERSION).with_for_update(read=True)
+    if db.session.execute(query).first() is None:
+        # No job was ever written: create the row, so that the first job write has something to wait on
+        db.session.execute(insert_ignoring_conflicts(VersionCounter, ['name']),
+                           [{'name': JOB_CATALOG_VERSION, 'value': 0}])
+        db.session.execute(query)
+
+
+def bump_catalog_version():
+    """
+    Called on every job posting write, before the eligibility refresh (see refresh_job_eligibility), since the row
+    lock it takes is what keeps job and user refreshes apart. Runs inside the caller's transaction.
+    """
+    # A single upsert, so two first writes cannot both find the row missing and both try to create it
+    db.session.execute(dialect_insert(VersionCounter).values(name=JOB_CATALOG_VERSION, value=1).on_conflict_do_update(
+        index_elements=['name'], set_={'value': VersionCounter.value + 1}))
+
+
+# --- Denormalized application counters on JobPosting (see APPLICATION_STATUS_COUNTERS) ---
+def update_application_counts(job_id, added_status=None, removed_status=None):
+    """
+    Moves one application into added_status and/or out of removed_status, inside the caller's transaction.
+    Pass both for a status change, only added_status for a new (or un-archived) application and only
+    removed_status for an archived one. The increments run in SQL, so concurrent writers cannot lose updates.
+    """
+    values = {}
+    if added_status in APPLICATION_STATUS_COUNTERS:
+        column = APPLICATION_STATUS_COUNTERS[added_status]
+        values[column] = getattr(JobPosting, column) + 1
+    if removed_status in APPLICATION_STATUS_COUNTERS:
+        column = APPLICATION_STATUS_COUNTERS[removed_status]
+        values[column] = getattr(JobPosting, column) - 1
+    if added_status is not None and removed_status is None:
+        values['application_count'] = JobPosting.application_count + 1
+    elif removed_status is not None and added_status is None:
+        values['application_count'] = JobPosting.application_count - 1
+    if values:
+        # Counters are not an edit of the job: keep updated_at, which versions its cached eligibility matcher
+        db.session.execute(update(JobPosting).where(JobPosting.id == job_id)
+                           .values(updated_at=JobPosting.updated_at, **values))
+
+
+def recount_application_counts():
+    """Recomputes every job's counters from job_application. Runs inside the caller's transaction."""
+    def count(*criteria):
+        return select(func.count(JobApplication.id)).where(
+            JobApplication.job_id == JobPosting.id, JobApplication.is_archived == false(), *criteria
+        ).scalar_subquery()
+
+    values = {column: count(JobApplication.status == status) for status, column in APPLICATION_STATUS_COUNTERS.items()}
+    db.session.execute(update(JobPosting).values(application_count=count(), updated_at=JobPosting.updated_at, **values)
+                       .execution_options(synchronize_session=False))
+
+
+def profile_versions():
+    return current_user.id, db.session.query(User.profile_version).filter_by(id=current_user.id).scalar()
+
+
+def browse_versions():
+    """Browse results depend on the catalog and, through eligibility and applications, on the user."""
+    catalog_version = select(VersionCounter.value).where(VersionCounter.name == JOB_CATALOG_VERSION).scalar_subquery()
+    row = db.session.query(User.profile_version, catalog_version).filter(User.id == current_user.id).one()
+    return current_user.id, row[0], row[1]
+
+
+def _load_user_identity(user_id):
+    row = db.session.query(User.id, User.email, User.confirmed).filter_by(id=user_id).first()
+    return UserIdentity(row.id, row.email, row.confirmed) if row else None
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    """current_user is a cached UserIdentity (id, email, confirmed). Load the User row where more is needed."""
+    return user_cache.get(int(user_id), _load_user_identity)
 
 @app.route('/')
 def index():
-    print("Executing index() on app.")
     return render_template('index.html')
 
+def _hashing_busy_response(template):
+    flash('We are handling a lot of sign-ins right now. Please try again in a moment.', 'danger')
+    return render_template(template), 503, {'Retry-After': '1'}
+
+
 @app.route('/signup', methods=['GET', 'POST'])
 def signup():
-    print("Executing signup() on app.")
     if request.method == 'POST':
         email = request.form.get('email')
         password = request.form.get('password')
-        user = User.query.filter_by(email=email).first()
+        user = User.query.options(load_only(User.id)).filter_by(email=email).first()
         if user:
             flash('Email address already exists')
             return redirect(url_for('signup'))
-        hashed_password = generate_password_hash(password, method='pbkdf2:sha256')
+        try:
+            hashed_password = password_hasher.hash(password)
+        except HashingBusy:
+            return _hashing_busy_response('signup.html')
         new_user = User(email=email, password=hashed_password, confirmed=False)
         try:
             db.session.add(new_user)
             db.session.flush()
+            refresh_user_eligibility(new_user.id)
             token = s.dumps(email, salt='email-confirm')
-            msg = Message('Confirm Email', sender=app.config['MAIL_USERNAME'], recipients=[email])
             link = url_for('confirm_email', token=token, _external=True)
-            msg.body = f'Your email confirmation link is {link}'
-            mail.send(msg)
+            outbox.enqueue(email, 'Confirm Email', f'Your email confirmation link is {link}',
+                           sender=app.config['MAIL_USERNAME'])
             db.session.commit()
+            outbox.wake()
             flash('A confirmation email has been sent. Please check your inbox.', 'success')
             return redirect(url_for('login'))
-        except Exception as e:
+        except Exception:
             db.session.rollback()
-            print(f"Error sending confirmation email: {e}")
+            app.logger.exception("Error queueing confirmation email")
             flash('There was a problem sending the confirmation email. Please try again.', 'danger')
             return redirect(url_for('signup'))
     return render_template('signup.html')
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
-    print("Executing login() on app.")
     if request.method == 'POST':
         email = request.form.get('email')
         password = request.form.get('password')
-        user = User.query.filter_by(email=email).first()
-        if not user or not check_password_hash(user.password, password):
+        # Only what logging in needs, not the profile text
+        user = User.query.options(load_only(User.id, User.email, User.password, User.confirmed))\
+            .filter_by(email=email).first()
+        try:
+            password_ok = user is not None and password_hasher.verify(user.password, password)
+        except HashingBusy:
+            return _hashing_busy_response('login.html')
+        if not password_ok:
             flash('Please check your login details and try again.')
             return redirect(url_for('login'))
+        if password_hasher.needs_rehash(user.password):
+            try:
+                user.password = password_hasher.hash(password)
+                db.session.commit()
+            except HashingBusy:
+                pass  # Upgraded at a later login instead
         login_user(user)
         return redirect(url_for('dashboard'))
     return render_template('login.html')
 
 @app.route('/confirm_email/<token>')
 def confirm_email(token):
-    print("Executing confirm_email(token) on app.")
     try:
         email = s.loads(token, salt='email-confirm', max_age=3600)
     except SignatureExpired:
@@ -587,25 +1378,61 @@ def confirm_email(token):
     else:
         user.confirmed = True
         db.session.commit()
+        user_cache.invalidate(user.id)
         flash('Email confirmed successfully! You can now login.', 'success')
     return redirect(url_for('login'))
 
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    print("Executing dashboard() on app.")
     return render_template('dashboard.html')
 
+@app.route('/api/bootstrap', methods=['GET'])
+@query_budget(20)
+@login_required
+def get_bootstrap():
+    """
+    Everything the dashboard needs for its first paint, in one response.
+    Each section is serialized by the same helper as its own endpoint, and paged lists hold their first page
+    ({'items': [...], 'next_cursor': ...}). The individual endpoints are only called for later refreshes.
+    """
+    user_id = current_user.id
+    experiences = user_experiences(user_id)
+    certificates = user_certificates(user_id)
+    degrees = user_degrees(user_id)
+    # The profile rows are already loaded, so skill sources only cost the SkillSource query.
+    skills = Skill.query.filter_by(user_id=user_id).all()
+    sources = resolve_skill_sources(skills, {'experience': experiences, 'certificate': certificates,
+                                             'degree': degrees})
+
+    def first_page(list_items):
+        page = KeysetPage(limit=DEFAULT_PAGE_SIZE)
+        items = list_items(user_id, page)
+        return {'items': items, 'next_cursor': page.next_cursor}
+
+    return jsonify({
+        'account': db.session.get(User, user_id).to_dict(),
+        'skills': [s.to_dict(sources[s.id]) for s in skills],
+        'experiences': [exp.to_dict() for exp in experiences],
+        'certificates': [cert.to_dict() for cert in certificates],
+        'degrees': [degree.to_dict() for degree in degrees],
+        'profile_items': build_profile_items(experiences, certificates, degrees),
+        'notification_settings': get_or_create_notification_settings(user_id).to_dict(),
+        'unread_count': {'count': count_unread_notifications(user_id)},
+        'notifications': first_page(list_notifications),
+        'jobs': first_page(list_posted_jobs),
+        'tests': first_page(list_tests),
+        'my_applications': first_page(list_user_applications),
+    })
+
 @app.route('/logout')
 @login_required
 def logout():
-    print("Executing logout() on app.")
     logout_user()
     return redirect(url_for('index'))
 
 # --- Helper for parsing dates ---
 def parse_date(date_str):
-    print("Executing parse_date(date_str) on app.")
     if not date_str:
         return None
     try:
@@ -627,12 +1454,13 @@ def parse_date(date_str):
 # Endpoint to get user's profile items for skill form
 @app.route('/api/user/profile-items', methods=['GET'])
 @login_required
+@conditional_get(profile_versions)
 def get_user_profile_items():
-    print("Executing get_user_profile_items() on app.")
-    experiences = Experience.query.filter_by(user_id=current_user.id).all()
-    certificates = Certificate.query.filter_by(user_id=current_user.id).all()
-    degrees = Degree.query.filter_by(user_id=current_user.id).all()
+    return jsonify(build_profile_items(user_experiences(current_user.id, summary=True),
+                                       user_certificates(current_user.id), user_degrees(current_user.id)))
 
+def build_profile_items(experiences, certificates, degrees):
+    """The "acquired at" choices of the skill form, built from already loaded profile rows."""
     items = []
 
     for exp in experiences:
@@ -659,12 +1487,11 @@ def get_user_profile_items():
             'display': f"{degree.degree.value} in {degree.field_of_study} (Degree)"
         })
 
-    return jsonify(items)
+    return items
 
 @app.route('/api/skills', methods=['POST'])
 @login_required
 def add_skill():
-    print("Executing add_skill() on app.")
     data = request.get_json()
 
     if data is None:
@@ -695,7 +1522,9 @@ def add_skill():
             )
             db.session.add(skill_source)
 
-        db.session.commit()
+        bump_profile_version(current_user.id)
+        refresh_user_eligibility(current_user.id)
+        commit_keeping_state()
         return jsonify(new_skill.to_dict()), 201
 
     except Exception as e:
@@ -704,15 +1533,15 @@ def add_skill():
 
 @app.route('/api/skills', methods=['GET'])
 @login_required
+@conditional_get(profile_versions)
 def get_skills():
-    print("Executing get_skills() on app.")
     skills = Skill.query.filter_by(user_id=current_user.id).all()
-    return jsonify([s.to_dict() for s in skills])
+    sources = resolve_skill_sources(skills)
+    return jsonify([s.to_dict(sources[s.id]) for s in skills])
 
 @app.route('/api/skills/<int:skill_id>', methods=['GET'])
 @login_required
 def get_skill(skill_id):
-    print("Executing get_skill(skill_id) on app.")
     skill = Skill.query.get_or_404(skill_id)
     if skill.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -721,7 +1550,6 @@ def get_skill(skill_id):
 @app.route('/api/skills/<int:skill_id>', methods=['PUT'])
 @login_required
 def update_skill(skill_id):
-    print("Executing update_skill(skill_id) on app.")
     skill = Skill.query.get_or_404(skill_id)
 
     if skill.user_id != current_user.id:
@@ -750,37 +1578,54 @@ def update_skill(skill_id):
             )
             db.session.add(skill_source)
 
-        db.session.commit()
+        bump_profile_version(current_user.id)
+        refresh_user_eligibility(current_user.id)
+        commit_keeping_state()
         return jsonify(skill.to_dict())
 
     except Exception as e:
         db.session.rollback()
-        print("Error updating skill:", str(e))
+        app.logger.exception("Error updating skill %s", skill_id)
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/skills/<int:skill_id>', methods=['DELETE'])
 @login_required
 def delete_skill(skill_id):
-    print("Executing delete_skill(skill_id) on app.")
     skill = Skill.query.get_or_404(skill_id)
     if skill.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
     db.session.delete(skill)
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
     db.session.commit()
     return jsonify({"message": "Skill deleted successfully"})
 
 # --- API Endpoints for Experience ---
 @app.route('/api/experiences', methods=['GET'])
 @login_required
+@conditional_get(profile_versions)
 def get_experiences():
-    print("Executing get_experiences() on app.")
-    exps = Experience.query.filter_by(user_id=current_user.id).order_by(Experience.is_present.desc(), Experience.end_date.desc(), Experience.start_date.desc()).all()
-    return jsonify([exp.to_dict() for exp in exps])
+    try:
+        fields = parse_fields(request.args, Experience.FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # A fieldset without the free text is served from the summary projection
+    if fields is not None and not set(fields) & set(Experience.TEXT_FIELDS):
+        experiences = [exp.to_summary_dict() for exp in user_experiences(current_user.id, summary=True)]
+    else:
+        experiences = [exp.to_dict() for exp in user_experiences(current_user.id)]
+    return jsonify(select_fields(experiences, fields))
+
+def user_experiences(user_id, summary=False):
+    query = Experience.query.filter_by(user_id=user_id)
+    if summary:
+        query = query.options(*EXPERIENCE_SUMMARY_LOADER)
+    return query.order_by(Experience.is_present.desc(), Experience.end_date.desc(), Experience.start_date.desc()).all()
 
 @app.route('/api/experiences', methods=['POST'])
 @login_required
 def add_experience():
-    print("Executing add_experience() on app.")
     data = request.get_json()
     new_experience = Experience(
         user_id=current_user.id,
@@ -797,13 +1642,14 @@ def add_experience():
         achievements=data.get('achievements')
     )
     db.session.add(new_experience)
-    db.session.commit()
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
+    commit_keeping_state()
     return jsonify(new_experience.to_dict()), 201
 
 @app.route('/api/experiences/<int:id>', methods=['GET'])
 @login_required
 def get_experience(id):
-    print("Executing get_experience(id) on app.")
     exp = Experience.query.filter_by(id=id, user_id=current_user.id).first()
     if exp is None:
         return jsonify({'message': 'Experience not found'}), 404
@@ -819,7 +1665,6 @@ def get_experience(id):
 @app.route('/api/experiences/<int:id>', methods=['PUT'])
 @login_required
 def edit_experience(id):
-    print("Executing edit_experience(id) on app.")
     exp = Experience.query.get_or_404(id)
     if exp.user_id != current_user.id:
         return jsonify({'error': 'Forbidden'}), 403
@@ -836,31 +1681,35 @@ def edit_experience(id):
     exp.is_public = data.get('is_public', exp.is_public)
     exp.responsibilities = data.get('responsibilities', exp.responsibilities)
     exp.achievements = data.get('achievements', exp.achievements)
-    db.session.commit()
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
+    commit_keeping_state()
     return jsonify(exp.to_dict())
 
 @app.route('/api/experiences/<int:id>', methods=['DELETE'])
 @login_required
 def delete_experience(id):
-    print("Executing delete_experience(id) on app.")
     exp = Experience.query.get_or_404(id)
     if exp.user_id != current_user.id: return jsonify({'error': 'Forbidden'}), 403
     db.session.delete(exp)
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
     db.session.commit()
     return jsonify({'message': 'Experience deleted successfully'}), 200
 
 # --- API Endpoints for Certificate ---
 @app.route('/api/certificates', methods=['GET'])
 @login_required
+@conditional_get(profile_versions)
 def get_certificates():
-    print("Executing get_certificates() on app.")
-    certs = Certificate.query.filter_by(user_id=current_user.id).order_by(Certificate.issue_date.desc()).all()
-    return jsonify([cert.to_dict() for cert in certs])
+    return jsonify([cert.to_dict() for cert in user_certificates(current_user.id)])
+
+def user_certificates(user_id):
+    return Certificate.query.filter_by(user_id=user_id).order_by(Certificate.issue_date.desc()).all()
 
 @app.route('/api/certificates', methods=['POST'])
 @login_required
 def add_certificate():
-    print("Executing add_certificate() on app.")
     data = request.get_json()
     new_cert = Certificate(
         user_id=current_user.id,
@@ -873,13 +1722,14 @@ def add_certificate():
         is_public=data.get('is_public', True)
     )
     db.session.add(new_cert)
-    db.session.commit()
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
+    commit_keeping_state()
     return jsonify(new_cert.to_dict()), 201
 
 @app.route('/api/certificates/<int:id>', methods=['GET'])
 @login_required
 def get_certificate(id):
-    print("Executing get_certificate(id) on app.")
     cert = Certificate.query.filter_by(id=id, user_id=current_user.id).first()
     if cert is None:
         return jsonify({'message': 'Certificate not found'}), 404
@@ -895,7 +1745,6 @@ def get_certificate(id):
 @app.route('/api/certificates/<int:id>', methods=['PUT'])
 @login_required
 def edit_certificate(id):
-    print("Executing edit_certificate(id) on app.")
     cert = Certificate.query.get_or_404(id)
     if cert.user_id != current_user.id:
         return jsonify({'error': 'Forbidden'}), 403
@@ -907,16 +1756,19 @@ def edit_certificate(id):
     cert.credential_id = data.get('credential_id')
     cert.credential_url = data.get('credential_url')
     cert.is_public = data.get('is_public', cert.is_public)
-    db.session.commit()
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
+    commit_keeping_state()
     return jsonify(cert.to_dict())
 
 @app.route('/api/certificates/<int:id>', methods=['DELETE'])
 @login_required
 def delete_certificate(id):
-    print("Executing delete_certificate(id) on app.")
     cert = Certificate.query.get_or_404(id)
     if cert.user_id != current_user.id: return jsonify({'error': 'Forbidden'}), 403
     db.session.delete(cert)
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
     db.session.commit()
     return jsonify({'message': 'Certificate deleted successfully'}), 200
 
@@ -937,47 +1789,41 @@ def create_test():
         )
         db.session.add(new_test)
         db.session.flush()  # To get the new_test.id
-
-        for q_data in data.get('questions', []):
-            new_question = Question(
-                test_id=new_test.id,
-                question_type=q_data['question_type'],
-                question_text=q_data['question_text'],
-                char_limit=q_data.get('char_limit')
-            )
-            db.session.add(new_question)
-            db.session.flush() # Get the new_question.id
-
-            if new_question.question_type == 'multiple-choice':
-                # The frontend now sends a simple list of strings for answers.
-                for ans_data in q_data.get('answers', []):
-                    if ans_data: # Ensure the answer string is not empty
-                        new_answer = Answer(question_id=new_question.id, answer_text=ans_data)
-                        db.session.add(new_answer)
-
+        write_test_questions(new_test, data.get('questions', []), existing=False)
         db.session.commit()
-        # Refresh the object to load the newly created relationships
-        db.session.refresh(new_test)
+
+        # Load the newly created questions and answers for the response
+        new_test = Test.query.options(*TEST_DETAIL_LOADER).filter_by(id=new_test.id).one()
         return jsonify(new_test.to_detailed_dict()), 201
 
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        print(f"Error creating test: {e}")
+        app.logger.exception("Error creating test")
         return jsonify({"error": "An internal error occurred"}), 500
 
 
 @app.route('/api/tests', methods=['GET'])
 @login_required
 def get_tests():
-    """Fetches all tests created by the current user."""
-    tests = Test.query.filter_by(user_id=current_user.id).order_by(Test.created_at.desc()).all()
-    return jsonify([t.to_dict() for t in tests])
+    """Fetches the tests created by the current user, newest first (optionally one page at a time)."""
+    try:
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
+
+    return page.annotate(jsonify(list_tests(current_user.id, page)))
+
+
+def list_tests(user_id, page):
+    query = Test.query.filter_by(user_id=user_id)
+    tests = page.trim(page.apply(query, Test.created_at, Test.id).all())
+    return [t.to_dict() for t in tests]
 
 
 @app.route('/api/tests/<int:test_id>', methods=['GET'])
 @login_required
 def get_test(test_id):
-    test = Test.query.get_or_404(test_id)
+    test = Test.query.options(*TEST_DETAIL_LOADER).filter_by(id=test_id).first_or_404()
     if test.user_id != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
     return jsonify(test.to_detailed_dict())
@@ -998,35 +1844,17 @@ def update_test(test_id):
         test.title = data['title']
         test.test_type = data['test_type']
 
-        # Easiest way to handle question updates: delete old and create new
-        Question.query.filter_by(test_id=test.id).delete()
-        db.session.commit() # Commit the deletion before adding new questions
-
-        for q_data in data.get('questions', []):
-            new_question = Question(
-                test_id=test.id,
-                question_type=q_data['question_type'],
-                question_text=q_data['question_text'],
-                char_limit=q_data.get('char_limit')
-            )
-            db.session.add(new_question)
-            db.session.flush()
-
-            if new_question.question_type == 'multiple-choice':
-                # The frontend now sends a simple list of strings for answers.
-                for ans_data in q_data.get('answers', []):
-                    if ans_data: # Ensure the answer string is not empty
-                        new_answer = Answer(question_id=new_question.id, answer_text=ans_data)
-                        db.session.add(new_answer)
-
+        # Only the questions and answers that changed are written, all in this one transaction
+        write_test_questions(test, data.get('questions', []))
         db.session.commit()
-        # Refresh the object to load the updated relationships
-        db.session.refresh(test)
+
+        # Load the updated questions and answers for the response
+        test = Test.query.options(*TEST_DETAIL_LOADER).filter_by(id=test.id).one()
         return jsonify(test.to_detailed_dict()), 200
 
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        print(f"Error updating test: {e}")
+        app.logger.exception("Error updating test %s", test_id)
         return jsonify({"error": "An internal error occurred"}), 500
 
 
@@ -1048,16 +1876,16 @@ def delete_test(test_id):
 # --- API Endpoints for Degree ---
 @app.route('/api/degrees', methods=['GET'])
 @login_required
+@conditional_get(profile_versions)
 def get_degrees():
-    print("Executing get_degrees() on app.")
+    return jsonify([degree.to_dict() for degree in user_degrees(current_user.id)])
 
-    degrees = Degree.query.filter_by(user_id=current_user.id).order_by(Degree.end_date.desc()).all()
-    return jsonify([degree.to_dict() for degree in degrees])
+def user_degrees(user_id):
+    return Degree.query.filter_by(user_id=user_id).order_by(Degree.end_date.desc()).all()
 
 @app.route('/api/degrees', methods=['POST'])
 @login_required
 def add_degree():
-    print("Executing add_degree() on app.")
     data = request.get_json()
     new_degree = Degree(
         user_id=current_user.id,
@@ -1071,13 +1899,14 @@ def add_degree():
         is_public=data.get('is_public', True)
     )
     db.session.add(new_degree)
-    db.session.commit()
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
+    commit_keeping_state()
     return jsonify(new_degree.to_dict()), 201
 
 @app.route('/api/degrees/<int:id>', methods=['GET'])
 @login_required
 def get_degree(id):
-    print("Executing get_degree(id) on app.")
     degree = Degree.query.filter_by(id=id, user_id=current_user.id).first()
     if degree is None:
         return jsonify({'message': 'Degree not found'}), 404
@@ -1092,7 +1921,6 @@ def get_degree(id):
 @app.route('/api/degrees/<int:id>', methods=['PUT'])
 @login_required
 def edit_degree(id):
-    print("Executing edit_degree(id) on app.")
     degree = Degree.query.get_or_404(id)
     if degree.user_id != current_user.id:
         return jsonify({'error': 'Forbidden'}), 403
@@ -1106,16 +1934,19 @@ def edit_degree(id):
     degree.city = data.get('city')
     degree.gpa = data.get('gpa')
     degree.is_public = data.get('is_public', degree.is_public)
-    db.session.commit()
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
+    commit_keeping_state()
     return jsonify(degree.to_dict())
 
 @app.route('/api/degrees/<int:id>', methods=['DELETE'])
 @login_required
 def delete_degree(id):
-    print("Executing delete_degree(id) on app.")
     degree = Degree.query.get_or_404(id)
     if degree.user_id != current_user.id: return jsonify({'error': 'Forbidden'}), 403
     db.session.delete(degree)
+    bump_profile_version(current_user.id)
+    refresh_user_eligibility(current_user.id)
     db.session.commit()
     return jsonify({'message': 'Degree deleted successfully'}), 200
 
@@ -1124,8 +1955,7 @@ def delete_degree(id):
 @app.route('/api/account', methods=['GET'])
 @login_required
 def get_account():
-    print("Executing get_account() on app.")
-    return jsonify(current_user.to_dict())
+    return jsonify(db.session.get(User, current_user.id).to_dict())
 
 @app.route('/api/account', methods=['PUT'])
 @login_required
@@ -1138,7 +1968,8 @@ def update_account():
     user.country = data.get('country', user.country)
     user.city = data.get('city', user.city)
     user.bio = data.get('bio', user.bio)
-    db.session.commit()
+    commit_keeping_state()
+    user_cache.invalidate(user.id)
     return jsonify(user.to_dict())
 
 
@@ -1146,7 +1977,6 @@ def update_account():
 @app.route('/api/jobs', methods=['POST'])
 @login_required
 def create_job():
-    print("Executing create_job() on app.")
     data = request.get_json()
 
     try:
@@ -1166,55 +1996,12 @@ def create_job():
 
         db.session.add(new_job)
         db.session.flush()  # Get the job ID
+        write_job_requirements(new_job, data, existing=False)
 
-        # Add required skills
-        for skill in data.get('required_skills', []):
-            job_skill = JobRequiredSkill(
-                job_id=new_job.id,
-                skill_title=skill['title'],
-                skill_type=skill['type'],
-                title_match_type=skill.get('title_match_type', 'including'),
-                is_required=skill.get('is_required', True)
-            )
-            db.session.add(job_skill)
-
-        # Add required experiences
-        for exp in data.get('required_experiences', []):
-            job_exp = JobRequiredExperience(
-                job_id=new_job.id,
-                years_required=exp['years_required'],
-                industry=exp.get('industry'),
-                role_title=exp.get('role_title'),
-                role_title_match_type=exp.get('role_title_match_type', 'including'),
-                country=exp.get('country'),
-                country_match_type=exp.get('country_match_type', 'including'),
-                is_required=exp.get('is_required', True)
-            )
-            db.session.add(job_exp)
-
-        # Add required certificates
-        for cert in data.get('required_certificates', []):
-            job_cert = JobRequiredCertificate(
-                job_id=new_job.id,
-                certificate_title=cert['title'],
-                title_match_type=cert.get('title_match_type', 'including'),
-                issuer=cert.get('issuer'),
-                issuer_match_type=cert.get('issuer_match_type', 'including'),
-                is_required=cert.get('is_required', True)
-            )
-            db.session.add(job_cert)
-
-        # Add required degrees
-        for degree in data.get('required_degrees', []):
-            job_degree = JobRequiredDegree(
-                job_id=new_job.id,
-                degree_level=degree['level'],
-                field_of_study=degree.get('field_of_study'),
-                is_required=degree.get('is_required', True)
-            )
-            db.session.add(job_degree)
-
-        db.session.commit()
+        bump_catalog_version()
+        refresh_job_eligibility(new_job)
+        commit_keeping_state()
+        index_job_for_search(new_job)
         return jsonify(new_job.to_dict()), 201
 
     except Exception as e:
@@ -1223,51 +2010,67 @@ def create_job():
 
 
 @app.route('/api/jobs', methods=['GET'])
+@query_budget(8)
 @login_required
 def get_jobs():
-    print("Executing get_jobs() on app.")
-    # Get jobs posted by current user (for employers)
-    jobs = JobPosting.query.filter_by(posted_by=current_user.id).order_by(JobPosting.created_at.desc()).all()
-    return jsonify([job.to_dict() for job in jobs])
+    try:
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
+    try:
+        fields = parse_fields(request.args, POSTED_JOB_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return page.annotate(jsonify(list_posted_jobs(current_user.id, page, fields)))
+
+
+# The employer's list adds the application counters to the summary projection
+POSTED_JOB_FIELDS = JobPosting.SUMMARY_FIELDS + JobPosting.COUNT_FIELDS
+
+
+def list_posted_jobs(user_id, page, fields=None):
+    """The jobs an employer has posted, newest first, in their summary projection with application counts."""
+    query = JobPosting.query.options(*job_list_loader(fields)).filter_by(posted_by=user_id)
+    jobs = page.trim(page.apply(query, JobPosting.created_at, JobPosting.id).all())
+    return select_fields([dict(job.to_summary_dict(fields), **job.to_counts_dict()) for job in jobs], fields)
+
+
+# Browse adds the user's own relation to each job to the summary projection
+BROWSE_JOB_FIELDS = JobPosting.SUMMARY_FIELDS + ('user_applied', 'user_eligible')
 
 
 @app.route('/api/jobs/browse', methods=['GET'])
+@query_budget(10)
 @login_required
+@conditional_get(browse_versions)
 def browse_jobs():
-    print("Executing browse_jobs() on app.")
     try:
-        # 1. PRE-FETCH USER'S FULL PROFILE FOR EFFICIENCY
-        user_skills = {(s.title.lower(), s.type.lower()) for s in Skill.query.filter_by(user_id=current_user.id)}
-        user_certificates = {(c.title.lower(), c.issuer.lower()) for c in
-                             Certificate.query.filter_by(user_id=current_user.id)}
-        user_experiences = Experience.query.filter_by(user_id=current_user.id).all()
-        user_degrees = Degree.query.filter_by(user_id=current_user.id).all()
-
-        total_experience_years = sum(
-            (exp.end_date.year - exp.start_date.year if exp.end_date else datetime.now().year - exp.start_date.year)
-            for exp in user_experiences
-        )
-        user_exp_tuples = {(e.position_title.lower(), e.country.lower() if e.country else "") for e in user_experiences}
-
-        degree_levels = {"High School": 1, "Associate's": 2, "Bachelor's": 3, "Master's": 4, "Doctoral": 5}
-        max_user_degree_level = max([degree_levels.get(d.degree.value, 0) for d in user_degrees], default=0)
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
+    try:
+        fields = parse_fields(request.args, BROWSE_JOB_FIELDS)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-        # 2. START WITH A BASE QUERY for active jobs not posted by the current user.
-        query = JobPosting.query.filter(
+    try:
+        # 1. START WITH A BASE QUERY for active jobs not posted by the current user.
+        query = JobPosting.query.options(*job_list_loader(fields)).filter(
             JobPosting.status == 'active',
             JobPosting.posted_by != current_user.id
         )
 
-        # 3. APPLY SEARCH FILTERS from the request arguments
+        # 2. APPLY SEARCH FILTERS from the request arguments
         search_term = request.args.get('search')
         location = request.args.get('location')
         employment_type = request.args.get('employment_type')
         employment_arrangement = request.args.get('employment_arrangement')
         eligible_only = request.args.get('eligible_only') == 'true'
 
+        search_rank = None
         if search_term:
-            query = query.filter(
-                or_(JobPosting.title.ilike(f'%{search_term}%'), JobPosting.description.ilike(f'%{search_term}%')))
+            query, search_rank = apply_job_search(query, search_term)
         if location:
             query = query.filter(JobPosting.location.ilike(f'%{location}%'))
         if employment_type:
@@ -1275,110 +2078,52 @@ def browse_jobs():
         if employment_arrangement:
             query = query.filter(JobPosting.employment_arrangement == employment_arrangement)
 
-        # 4. EXECUTE THE FILTERED QUERY
-        all_jobs = query.order_by(JobPosting.created_at.desc()).all()
-        job_list = []
-        user_applied_job_ids = {app.job_id for app in
-                                JobApplication.query.filter_by(user_id=current_user.id).with_entities(
-                                    JobApplication.job_id).all()}
+        # 3. RESTRICT TO ELIGIBLE JOBS via the materialized job_eligibility table
+        if eligible_only:
+            query = query.join(JobEligibility, and_(JobEligibility.job_id == JobPosting.id,
+                                                    JobEligibility.user_id == current_user.id))
+
+        # 4. EXECUTE THE FILTERED QUERY (one page of it when the client asks for paging).
+        # Search results are ordered by relevance, everything else newest first.
+        if search_rank is not None:
+            rows = page.trim(page.apply(query.add_columns(search_rank), search_rank, JobPosting.id).all())
+            all_jobs = [row[0] for row in rows]
+        else:
+            all_jobs = page.trim(page.apply(query, JobPosting.created_at, JobPosting.id).all())
+
+        # 5. LOOK UP ELIGIBILITY AND APPLICATIONS of the user, for the jobs on this page only when paged
+        eligible_query = db.session.query(JobEligibility.job_id).filter(JobEligibility.user_id == current_user.id)
+        applied_query = db.session.query(JobApplication.job_id).filter(JobApplication.user_id == current_user.id)
+        if page.is_paged:
+            page_job_ids = [job.id for job in all_jobs]
+            eligible_query = eligible_query.filter(JobEligibility.job_id.in_(page_job_ids))
+            applied_query = applied_query.filter(JobApplication.job_id.in_(page_job_ids))
+        eligible_job_ids = set()
+        user_applied_job_ids = set()
+        if all_jobs:
+            if not eligible_only:
+                eligible_job_ids = {row.job_id for row in eligible_query}
+            user_applied_job_ids = {row.job_id for row in applied_query}
 
-        # 5. PERFORM ELIGIBILITY CHECK FOR EACH JOB
+        job_list = []
         for job in all_jobs:
-            is_eligible = True  # Assume eligible until a requirement is not met
-
-            # Check Degree requirements
-            if is_eligible and any(req.is_required for req in job.required_degrees):
-                required_level = max(
-                    [degree_levels.get(req.degree_level, 99) for req in job.required_degrees if req.is_required],
-                    default=0)
-                if max_user_degree_level < required_level:
-                    is_eligible = False
-
-            # Check Skill requirements
-            if is_eligible and any(req.is_required for req in job.required_skills):
-                for req in job.required_skills:
-                    if not req.is_required: continue
-                    skill_found = False
-                    for user_skill_title, _ in user_skills:
-                        if req.title_match_type == 'exact' and req.skill_title.lower() == user_skill_title:
-                            skill_found = True
-                            break
-                        elif req.title_match_type == 'including' and req.skill_title.lower() in user_skill_title:
-                            skill_found = True
-                            break
-                    if not skill_found:
-                        is_eligible = False
-                        break
-
-            # Check Certificate requirements
-            if is_eligible and any(req.is_required for req in job.required_certificates):
-                for req in job.required_certificates:
-                    if not req.is_required: continue
-                    cert_found = False
-                    for user_cert_title, user_cert_issuer in user_certificates:
-                        title_match = (not req.certificate_title) or \
-                                      (
-                                                  req.title_match_type == 'exact' and req.certificate_title.lower() == user_cert_title) or \
-                                      (
-                                                  req.title_match_type == 'including' and req.certificate_title.lower() in user_cert_title)
-                        issuer_match = (not req.issuer) or \
-                                       (req.issuer_match_type == 'exact' and req.issuer.lower() == user_cert_issuer) or \
-                                       (req.issuer_match_type == 'including' and req.issuer.lower() in user_cert_issuer)
-                        if title_match and issuer_match:
-                            cert_found = True
-                            break
-                    if not cert_found:
-                        is_eligible = False
-                        break
-
-            # Check Experience requirements
-            if is_eligible and any(req.is_required for req in job.required_experiences):
-                for req in job.required_experiences:
-                    if not req.is_required: continue
-                    # Year check
-                    if total_experience_years < req.years_required:
-                        is_eligible = False
-                        break
-                    # Content check
-                    exp_content_found = False
-                    for user_exp_title, user_exp_country in user_exp_tuples:
-                        title_match = (not req.role_title) or \
-                                      (
-                                                  req.role_title_match_type == 'exact' and req.role_title.lower() == user_exp_title) or \
-                                      (
-                                                  req.role_title_match_type == 'including' and req.role_title.lower() in user_exp_title)
-                        country_match = (not req.country) or \
-                                        (
-                                                    req.country_match_type == 'exact' and req.country.lower() == user_exp_country) or \
-                                        (
-                                                    req.country_match_type == 'including' and req.country.lower() in user_exp_country)
-                        if title_match and country_match:
-                            exp_content_found = True
-                            break
-                    if not exp_content_found:
-                        is_eligible = False
-                        break
-
-            # 6. ADD JOB TO LIST BASED ON ELIGIBILITY FILTER
-            if not eligible_only or is_eligible:
-                job_dict = job.to_dict()
-                job_dict['user_applied'] = job.id in user_applied_job_ids
-                job_dict['user_eligible'] = is_eligible
-                job_list.append(job_dict)
-
-        return jsonify(job_list), 200
+            job_dict = job.to_summary_dict(fields)
+            job_dict['user_applied'] = job.id in user_applied_job_ids
+            job_dict['user_eligible'] = eligible_only or job.id in eligible_job_ids
+            job_list.append(job_dict)
 
-    except Exception as e:
+        return page.annotate(jsonify(select_fields(job_list, fields))), 200
+
+    except Exception:
         # Log the exception for debugging
-        print(f"Error fetching browse jobs: {e}")
+        app.logger.exception("Error fetching browse jobs")
         return jsonify({"error": "Failed to retrieve jobs"}), 500
 
 
 @app.route('/api/jobs/<int:job_id>', methods=['GET'])
 @login_required
 def get_job(job_id):
-    print("Executing get_job(job_id) on app.")
-    job = JobPosting.query.get_or_404(job_id)
+    job = JobPosting.query.options(*JOB_DETAIL_LOADER).filter_by(id=job_id).first_or_404()
     if job.posted_by != current_user.id and job.status != 'active':
         return jsonify({"error": "Unauthorized"}), 403
     return jsonify(job.to_dict())
@@ -1387,7 +2132,6 @@ def get_job(job_id):
 @app.route('/api/jobs/<int:job_id>', methods=['PUT'])
 @login_required
 def update_job(job_id):
-    print("Executing update_job(job_id) on app.")
     job = JobPosting.query.get_or_404(job_id)
     if job.posted_by != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -1408,57 +2152,12 @@ def update_job(job_id):
             'application_deadline') else job.application_deadline
         job.updated_at = datetime.utcnow()
 
-        # Remove existing requirements
-        JobRequiredSkill.query.filter_by(job_id=job.id).delete()
-        JobRequiredExperience.query.filter_by(job_id=job.id).delete()
-        JobRequiredCertificate.query.filter_by(job_id=job.id).delete()
-        JobRequiredDegree.query.filter_by(job_id=job.id).delete()
-
-        # Add updated requirements (same logic as create_job)
-        for skill in data.get('required_skills', []):
-            job_skill = JobRequiredSkill(
-                job_id=job.id,
-                skill_title=skill['title'],
-                skill_type=skill['type'],
-                title_match_type=skill.get('title_match_type', 'including'),
-                is_required=skill.get('is_required', True)
-            )
-            db.session.add(job_skill)
-
-        for exp in data.get('required_experiences', []):
-            job_exp = JobRequiredExperience(
-                job_id=job.id,
-                years_required=exp['years_required'],
-                industry=exp.get('industry'),
-                role_title=exp.get('role_title'),
-                role_title_match_type=exp.get('role_title_match_type', 'including'),
-                country=exp.get('country'),
-                country_match_type=exp.get('country_match_type', 'including'),
-                is_required=exp.get('is_required', True)
-            )
-            db.session.add(job_exp)
-
-        for cert in data.get('required_certificates', []):
-            job_cert = JobRequiredCertificate(
-                job_id=job.id,
-                certificate_title=cert['title'],
-                title_match_type=cert.get('title_match_type', 'including'),
-                issuer=cert.get('issuer'),
-                issuer_match_type=cert.get('issuer_match_type', 'including'),
-                is_required=cert.get('is_required', True)
-            )
-            db.session.add(job_cert)
-
-        for degree in data.get('required_degrees', []):
-            job_degree = JobRequiredDegree(
-                job_id=job.id,
-                degree_level=degree['level'],
-                field_of_study=degree.get('field_of_study'),
-                is_required=degree.get('is_required', True)
-            )
-            db.session.add(job_degree)
-
-        db.session.commit()
+        # Only changed requirement rows are written. Eligibility depends on nothing else that can change here.
+        bump_catalog_version()
+        if write_job_requirements(job, data):
+            refresh_job_eligibility(job)
+        commit_keeping_state()
+        index_job_for_search(job)
         return jsonify(job.to_dict())
 
     except Exception as e:
@@ -1469,20 +2168,22 @@ def update_job(job_id):
 @app.route('/api/jobs/<int:job_id>', methods=['DELETE'])
 @login_required
 def delete_job(job_id):
-    print("Executing delete_job(job_id) on app.")
     job = JobPosting.query.get_or_404(job_id)
     if job.posted_by != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
 
+    JobEligibility.query.filter_by(job_id=job.id).delete(synchronize_session=False)
     db.session.delete(job)
+    bump_catalog_version()
     db.session.commit()
+    job_matchers.discard(job_id)
+    job_search_index.remove(job_id)
     return jsonify({"message": "Job deleted successfully"})
 
 
 @app.route('/api/jobs/<int:job_id>/status', methods=['PUT'])
 @login_required
 def update_job_status(job_id):
-    print("Executing update_job_status(job_id) on app.")
     job = JobPosting.query.get_or_404(job_id)
     if job.posted_by != current_user.id:
         return jsonify({"error": "Unauthorized"}), 403
@@ -1495,6 +2196,8 @@ def update_job_status(job_id):
 
     job.status = status
     job.updated_at = datetime.utcnow()
+    bump_catalog_version()
+    refresh_job_eligibility(job)
     db.session.commit()
 
     return jsonify({"message": f"Job status updated to {status}"})
@@ -1503,66 +2206,86 @@ def update_job_status(job_id):
 @app.route('/api/jobs/<int:job_id>/apply', methods=['POST'])
 @login_required
 def apply_to_job(job_id):
-    print("Executing apply_to_job(job_id) on app.")
-    """Handles a user's application to a specific job."""
+    """
+    Handles a user's application to a specific job.
+    A client may send an Idempotency-Key header; retrying with the same key answers with the original
+    application instead of a 409, so a retry after a lost response is safe.
+    """
     job = JobPosting.query.get_or_404(job_id)
     data = request.get_json()
     cover_letter = data.get('cover_letter')
+    idempotency_key = request.headers.get('Idempotency-Key')
+    if idempotency_key is not None and not 0 < len(idempotency_key) <= IDEMPOTENCY_KEY_MAX_LENGTH:
+        return jsonify({'error': 'Invalid Idempotency-Key header.'}), 400
 
     # Prevent the employer from applying to their own job
     if job.posted_by == current_user.id:
         return jsonify({'error': 'You cannot apply to your own job posting.'}), 403
 
-    # Check if the user has already applied
-    existing_application = JobApplication.query.filter_by(user_id=current_user.id, job_id=job_id).first()
-    if existing_application:
+    # Create the new application record. The unique (user_id, job_id) index turns an existing application,
+    # even one inserted by a concurrent request, into no row instead of a duplicate.
+    application_id = db.session.execute(
+        insert_ignoring_conflicts(JobApplication, ['user_id', 'job_id']).values(
+            user_id=current_user.id,
+            job_id=job_id,
+            status='Submitted',
+            cover_letter=cover_letter,
+            idempotency_key=idempotency_key
+        ).returning(JobApplication.id)
+    ).scalar()
+    if application_id is None:
+        if idempotency_key is not None:
+            application_id = db.session.query(JobApplication.id).filter_by(
+                user_id=current_user.id, job_id=job_id, idempotency_key=idempotency_key).scalar()
+            if application_id is not None:
+                return application_submitted(application_id)
         return jsonify({'error': 'You have already applied to this job.'}), 409
+    update_application_counts(job_id, added_status='Submitted')
+
+    # Notify the employer and confirm to the applicant, in one multi-row insert
+    link = url_for('dashboard', _external=True)  # Or a more specific link
+    db.session.execute(insert(Notification).values([
+        {'user_id': job.posted_by, 'title': 'New Application Received', 'link': link,
+         'message': f'You have a new application for your job posting: "{job.title}".'},
+        {'user_id': current_user.id, 'title': 'Application Submitted!', 'link': link,
+         'message': f'Your application for "{job.title}" has been successfully submitted.'},
+    ]))
+
+    # browse_jobs marks the jobs the user has applied to
+    bump_profile_version(current_user.id)
+    db.session.commit()
+    notification_broker.publish([job.posted_by, current_user.id])
 
-    # Create the new application record
-    new_application = JobApplication(
-        user_id=current_user.id,
-        job_id=job_id,
-        status='Submitted',
-        cover_letter=cover_letter
-    )
-    db.session.add(new_application)
-
-    # Create a notification for the employer
-    employer_notification = Notification(
-        user_id=job.posted_by,
-        title='New Application Received',
-        message=f'You have a new application for your job posting: "{job.title}".',
-        link=url_for('dashboard', _external=True)  # Or a more specific link
-    )
-    db.session.add(employer_notification)
-
-    # Create a confirmation notification for the applicant
-    applicant_notification = Notification(
-        user_id=current_user.id,
-        title='Application Submitted!',
-        message=f'Your application for "{job.title}" has been successfully submitted.',
-        link=url_for('dashboard', _external=True)  # Or a more specific link
-    )
-    db.session.add(applicant_notification)
+    return application_submitted(application_id)
 
-    db.session.commit()
 
+def application_submitted(application_id):
     return jsonify({
         'message': 'Application submitted successfully!',
-        'application_id': new_application.id
+        'application_id': application_id
     }), 201
 
 
+def dialect_insert(model):
+    """An INSERT into model that supports ON CONFLICT clauses (PostgreSQL or SQLite)."""
+    return postgresql.insert(model) if db.engine.dialect.name == 'postgresql' else sqlite.insert(model)
+
+
+def insert_ignoring_conflicts(model, index_elements):
+    """INSERT ... ON CONFLICT DO NOTHING against the unique index on index_elements (PostgreSQL or SQLite)."""
+    return dialect_insert(model).on_conflict_do_nothing(index_elements=index_elements)
+
+
 @app.route('/api/applications', methods=['GET'])
 @login_required
 def get_received_applications():
-    print("Executing get_received_applications() on app.")
     """
     API endpoint for a user to view all applications for their job postings.
     """
-    job_id_filter = request.args.get('job_id')
-    job_ids_filter = request.args.get('job_ids')
-    show_archived = request.args.get('show_archived') == 'true'
+    try:
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
 
     query = db.session.query(
         JobApplication.id,
@@ -1574,27 +2297,13 @@ def get_received_applications():
         User.first_name,
         User.last_name,
         User.email
-    ).join(JobPosting, JobApplication.job_id == JobPosting.id)\
-     .join(User, JobApplication.user_id == User.id)\
-     .filter(JobPosting.posted_by == current_user.id)
-
-    if show_archived:
-        query = query.filter(JobApplication.is_archived == True)
-    else:
-        query = query.filter(JobApplication.is_archived == False)
-
-    if job_id_filter:
-        query = query.filter(JobPosting.id == job_id_filter)
-    elif job_ids_filter:
-        try:
-            # Ensure we have a non-empty list of IDs before applying filter
-            job_ids = [int(id) for id in job_ids_filter.split(',') if id]
-            if job_ids:
-                query = query.filter(JobPosting.id.in_(job_ids))
-        except ValueError:
-            return jsonify({"error": "Invalid job IDs provided"}), 400
+    )
+    try:
+        query = filter_received_applications(query)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    applications = query.order_by(JobApplication.applied_at.desc()).all()
+    applications = page.trim(page.apply(query, JobApplication.applied_at, JobApplication.id).all())
 
     # We then format the results into the JSON structure the frontend expects.
     all_applications = [
@@ -1611,7 +2320,96 @@ def get_received_applications():
         for app in applications
     ]
 
-    return jsonify(all_applications)
+    return page.annotate(jsonify(all_applications))
+
+
+def filter_received_applications(query):
+    """
+    Restricts a query over JobApplication columns to the current user's received applications, filtered by the
+    request's job_id, job_ids and show_archived arguments. Raises ValueError for invalid job ids.
+    """
+    job_id_filter = request.args.get('job_id')
+    job_ids_filter = request.args.get('job_ids')
+    show_archived = request.args.get('show_archived') == 'true'
+
+    query = query.select_from(JobApplication)\
+        .join(JobPosting, JobApplication.job_id == JobPosting.id)\
+        .join(User, JobApplication.user_id == User.id)\
+        .filter(JobPosting.posted_by == current_user.id)
+
+    if show_archived:
+        query = query.filter(JobApplication.is_archived == True)
+    else:
+        query = query.filter(JobApplication.is_archived == False)
+
+    if job_id_filter:
+        query = query.filter(JobPosting.id == job_id_filter)
+    elif job_ids_filter:
+        try:
+            # Ensure we have a non-empty list of IDs before applying filter
+            job_ids = [int(id) for id in job_ids_filter.split(',') if id]
+        except ValueError:
+            raise ValueError("Invalid job IDs provided")
+        if job_ids:
+            query = query.filter(JobPosting.id.in_(job_ids))
+    return query
+
+
+# Optional columns of an application export, by the request argument that adds them
+APPLICATION_EXPORT_OPTIONAL_COLUMNS = {
+    'include_profile': (User.phone.label('applicant_phone'), User.country.label('applicant_country'),
+                        User.city.label('applicant_city'), User.bio.label('applicant_bio')),
+    'include_cover_letter': (JobApplication.cover_letter,),
+}
+
+
+@app.route('/api/applications/export', methods=['GET'])
+@login_required
+def export_received_applications():
+    """
+    Streams the user's received applications, with the filters of GET /api/applications, newest first.
+    format=csv (default) or jsonl; include_profile=true and include_cover_letter=true add optional columns.
+    Rows are read in batches from a server-side cursor and written out as they arrive.
+    """
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": "Invalid export format"}), 400
+
+    selected = [
+        JobApplication.id.label('application_id'),
+        JobPosting.id.label('job_id'),
+        JobPosting.title.label('job_title'),
+        User.id.label('applicant_id'),
+        User.first_name,
+        User.last_name,
+        User.email.label('applicant_email'),
+        JobApplication.status,
+        JobApplication.applied_at,
+    ]
+    columns = ['application_id', 'job_id', 'job_title', 'applicant_id', 'applicant_name', 'applicant_email',
+               'status', 'applied_at']
+    for argument, optional_columns in APPLICATION_EXPORT_OPTIONAL_COLUMNS.items():
+        if request.args.get(argument) == 'true':
+            selected.extend(optional_columns)
+            columns.extend(column.key for column in optional_columns)
+    try:
+        query = filter_received_applications(db.session.query(*selected))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    rows = query.order_by(JobApplication.applied_at.desc(), JobApplication.id.desc())\
+        .yield_per(app.config['EXPORT_YIELD_PER'])
+
+    def records():
+        for row in rows:
+            record = row._asdict()
+            record['applicant_name'] = f"{row.first_name or ''} {row.last_name or ''}".strip()
+            record['applied_at'] = row.applied_at.isoformat()
+            yield record
+
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    filename = f"applications-{datetime.utcnow():%Y%m%d}.{extension}"
+    return Response(stream_with_context(stream_export(records(), columns, export_format)), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/api/applications/<int:application_id>/archive', methods=['PUT'])
@@ -1631,6 +2429,12 @@ def archive_application(application_id):
     data = request.get_json()
     is_archived = data.get('is_archived', True)
 
+    # Archived applications drop out of the job's counters
+    if bool(is_archived) != application.is_archived:
+        if is_archived:
+            update_application_counts(job.id, removed_status=application.status)
+        else:
+            update_application_counts(job.id, added_status=application.status)
     application.is_archived = is_archived
     db.session.commit()
 
@@ -1645,28 +2449,54 @@ def get_applicants():
     API endpoint for an employer to get a unique list of all applicants
     who have applied to their job postings.
     """
-    # Get all applications for jobs posted by the current user
-    applications = JobApplication.query.join(JobPosting).filter(JobPosting.posted_by == current_user.id).order_by(JobApplication.applied_at.desc()).all()
+    try:
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
+
+    # One row per applicant with the time of their most recent application to this employer's jobs.
+    # Paging runs over these rows, so an applicant never appears on two pages.
+    latest = db.session.query(
+        JobApplication.user_id.label('user_id'),
+        func.max(JobApplication.applied_at).label('last_applied_at')
+    ).join(JobPosting, JobApplication.job_id == JobPosting.id)\
+     .filter(JobPosting.posted_by == current_user.id)\
+     .group_by(JobApplication.user_id).subquery()
+
+    applicants = page.trim(
+        page.apply(db.session.query(latest.c.user_id, latest.c.last_applied_at),
+                   latest.c.last_applied_at, latest.c.user_id).all())
+    if not applicants:
+        return page.annotate(jsonify([]))
 
-    # Use a dictionary to ensure each applicant appears only once,
-    # showing details from their most recent application.
-    applicants_dict = {}
+    # Fetch the most recent application of each applicant on this page, with the names needed for display.
+    applications = db.session.query(
+        JobApplication.user_id,
+        JobApplication.job_id,
+        JobPosting.title,
+        User.first_name,
+        User.last_name
+    ).join(JobPosting, JobApplication.job_id == JobPosting.id)\
+     .join(User, JobApplication.user_id == User.id)\
+     .filter(JobPosting.posted_by == current_user.id,
+             JobApplication.user_id.in_([row.user_id for row in applicants]))\
+     .order_by(JobApplication.applied_at.desc(), JobApplication.id.desc()).all()
+
+    most_recent = {}
     for app in applications:
-        if app.user_id not in applicants_dict:
-            applicants_dict[app.user_id] = {
-                'applicant_id': app.user_id,
-                'applicant_name': f"{app.applicant.first_name or ''} {app.applicant.last_name or ''}".strip(),
-                'job_id': app.job_id,
-                'job_title': app.job.title,  # Store the title of the job from the most recent application
-                'applied_at': app.applied_at
-            }
+        most_recent.setdefault(app.user_id, app)
 
-    final_list = sorted(applicants_dict.values(), key=lambda x: x['applied_at'], reverse=True)
-    # Remove the temporary 'applied_at' key before sending the response
-    for item in final_list:
-        del item['applied_at']
+    final_list = []
+    for row in applicants:
+        app = most_recent[row.user_id]
+        final_list.append({
+            'applicant_id': app.user_id,
+            'applicant_name': f"{app.first_name or ''} {app.last_name or ''}".strip(),
+            'job_id': app.job_id,
+            'job_title': app.title  # The title of the job from the most recent application
+        })
 
-    return jsonify(final_list)
+    return page.annotate(jsonify(final_list))
 
 
 @app.route('/api/profile/<int:applicant_id>/public', methods=['GET'])
@@ -1703,7 +2533,9 @@ def get_public_profile(applicant_id):
 
     # Fetch public-facing profile items.
     # Note: The .to_dict() methods on these models already handle the conversion to JSON-friendly formats.
-    skills = [s.to_dict() for s in Skill.query.filter_by(user_id=applicant_id, is_public=True).all()]
+    public_skills = Skill.query.filter_by(user_id=applicant_id, is_public=True).all()
+    skill_sources = resolve_skill_sources(public_skills)
+    skills = [s.to_dict(skill_sources[s.id]) for s in public_skills]
     experiences = [e.to_dict() for e in Experience.query.filter_by(user_id=applicant_id, is_public=True).order_by(Experience.start_date.desc()).all()]
     certificates = [c.to_dict() for c in Certificate.query.filter_by(user_id=applicant_id, is_public=True).order_by(Certificate.issue_date.desc()).all()]
     degrees = [d.to_dict() for d in Degree.query.filter_by(user_id=applicant_id, is_public=True).order_by(Degree.end_date.desc()).all()]
@@ -1723,7 +2555,6 @@ def get_public_profile(applicant_id):
 @app.route('/api/applications/<int:application_id>/status', methods=['PUT'])
 @login_required
 def update_application_status(application_id):
-    print("Executing update_application_status(application_id) on app.")
     """
     Updates the status of a specific job application.
     Accessible only by the user who posted the job.
@@ -1739,11 +2570,12 @@ def update_application_status(application_id):
     new_status = data.get('status')
 
     # Validate that the new status is one of the allowed values
-    valid_statuses = ["Submitted", "Under Review", "Rejected", "Offer Sent", "Accepted"]
-    if not new_status or new_status not in valid_statuses:
+    if not new_status or new_status not in APPLICATION_STATUS_COUNTERS:
         return jsonify({"error": "Invalid status provided"}), 400
 
-    # Update the application status
+    # Update the application status, and the job's counters if the application is counted
+    if not application.is_archived and application.status != new_status:
+        update_application_counts(job.id, added_status=new_status, removed_status=application.status)
     application.status = new_status
 
     # Create a notification for the applicant about the status change
@@ -1755,6 +2587,7 @@ def update_application_status(application_id):
     )
     db.session.add(notification)
     db.session.commit()
+    notification_broker.publish([application.user_id])
 
     return jsonify({"message": f"Application status updated to {new_status}"})
 
@@ -1765,21 +2598,30 @@ def get_my_applications():
     """
     API endpoint for a user to retrieve all the applications they have submitted.
     """
+    try:
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
+
+    return page.annotate(jsonify(list_user_applications(current_user.id, page)))
+
+
+def list_user_applications(user_id, page):
+    """The applications a job seeker has submitted, newest first."""
     # This query joins the application with the job posting to get job details.
-    # It filters to only include applications submitted by the current user.
-    applications = db.session.query(
+    # It filters to only include applications submitted by the user.
+    query = db.session.query(
         JobApplication.id,
         JobApplication.status,
         JobApplication.applied_at,
         JobPosting.title.label('job_title'),
         JobPosting.company_name
     ).join(JobPosting, JobApplication.job_id == JobPosting.id)\
-     .filter(JobApplication.user_id == current_user.id)\
-     .order_by(JobApplication.applied_at.desc())\
-     .all()
+     .filter(JobApplication.user_id == user_id)
+    applications = page.trim(page.apply(query, JobApplication.applied_at, JobApplication.id).all())
 
     # We format the results into the JSON structure the frontend expects.
-    user_applications = [
+    return [
         {
             'id': app.id,
             'job_title': app.job_title,
@@ -1790,8 +2632,6 @@ def get_my_applications():
         for app in applications
     ]
 
-    return jsonify(user_applications)
-
 
 # NOTIFICATIONS
 
@@ -1800,12 +2640,16 @@ def get_my_applications():
 @login_required
 def get_notification_settings():
     """Fetches or creates notification settings for the current user."""
-    settings = NotificationSettings.query.filter_by(user_id=current_user.id).first()
+    return jsonify(get_or_create_notification_settings(current_user.id).to_dict())
+
+
+def get_or_create_notification_settings(user_id):
+    settings = NotificationSettings.query.filter_by(user_id=user_id).first()
     if not settings:
-        settings = NotificationSettings(user_id=current_user.id)
+        settings = NotificationSettings(user_id=user_id)
         db.session.add(settings)
         db.session.commit()
-    return jsonify(settings.to_dict())
+    return settings
 
 
 @app.route('/api/notification-settings', methods=['PUT'])
@@ -1830,11 +2674,68 @@ def update_notification_settings():
 
 
 @app.route('/api/notifications', methods=['GET'])
+@query_budget(3)
 @login_required
 def get_notifications():
-    """Fetches all notifications for the current user."""
-    notifications = Notification.query.filter_by(user_id=current_user.id).order_by(Notification.created_at.desc()).all()
-    return jsonify([n.to_dict() for n in notifications])
+    """Fetches the notifications for the current user, newest first (optionally one page at a time)."""
+    try:
+        page = KeysetPage.from_args(request.args)
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
+
+    return page.annotate(jsonify(list_notifications(current_user.id, page)))
+
+
+def list_notifications(user_id, page):
+    query = Notification.query.filter_by(user_id=user_id)
+    notifications = page.trim(page.apply(query, Notification.created_at, Notification.id).all())
+    return [n.to_dict() for n in notifications]
+
+
+@app.route('/api/notifications/unread-count', methods=['GET'])
+@query_budget(3)
+@login_required
+def get_unread_notification_count():
+    """Returns only the number of unread notifications (served by the partial ix_notifications_unread index)."""
+    return jsonify({'count': count_unread_notifications(current_user.id)})
+
+
+def count_unread_notifications(user_id):
+    return Notification.query.filter_by(user_id=user_id, is_read=False).count()
+
+
+@app.route('/api/notifications/stream', methods=['GET'])
+@login_required
+def stream_notifications():
+    """
+    Server-Sent Events stream of the current user's new notifications ('notification' events)
+    and unread count ('unread-count' events). Replaces client-side polling.
+    """
+    user_id = current_user.id
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    if last_event_id is None:
+        # Fresh connection: only push notifications created from now on.
+        last_event_id = db.session.query(func.max(Notification.id)).filter_by(user_id=user_id).scalar() or 0
+
+    def fetch_changes(after_id):
+        try:
+            notifications = Notification.query.filter(
+                Notification.user_id == user_id,
+                Notification.id > after_id
+            ).order_by(Notification.id).all()
+            count = count_unread_notifications(user_id)
+            return [n.to_dict() for n in notifications], count
+        finally:
+            # Return the connection to the pool while the stream waits.
+            db.session.close()
+
+    events = stream_events(
+        notification_broker, user_id, fetch_changes, last_event_id,
+        resync_seconds=app.config['NOTIFICATION_STREAM_RESYNC_SECONDS'],
+        max_seconds=app.config['NOTIFICATION_STREAM_MAX_SECONDS']
+    )
+    return Response(stream_with_context(events), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @app.route('/api/notifications/mark-all-as-read', methods=['POST'])
@@ -1843,6 +2744,7 @@ def mark_all_notifications_as_read():
     """Marks all unread notifications for the current user as read."""
     Notification.query.filter_by(user_id=current_user.id, is_read=False).update({'is_read': True})
     db.session.commit()
+    notification_broker.publish([current_user.id])
     return jsonify({'message': 'All notifications marked as read'})
 
 
@@ -1857,9 +2759,117 @@ def mark_notification_as_read(notification_id):
 
     notification.is_read = True
     db.session.commit()
+    notification_broker.publish([current_user.id])
     return jsonify({'message': f'Notification {notification_id} marked as read'})
 
 
+@app.cli.command('rebuild-eligibility')
+def rebuild_eligibility():
+    """Recomputes the job_eligibility table for every user (e.g. after first applying its migration)."""
+    user_count = rebuild_eligibility_table()
+    db.session.commit()
+    print(f"Rebuilt job eligibility for {user_count} users.")
+
+
+@app.cli.command('refresh-eligibility-year')
+def refresh_eligibility_year_command():
+    """
+    Recomputes the eligibility of users with an ongoing experience once the calendar year has changed.
+    Does nothing otherwise; schedule it daily (e.g. from cron) so job_eligibility never lags the year.
+    """
+    user_count = refresh_eligibility_year()
+    db.session.commit()
+    print(f"Refreshed job eligibility for {user_count} users.")
+
+
+@app.cli.command('recount-applications')
+def recount_applications():
+    """Recomputes the application counters of every job posting from its applications."""
+    recount_application_counts()
+    db.session.commit()
+    print("Recounted job application counters.")
+
+
+@app.cli.command('send-outbox')
+def send_outbox():
+    """Sends every due message in the email outbox now (handy with the local debugging SMTP server)."""
+    sent = outbox.drain()
+    print(f"Processed {sent} outbox messages.")
+
+
+@app.cli.command('send-digests')
+def send_digests():
+    """Queues email digests for all pending notifications now, instead of waiting for the next interval."""
+    print(f"Queued {send_notification_digests()} notification digests.")
+
+
+# Endpoints checked by `flask check-query-plans`, per sample user. {applicant_id} is one of the employer's applicants.
+HOT_SEEKER_ENDPOINTS = [
+    '/api/jobs/browse?limit=25',
+    '/api/jobs/browse?eligible_only=true&limit=25',
+    '/api/my-applications?limit=25',
+    '/api/notifications?limit=25',
+    '/api/notifications/unread-count',
+    '/api/skills',
+    '/api/experiences',
+    '/api/certificates',
+    '/api/degrees',
+]
+HOT_EMPLOYER_ENDPOINTS = [
+    '/api/jobs?limit=25',
+    '/api/applications?limit=25',
+    '/api/applications?show_archived=true&limit=25',
+    '/api/applicants?limit=25',
+    '/api/tests?limit=25',
+    '/api/profile/{applicant_id}/public',
+]
+
+
+@app.cli.command('check-query-plans')
+def check_query_plans():
+    """
+    Runs the hot endpoints as the busiest job seeker and employer and EXPLAINs every query they issue.
+    Exits with an error if any of them reads a table with a sequential scan. Run it on a large dataset.
+    """
+    seeker_id = db.session.query(JobApplication.user_id).group_by(JobApplication.user_id)\
+        .order_by(func.count().desc()).limit(1).scalar()
+    employer_id = db.session.query(JobPosting.posted_by).group_by(JobPosting.posted_by)\
+        .order_by(func.count().desc()).limit(1).scalar()
+    applicant_id = db.session.query(JobApplication.user_id).join(JobPosting, JobApplication.job_id == JobPosting.id)\
+        .filter(JobPosting.posted_by == employer_id).limit(1).scalar()
+    if seeker_id is None or employer_id is None:
+        raise SystemExit("Not enough data: seed job postings and applications first.")
+
+    seeker_endpoints = list(HOT_SEEKER_ENDPOINTS)
+    if db.engine.dialect.name == 'postgresql':
+        # The SQLite search fallback builds its in-process index with one full read, by design.
+        seeker_endpoints.append('/api/jobs/browse?search=engineer&limit=25')
+    checks = [(seeker_id, path) for path in seeker_endpoints] + \
+             [(employer_id, path.format(applicant_id=applicant_id)) for path in HOT_EMPLOYER_ENDPOINTS]
+
+    tables = set(db.metadata.tables)
+    failures = 0
+    client = app.test_client()
+    for user_id, path in checks:
+        with client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+            session['_fresh'] = True
+        # A fresh app context per request, so Flask-Login does not reuse the previous request's user from `g`.
+        with app.app_context(), capture_statements(db.engine) as statements:
+            status_code = client.get(path).status_code
+        with db.engine.connect() as connection:
+            for statement, parameters in statements:
+                scanned, plan = find_seq_scans(connection, statement, parameters, tables)
+                if scanned:
+                    failures += 1
+                    print(f"SEQ SCAN on {', '.join(scanned)} in GET {path}:\n  {statement}\n  " + "\n  ".join(plan))
+        print(f"GET {path} -> {status_code}, {len(statements)} queries checked")
+
+    if failures:
+        raise SystemExit(f"{failures} queries fell back to a sequential scan.")
+    print("No sequential scans found.")
+
+
 @app.route('/migrate-db')
 def migrate_db():
     """Temporary route to create new tables - remove after use"""
@@ -0,0 +1,80 @@
+"""
+In-process fan-out of notification changes to Server-Sent Events streams.
+
+Endpoints that create or read notifications call NotificationBroker.publish()
+after committing. Every open stream for an affected user wakes up, re-reads
+the user's new notifications and unread count, and pushes them to the browser.
+Streams also wake up on their own every few seconds (see `resync_seconds` in
+stream_events), which picks up changes committed by other worker processes.
+"""
+from collections import defaultdict
+import json
+import threading
+import time
+
+
+class NotificationBroker:
+    """Per-user change counters that SSE streams can block on."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._versions = defaultdict(int)
+
+    def publish(self, user_ids):
+        with self._condition:
+            for user_id in set(user_ids):
+                self._versions[user_id] += 1
+            self._condition.notify_all()
+
+    def version(self, user_id):
+        with self._condition:
+            return self._versions[user_id]
+
+    def wait(self, user_id, seen_version, timeout):
+        """Blocks until the user's version moves past seen_version or the timeout expires. Returns the new version."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._versions[user_id] != seen_version, timeout)
+            return self._versions[user_id]
+
+
+def format_event(event, data, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def stream_events(broker, user_id, fetch_changes, last_event_id, resync_seconds, max_seconds):
+    """
+    Generator of SSE messages for one user.
+
+    fetch_changes(after_id) must return (new_notifications, unread_count), where
+    new_notifications is a list of notification dicts with an id above after_id, oldest
+    first. It must not hold a database connection between calls.
+    The stream closes after max_seconds. The browser's EventSource then reconnects
+    and sends Last-Event-ID, so nothing is missed and no worker stays busy forever.
+    """
+    deadline = time.monotonic() + max_seconds
+    version = broker.version(user_id)
+    last_count = None
+
+    # Tell the browser how long to wait before reconnecting after the stream closes.
+    yield "retry: 3000\n\n"
+    while True:
+        notifications, unread_count = fetch_changes(last_event_id)
+        for notification in notifications:
+            last_event_id = notification['id']
+            yield format_event('notification', notification, event_id=last_event_id)
+        if unread_count != last_count:
+            last_count = unread_count
+            yield format_event('unread-count', {'count': unread_count}, event_id=last_event_id)
+        elif not notifications:
+            # Comment line: keeps proxies from closing an idle connection.
+            yield ": keep-alive\n\n"
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        version = broker.wait(user_id, version, min(resync_seconds, remaining))
@@ -0,0 +1,118 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+Pages are ordered by (sort column DESC, id DESC) and the next page starts strictly
+after the last row of the previous one, so the database seeks straight to it
+through the (sort column, id) index instead of skipping OFFSET rows. Deep pages
+cost the same as the first page.
+
+Pagination is opt-in: a request without `limit` or `cursor` gets the full list,
+exactly as before. Paged responses keep the JSON list body and carry the opaque
+cursor for the next page in the X-Next-Cursor header (absent on the last page).
+
+The cursor holds the sort value as the database stored it, not as the ORM parsed
+it. SQLite keeps timestamps as text in more than one format (server defaults
+write 'YYYY-MM-DD HH:MM:SS', SQLAlchemy adds microseconds), and orders them as
+text, so a re-formatted timestamp would not compare equal to the row it came from.
+"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import String, tuple_, type_coerce
+
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def encode_cursor(sort_value, row_id):
+    """Sort values are stored text (SQLite timestamps), timestamps or numbers (e.g. a search rank)."""
+    if isinstance(sort_value, str):
+        payload = ['s', sort_value, row_id]
+    elif isinstance(sort_value, datetime):
+        payload = ['t', sort_value.isoformat(), row_id]
+    else:
+        payload = ['n', float(sort_value), row_id]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Returns (sort_value, row_id). Raises ValueError for a malformed cursor."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        kind, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if kind == 's':
+            if not isinstance(sort_value, str):
+                raise ValueError('Invalid cursor')
+        elif kind == 't':
+            sort_value = datetime.fromisoformat(sort_value)
+        else:
+            sort_value = float(sort_value)
+        return sort_value, int(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError('Invalid cursor')
+
+
+class KeysetPage:
+    """The paging window requested by a client, built from the query string."""
+
+    def __init__(self, limit=None, after=None):
+        self.limit = limit
+        self.after = after
+        self.next_cursor = None
+        self._single_entity = False
+
+    @classmethod
+    def from_args(cls, args):
+        """Raises ValueError when `limit` or `cursor` is malformed."""
+        limit = args.get('limit')
+        cursor = args.get('cursor')
+        if limit is None and cursor is None:
+            return cls()
+        limit = DEFAULT_PAGE_SIZE if limit is None else int(limit)
+        if limit < 1:
+            raise ValueError('Invalid limit')
+        return cls(limit=min(limit, MAX_PAGE_SIZE), after=decode_cursor(cursor) if cursor else None)
+
+    @property
+    def is_paged(self):
+        return self.limit is not None
+
+    def apply(self, query, sort_column, id_column):
+        """
+        Orders the query newest first and, when paged, restricts it to this page (plus one look-ahead row).
+        Paged queries also select the raw sort value and the id, for the cursor; trim() takes them off again.
+        """
+        # Coercing to String (no CAST in the SQL) passes stored text through unparsed, in results and parameters
+        raw_sort_column = type_coerce(sort_column, String)
+        if self.after is not None:
+            after_sort, after_id = self.after
+            compared = raw_sort_column if isinstance(after_sort, str) else sort_column
+            query = query.filter(tuple_(compared, id_column) < tuple_(after_sort, after_id))
+        query = query.order_by(sort_column.desc(), id_column.desc())
+        if self.is_paged:
+            self._single_entity = len(query.column_descriptions) == 1
+            query = query.add_columns(raw_sort_column.label('keyset_sort'), id_column.label('keyset_id'))
+            query = query.limit(self.limit + 1)
+        return query
+
+    def trim(self, rows):
+        """
+        Drops the look-ahead row and records the cursor for the next page.
+        Queries of one entity get the entities back; multi-column rows keep the two keyset columns at the end.
+        """
+        if not self.is_paged:
+            return rows
+        if len(rows) > self.limit:
+            rows = rows[:self.limit]
+            self.next_cursor = encode_cursor(rows[-1][-2], rows[-1][-1])
+        if self._single_entity:
+            rows = [row[0] for row in rows]
+        return rows
+
+    def annotate(self, response):
+        if self.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = self.next_cursor
+        return response
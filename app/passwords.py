@@ -0,0 +1,79 @@
+"""
+Password hashing on a bounded worker pool.
+
+Hashing is deliberately slow, so running it on request threads lets a burst of
+logins occupy every worker while cheap API calls wait. PasswordHasher runs the
+work on at most `workers` threads. hashlib releases the GIL while it hashes,
+so the threads really run in parallel. Callers still wait for their own result,
+but at most `max_pending` hashes are admitted at once. A caller that cannot get
+a slot within `wait_seconds` gets HashingBusy right away, instead of joining an
+unbounded queue, and the endpoint answers 503.
+
+`method` is a full werkzeug method string including its cost parameters (e.g.
+"pbkdf2:sha256:1000000"). Stored hashes made with another algorithm, or with a
+lower cost than configured, are reported by needs_rehash(), so they can be
+upgraded at the next successful login. Hashes with a higher cost are left alone:
+lowering the configured cost never weakens existing passwords.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing pool is saturated."""
+
+
+def parse_method(method):
+    """
+    Splits a werkzeug method string into its algorithm and its integer cost parameters, e.g.
+    "pbkdf2:sha256:1000000" -> ("pbkdf2:sha256", (1000000,)) and "scrypt:32768:8:1" -> ("scrypt", (32768, 8, 1)).
+    Raises ValueError for a cost that is not an integer.
+    """
+    parts = method.split(':')
+    split_at = 2 if parts[0] == 'pbkdf2' else 1
+    return ':'.join(parts[:split_at]), tuple(int(part) for part in parts[split_at:])
+
+
+class PasswordHasher:
+
+    def __init__(self, method, workers, max_pending, wait_seconds):
+        self.method = method
+        self._algorithm, self._costs = parse_method(method)
+        self.workers = workers
+        self.wait_seconds = wait_seconds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, method=self.method)
+
+    def verify(self, stored_hash, password):
+        return self._run(check_password_hash, stored_hash, password)
+
+    def needs_rehash(self, stored_hash):
+        """True when the stored hash uses another algorithm or a lower cost (in any parameter) than `method`."""
+        try:
+            algorithm, costs = parse_method(stored_hash.split('$', 1)[0])
+        except ValueError:
+            return True
+        if algorithm != self._algorithm or len(costs) != len(self._costs):
+            return True
+        return any(stored < configured for stored, configured in zip(costs, self._costs))
+
+    def _run(self, function, *args, **kwargs):
+        if not self._slots.acquire(timeout=self.wait_seconds):
+            raise HashingBusy()
+        try:
+            return self._get_executor().submit(function, *args, **kwargs).result()
+        finally:
+            self._slots.release()
+
+    def _get_executor(self):
+        # Created on first use, so it is never inherited across a fork by a pre-loading server.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password-hasher')
+            return self._executor
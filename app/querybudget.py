@@ -0,0 +1,139 @@
+"""
+Per-request SQL query budget and N+1 detection.
+
+While tracking is on (debug or testing mode, or SQL_QUERY_TRACKING), every
+statement a request runs is recorded by its shape: the SQL text with
+whitespace and expanded IN (...) lists collapsed. A request that runs more
+statements than its budget, or runs the same shape SQL_REPEATED_QUERY_THRESHOLD
+or more times (the signature of a lazy load inside a loop), is logged as a
+warning. In debug mode the numbers are also returned in response headers.
+
+Budgets default to SQL_QUERY_BUDGET and can be set per view with @query_budget(n).
+
+For tests, assert_max_queries() fails when a block runs more statements than allowed:
+
+    with assert_max_queries(4):
+        client.get('/api/jobs/browse?limit=25')
+"""
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+import logging
+import re
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = 'X-Query-Count'
+QUERY_BUDGET_HEADER = 'X-Query-Budget'
+REPEATED_QUERIES_HEADER = 'X-Query-Repeated'
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# "IN (?, ?, ?)" / "IN (%(p_1)s, %(p_2)s)" -> "IN (?)", so loads of different batch sizes share a shape
+_IN_LIST_RE = re.compile(r'IN \((?:[^()]*?,\s*)+[^()]*?\)', re.IGNORECASE)
+
+
+def statement_shape(statement):
+    return _IN_LIST_RE.sub('IN (?)', _WHITESPACE_RE.sub(' ', statement).strip())
+
+
+def query_budget(max_queries):
+    """Overrides SQL_QUERY_BUDGET for one view."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            return view(*args, **kwargs)
+        wrapper.query_budget = max_queries
+        return wrapper
+    return decorator
+
+
+def repeated_shapes(statements, threshold):
+    """Returns [(shape, count)] for shapes run at least `threshold` times, most repeated first."""
+    counts = Counter(statement_shape(statement) for statement in statements)
+    return [(shape, count) for shape, count in counts.most_common() if count >= threshold]
+
+
+class QueryTracker:
+
+    def __init__(self, app):
+        self.app = app
+        self._listening = False
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    @property
+    def enabled(self):
+        return self.app.debug or self.app.testing or self.app.config['SQL_QUERY_TRACKING']
+
+    def _start(self):
+        if not self.enabled:
+            return
+        if not self._listening:
+            # Registered on first use, so production processes never pay for the listener.
+            event.listen(Engine, 'before_cursor_execute', self._record)
+            self._listening = True
+        g.sql_statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if has_request_context() and 'sql_statements' in g:
+            g.sql_statements.append(statement)
+
+    def _finish(self, response):
+        statements = g.pop('sql_statements', None)
+        if statements is None:
+            return response
+        view = self.app.view_functions.get(request.endpoint)
+        budget = getattr(view, 'query_budget', self.app.config['SQL_QUERY_BUDGET'])
+        repeated = repeated_shapes(statements, self.app.config['SQL_REPEATED_QUERY_THRESHOLD'])
+
+        if len(statements) > budget:
+            logger.warning("%s %s ran %d SQL statements (budget %d)",
+                           request.method, request.path, len(statements), budget)
+        for shape, count in repeated:
+            logger.warning("Possible N+1 in %s %s: statement ran %d times: %s",
+                           request.method, request.path, count, shape)
+
+        if self.app.debug:
+            response.headers[QUERY_COUNT_HEADER] = str(len(statements))
+            response.headers[QUERY_BUDGET_HEADER] = str(budget)
+            if repeated:
+                response.headers[REPEATED_QUERIES_HEADER] = str(sum(count for _, count in repeated))
+        return response
+
+
+@contextmanager
+def count_queries():
+    """Collects the SQL statements run inside the block, on any engine."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, 'before_cursor_execute', record)
+
+
+@contextmanager
+def assert_max_queries(max_queries, repeated_threshold=None):
+    """
+    Fails with the offending statements if the block runs more than max_queries statements,
+    or, when repeated_threshold is given, runs any statement shape that many times.
+    """
+    with count_queries() as statements:
+        yield statements
+    if len(statements) > max_queries:
+        raise AssertionError(f"Expected at most {max_queries} SQL statements, got {len(statements)}:\n"
+                             + "\n".join(statement_shape(statement) for statement in statements))
+    if repeated_threshold is not None:
+        repeated = repeated_shapes(statements, repeated_threshold)
+        if repeated:
+            raise AssertionError("Repeated SQL statements (possible N+1):\n"
+                                 + "\n".join(f"{count}x {shape}" for shape, count in repeated))
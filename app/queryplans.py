@@ -0,0 +1,60 @@
+"""
+Query-plan checks for hot endpoints.
+
+capture_statements() records every SELECT an endpoint runs. find_seq_scans()
+EXPLAINs each one and reports the tables it reads with a full sequential scan,
+which on a large table means an index is missing or can't be used.
+
+Run it against a database with realistic data volumes. On a near-empty table
+the PostgreSQL planner correctly prefers a seq scan, so small datasets give
+false alarms.
+"""
+from contextlib import contextmanager
+import re
+
+from sqlalchemy import event
+
+
+# PostgreSQL: "Seq Scan on job_posting" / "Parallel Seq Scan on job_posting j"
+PG_SEQ_SCAN_RE = re.compile(r'Seq Scan on (\w+)')
+# SQLite: "SCAN job_posting" is a full scan, while "SCAN job_posting USING INDEX ..." walks an index in order.
+SQLITE_SEQ_SCAN_RE = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+
+
+@contextmanager
+def capture_statements(engine):
+    """Collects (statement, parameters) for every SELECT run on the engine inside the block."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith('SELECT'):
+            captured.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def explain(connection, statement, parameters):
+    """Returns the plan of a statement as a list of lines."""
+    if connection.dialect.name == 'postgresql':
+        rows = connection.exec_driver_sql('EXPLAIN ' + statement, parameters)
+        return [row[0] for row in rows]
+    if connection.dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)
+        return [row[-1] for row in rows]
+    raise ValueError(f"Query plans are not supported on {connection.dialect.name}")
+
+
+def find_seq_scans(connection, statement, parameters, tables):
+    """Returns (sorted names of the given tables read with a sequential scan, plan lines)."""
+    plan = explain(connection, statement, parameters)
+    pattern = PG_SEQ_SCAN_RE if connection.dialect.name == 'postgresql' else SQLITE_SEQ_SCAN_RE
+    scanned = set()
+    for line in plan:
+        match = pattern.search(line.strip())
+        if match and match.group(1) in tables:
+            scanned.add(match.group(1))
+    return sorted(scanned), plan
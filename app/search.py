@@ -0,0 +1,114 @@
+"""
+Full-text search helpers for job browsing.
+
+On PostgreSQL, job_posting has a generated `search_vector` tsvector column
+(title weighted A, company_name B, description C) with a GIN index, and
+queries use to_tsquery with prefix terms ("pyth:* & dev:*"), ranked by ts_rank.
+
+Other databases (SQLite test runs) use InvertedIndex, an in-process index with
+the same semantics: every query word must match a prefix of some indexed word,
+and matches in the title count more than in the company name, which count more
+than in the description.
+"""
+from bisect import bisect_left
+from collections import defaultdict
+import heapq
+import math
+import re
+import threading
+
+
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+# Same relative weights as PostgreSQL's ts_rank defaults for A/B/C labels.
+TITLE_WEIGHT = 1.0
+COMPANY_WEIGHT = 0.4
+DESCRIPTION_WEIGHT = 0.2
+
+
+def tokenize(text):
+    return WORD_RE.findall(text.lower()) if text else []
+
+
+def to_prefix_tsquery(term):
+    """Builds a to_tsquery() string that prefix-matches every word of the search term, or None if it has no words."""
+    words = tokenize(term)
+    if not words:
+        return None
+    return ' & '.join(f"{word}:*" for word in words)
+
+
+class InvertedIndex:
+    """Maps words to {doc_id: weighted term frequency}, with prefix lookup over the sorted vocabulary."""
+
+    def __init__(self):
+        self._postings = defaultdict(dict)
+        self._doc_words = {}
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+        self._lock = threading.Lock()
+        self.is_built = False
+
+    def add(self, doc_id, title, company_name, description):
+        weights = defaultdict(float)
+        for text, weight in ((title, TITLE_WEIGHT), (company_name, COMPANY_WEIGHT),
+                             (description, DESCRIPTION_WEIGHT)):
+            for word in tokenize(text):
+                weights[word] += weight
+        with self._lock:
+            self._remove(doc_id)
+            for word, weight in weights.items():
+                self._postings[word][doc_id] = weight
+            self._doc_words[doc_id] = set(weights)
+            self._vocabulary_dirty = True
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        for word in self._doc_words.pop(doc_id, ()):
+            postings = self._postings[word]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[word]
+                self._vocabulary_dirty = True
+
+    def _words_with_prefix(self, prefix):
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        start = bisect_left(self._vocabulary, prefix)
+        for word in self._vocabulary[start:]:
+            if not word.startswith(prefix):
+                break
+            yield word
+
+    def search(self, term, limit=None):
+        """
+        Returns {doc_id: score} for documents matching every word of term as a prefix.
+        With a limit, only that many best matches are returned (ties broken by the higher id, as browsing does).
+        """
+        words = tokenize(term)
+        if not words:
+            return {}
+        with self._lock:
+            total_docs = max(len(self._doc_words), 1)
+            scores = None
+            for query_word in words:
+                word_scores = defaultdict(float)
+                for word in self._words_with_prefix(query_word):
+                    postings = self._postings[word]
+                    idf = math.log(1 + total_docs / len(postings))
+                    for doc_id, weight in postings.items():
+                        word_scores[doc_id] += weight * idf
+                if scores is None:
+                    scores = dict(word_scores)
+                else:
+                    scores = {doc_id: score + word_scores[doc_id]
+                              for doc_id, score in scores.items() if doc_id in word_scores}
+                if not scores:
+                    return {}
+        if limit is not None and len(scores) > limit:
+            scores = dict(heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0])))
+        return scores
@@ -1,5 +1,5 @@
 import { state, dom } from './modules/state.js';
-import { setupGenericForm, fetchAndDisplay } from './modules/utils.js';
+import { setupGenericForm, fetchAndDisplay, fetchInitial, loadBootstrap, discardBootstrap } from './modules/utils.js';
 import { initNotifications } from './modules/notifications.js';
 import {
     loadProfileContent, createSkillHTML, createExperienceHTML,
@@ -24,6 +24,9 @@ import {
 // --- EVENT LISTENERS --- //
 
 document.addEventListener('DOMContentLoaded', function() {
+    // 0. Start loading the data for the first paint in one request; the loaders below are served from it
+    loadBootstrap();
+
     // 1. Initialize DOM references in state
     dom.contentArea = document.getElementById('content-area');
     dom.modals = {
@@ -51,9 +54,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
     async function loadHomeContent() {
         try {
-            const response = await fetch('/api/account');
-            if (!response.ok) throw new Error('Failed to fetch account details');
-            const account = await response.json();
+            const account = await fetchInitial('/api/account', 'account');
             const name = account.first_name || account.email.split('@')[0];
             dom.contentArea.innerHTML = `<h1>Hello, ${name}!</h1>`;
         } catch (error) {
@@ -94,6 +95,7 @@ document.addEventListener('DOMContentLoaded', function() {
             const newStatus = dropdown.value;
 
             try {
+                discardBootstrap();
                 const response = await fetch(`/api/applications/${applicationId}/status`, {
                     method: 'PUT',
                     headers: { 'Content-Type': 'application/json' },
@@ -152,6 +154,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 }));
             }
 
+            discardBootstrap();
             const response = await fetch(`/api/${type}s/${id}`, {
                 method: 'PUT',
                 headers: { 'Content-Type': 'application/json' },
@@ -191,6 +194,7 @@ document.addEventListener('DOMContentLoaded', function() {
                     return;
                 }
 
+                discardBootstrap();
                 const response = await fetch(`/api/${state.itemToDelete.type}s/${state.itemToDelete.id}`, { method: 'DELETE' });
                 if (response.ok) {
                    loadProfileContent();
@@ -1,4 +1,5 @@
 import { dom } from './state.js';
+import { fetchPage, fetchInitialPage, renderLoadMore, discardBootstrap } from './utils.js';
 import { createSkillHTML, createExperienceHTML, createCertificateHTML, createDegreeHTML } from './profile.js';
 
 
@@ -12,15 +13,14 @@ export async function loadEmployerJobs() {
     if (!jobsList) return;
 
     try {
-        const response = await fetch('/api/jobs');
-        if (!response.ok) throw new Error('Failed to load jobs');
-
-        const jobs = await response.json();
+        const url = '/api/jobs';
+        const { items: jobs, nextCursor } = await fetchInitialPage(url, 'jobs');
 
         if (jobs.length === 0) {
             jobsList.innerHTML = '<p class="empty-list-msg">No job postings yet. Click "Post New Job" to get started!</p>';
         } else {
             jobsList.innerHTML = jobs.map(createJobHTML).join('');
+            renderLoadMore(jobsList, url, nextCursor, createJobHTML);
         }
     } catch (error) {
         console.error('Error loading jobs:', error);
@@ -41,12 +41,18 @@ export function createJobHTML(job) {
     const statusClass = job.status === 'active' ? 'status-active' :
                        job.status === 'closed' ? 'status-closed' : 'status-draft';
 
+    // Counts come with the job (kept up to date by the server), so no applications are fetched here
+    const statusCounts = Object.entries(job.status_counts || {})
+        .filter(([, count]) => count > 0)
+        .map(([status, count]) => `${status}: ${count}`)
+        .join(' • ');
+
     return `
         <div class="job-item" data-job-id="${job.id}">
             <div class="job-header">
                 <h4>${job.title}</h4>
                 <div style="display: flex; align-items: center; gap: 0.5rem;">
-                    ${job.applications_count ? `<span class="applications-count">${job.applications_count} applications</span>` : ''}
+                    ${job.application_count ? `<span class="applications-count">${job.application_count} application${job.application_count === 1 ? '' : 's'}</span>` : ''}
                     <span class="job-status ${statusClass}">${job.status.charAt(0).toUpperCase() + job.status.slice(1)}</span>
                 </div>
             </div>
@@ -56,6 +62,7 @@ export function createJobHTML(job) {
                 <p>${salaryRange}</p>
                 <p>${job.employment_type || 'Employment type not specified'} • ${job.employment_arrangement || 'Arrangement not specified'}</p>
                 <p class="job-meta">Posted: ${job.created_at}</p>
+                ${statusCounts ? `<p class="job-meta">${statusCounts}</p>` : ''}
             </div>
             <div class="job-actions">
                 <button class="btn btn-primary view-applications-btn" data-job-id="${job.id}">View Applications</button>
@@ -466,6 +473,7 @@ export async function handleJobSubmission(e) {
         const url = isEditing ? `/api/jobs/${jobId}` : '/api/jobs';
         const method = isEditing ? 'PUT' : 'POST';
 
+        discardBootstrap();
         const response = await fetch(url, {
             method: method,
             headers: {
@@ -537,6 +545,7 @@ export async function loadJobForEditing(jobId, form) {
 // It does not return anything.
 export async function deleteJob(jobId) {
     try {
+        discardBootstrap();
         const response = await fetch(`/api/jobs/${jobId}`, {
             method: 'DELETE'
         });
@@ -556,6 +565,7 @@ export async function deleteJob(jobId) {
 // It does not return anything.
 export async function updateJobStatus(jobId, status) {
     try {
+        discardBootstrap();
         const response = await fetch(`/api/jobs/${jobId}/status`, {
             method: 'PUT',
             headers: {
@@ -594,11 +604,7 @@ export async function loadAllApplications(jobIds = null) {
 
     try {
         const url = jobIds ? `/api/applications?job_ids=${jobIds.join(',')}` : '/api/applications';
-        const response = await fetch(url);
-        if (!response.ok) {
-            throw new Error(`Failed to fetch applications: ${response.statusText}`);
-        }
-        const applications = await response.json();
+        const { items: applications, nextCursor } = await fetchPage(url);
 
         // If filtering, show a status message with a clear button
         if (jobIds && jobIds.length > 0) {
@@ -612,6 +618,17 @@ export async function loadAllApplications(jobIds = null) {
             `;
         }
 
+        // Export links for the same selection; the server streams the file, whatever its size
+        if (applications.length > 0) {
+            const exportQuery = `include_profile=true&include_cover_letter=true${jobIds ? `&job_ids=${jobIds.join(',')}` : ''}`;
+            filterStatus.insertAdjacentHTML('beforeend', `
+                <div class="export-links">
+                    <a class="btn btn-secondary" href="/api/applications/export?format=csv&${exportQuery}" download>Export CSV</a>
+                    <a class="btn btn-secondary" href="/api/applications/export?format=jsonl&${exportQuery}" download>Export JSON Lines</a>
+                </div>
+            `);
+        }
+
         if (applications.length === 0) {
             if (jobIds && jobIds.length > 0) {
                  applicationsContent.innerHTML = '<div class="empty-list-msg">No applications received for the selected job(s).</div>';
@@ -620,6 +637,7 @@ export async function loadAllApplications(jobIds = null) {
             }
         } else {
             applicationsContent.innerHTML = applications.map(app => createApplicationCardHTML(app, false)).join('');
+            renderLoadMore(applicationsContent, url, nextCursor, app => createApplicationCardHTML(app, false));
         }
     } catch (error) {
         console.error('Error loading applications:', error);
@@ -723,14 +741,14 @@ export async function loadAllApplicants() {
     applicantsList.innerHTML = '<p class="loading">Loading applicants...</p>';
 
     try {
-        const response = await fetch('/api/applicants');
-        if (!response.ok) throw new Error('Failed to fetch applicants');
-        const applicants = await response.json();
+        const url = '/api/applicants';
+        const { items: applicants, nextCursor } = await fetchPage(url);
 
         if (applicants.length === 0) {
             applicantsList.innerHTML = '<div class="empty-list-msg">No applicants found yet.</div>';
         } else {
             applicantsList.innerHTML = applicants.map(createApplicantCardHTML).join('');
+            renderLoadMore(applicantsList, url, nextCursor, createApplicantCardHTML);
         }
     } catch (error) {
         console.error('Error loading applicants:', error);
@@ -748,15 +766,14 @@ export async function loadArchivedApplications() {
     archivedList.innerHTML = '<p class="loading">Loading archived applications...</p>';
 
     try {
-        const response = await fetch('/api/applications?show_archived=true');
-        if (!response.ok) throw new Error('Failed to fetch archived applications');
-
-        const applications = await response.json();
+        const url = '/api/applications?show_archived=true';
+        const { items: applications, nextCursor } = await fetchPage(url);
 
         if (applications.length === 0) {
             archivedList.innerHTML = '<div class="empty-list-msg">You have no archived applications.</div>';
         } else {
             archivedList.innerHTML = applications.map(app => createApplicationCardHTML(app, true)).join('');
+            renderLoadMore(archivedList, url, nextCursor, app => createApplicationCardHTML(app, true));
         }
     } catch (error) {
         console.error('Error loading archived applications:', error);
@@ -771,6 +788,7 @@ export async function loadArchivedApplications() {
 // It does not return anything.
 export async function archiveApplication(applicationId, archive = true) {
     try {
+        discardBootstrap();
         const response = await fetch(`/api/applications/${applicationId}/archive`, {
             method: 'PUT',
             headers: { 'Content-Type': 'application/json' },
@@ -919,7 +937,8 @@ export async function populateJobFilterDropdown() {
     if (!filterContainer) return;
 
     try {
-        const response = await fetch('/api/jobs');
+        // Only the ids and titles are needed, which also spares loading the requirements
+        const response = await fetch('/api/jobs?fields=id,title');
         if (!response.ok) throw new Error('Failed to fetch job postings for filter');
         const jobs = await response.json();
 
@@ -1,4 +1,5 @@
 import { dom } from './state.js';
+import { fetchInitialPage, renderLoadMore, discardBootstrap } from './utils.js';
 
 function createTestCardHTML(test) {
     return `
@@ -31,14 +32,14 @@ export async function loadTests() {
     testsList.innerHTML = '<p class="loading">Loading tests...</p>';
 
     try {
-        const response = await fetch('/api/tests');
-        if (!response.ok) throw new Error('Failed to fetch tests');
-        const tests = await response.json();
+        const url = '/api/tests';
+        const { items: tests, nextCursor } = await fetchInitialPage(url, 'tests');
 
         if (tests.length === 0) {
             testsList.innerHTML = '<p class="empty-list-msg">No questionnaires or exams created yet.</p>';
         } else {
             testsList.innerHTML = tests.map(createTestCardHTML).join('');
+            renderLoadMore(testsList, url, nextCursor, createTestCardHTML);
         }
     } catch (error) {
         console.error('Error loading tests:', error);
@@ -90,6 +91,7 @@ export async function openTestForEditing(testId) {
 // It is part of the employer's hiring tools.
 // It does not return anything.
 export async function deleteTest(testId) {
+    discardBootstrap();
     await fetch(`/api/tests/${testId}`, { method: 'DELETE' });
     loadTests(); // Refresh the list
 }
@@ -103,11 +105,13 @@ function addQuestionToForm(type, data = {}) {
     const questionsList = document.getElementById('questions-list');
     const questionItem = document.createElement('div');
     questionItem.className = 'question-item';
+    // Existing questions and answers keep their ids, so saving only writes what changed
+    if (data.id) questionItem.dataset.questionId = data.id;
 
     if (type === 'multiple-choice') {
         const answersHTML = (data.answers || [{answer_text: ''}]).map(ans => `
             <div class="mc-option-item">
-                <input type="text" name="mc_option" placeholder="Answer option" required value="${ans.answer_text || ''}">
+                <input type="text" name="mc_option" placeholder="Answer option" required value="${ans.answer_text || ''}"${ans.id ? ` data-answer-id="${ans.id}"` : ''}>
                 <button type="button" class="btn-remove-dynamic remove-option-btn">&times;</button>
             </div>
         `).join('');
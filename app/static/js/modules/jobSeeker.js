@@ -1,4 +1,5 @@
 import { dom } from './state.js';
+import { fetchPage, fetchInitialPage, renderLoadMore, discardBootstrap } from './utils.js';
 
 // This function is the entry point for loading the job seeker's view.
 // It currently just calls `loadAvailableJobs` to show the job browsing interface.
@@ -32,15 +33,14 @@ export async function loadAvailableJobs() {
         if (employmentArrangement) params.append('employment_arrangement', employmentArrangement);
         if (eligibleOnly) params.append('eligible_only', 'true');
 
-        const response = await fetch(`/api/jobs/browse?${params}`);
-        if (!response.ok) throw new Error('Failed to load jobs');
-
-        const jobs = await response.json();
+        const url = `/api/jobs/browse?${params}`;
+        const { items: jobs, nextCursor } = await fetchPage(url);
 
         if (jobs.length === 0) {
             jobsList.innerHTML = '<div class="empty-list-msg">No jobs found matching your criteria.</div>';
         } else {
             jobsList.innerHTML = jobs.map(createJobSeekerJobHTML).join('');
+            renderLoadMore(jobsList, url, nextCursor, createJobSeekerJobHTML);
         }
     } catch (error) {
         console.error('Error loading jobs:', error);
@@ -97,7 +97,7 @@ function createJobSeekerJobHTML(job) {
                 <span class="job-salary">${salaryRange}</span>
             </div>
             <div class="job-seeker-description">
-                ${job.description.length > 200 ? job.description.substring(0, 200) + '...' : job.description}
+                ${job.description_preview}
             </div>
             <div class="job-seeker-footer">
                 <span class="job-posted">Posted ${job.created_at}</span>
@@ -123,15 +123,14 @@ export async function loadUserApplications() {
     if (!applicationsList) return;
 
     try {
-        const response = await fetch('/api/my-applications');
-        if (!response.ok) throw new Error('Failed to load applications');
-
-        const applications = await response.json();
+        const url = '/api/my-applications';
+        const { items: applications, nextCursor } = await fetchInitialPage(url, 'my_applications');
 
         if (applications.length === 0) {
             applicationsList.innerHTML = '<div class="empty-list-msg">You haven\'t applied to any jobs yet.</div>';
         } else {
             applicationsList.innerHTML = applications.map(createApplicationHTML).join('');
+            renderLoadMore(applicationsList, url, nextCursor, createApplicationHTML);
         }
     } catch (error) {
         console.error('Error loading applications:', error);
@@ -174,6 +173,7 @@ function createApplicationHTML(application) {
 // It does not return anything.
 export async function withdrawApplication(applicationId) {
     try {
+        discardBootstrap();
         const response = await fetch(`/api/applications/${applicationId}`, {
             method: 'DELETE'
         });
@@ -222,7 +222,10 @@ export function openApplicationModal(jobId) {
 
     document.body.appendChild(modal);
 
-    // Set up form submission
+    // Set up form submission. Every submit of this form sends the same key, so the server applies only once
+    // even if a retry follows a request whose response was lost.
+    const idempotencyKey = window.crypto && crypto.randomUUID ? crypto.randomUUID() :
+        `${Date.now()}-${Math.random().toString(36).slice(2)}`;
     const form = modal.querySelector('#application-form');
     form.addEventListener('submit', async (e) => {
         e.preventDefault();
@@ -230,9 +233,10 @@ export function openApplicationModal(jobId) {
         const data = Object.fromEntries(formData);
 
         try {
+            discardBootstrap();
             const response = await fetch(`/api/jobs/${jobId}/apply`, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: { 'Content-Type': 'application/json', 'Idempotency-Key': idempotencyKey },
                 body: JSON.stringify(data)
             });
 
@@ -273,16 +277,9 @@ export function openApplicationModal(jobId) {
 // It does not return anything but triggers `showJobDetailsModal`.
 export async function openJobDetailsModal(jobId) {
     try {
+        // Browse results only carry a preview of the description, so the details always come from the job endpoint
         const response = await fetch(`/api/jobs/${jobId}`);
-        if (!response.ok) {
-            // Try the browse endpoint if the job isn't owned by current user
-            const browseResponse = await fetch(`/api/jobs/browse?search=&location=`);
-            const jobs = await browseResponse.json();
-            const job = jobs.find(j => j.id === jobId);
-            if (!job) throw new Error('Job not found');
-            showJobDetailsModal(job);
-            return;
-        }
+        if (!response.ok) throw new Error('Job not found');
 
         const job = await response.json();
         showJobDetailsModal(job);
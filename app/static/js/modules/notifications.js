@@ -3,6 +3,8 @@
 // NOTIFICATION SYSTEM
 // =================================================================
 
+import { fetchInitial, fetchInitialPage, renderLoadMore, discardBootstrap } from './utils.js';
+
 /* Problem: Notifications are not clickable. */
 
 // This function dynamically creates and injects the notification bell icon
@@ -82,6 +84,7 @@ function setupNotifications() {
 async function markAllNotificationsAsRead() {
     try {
         // This endpoint marks all notifications as read on the backend.
+        discardBootstrap();
         const response = await fetch('/api/notifications/mark-all-as-read', { method: 'POST' });
         if (!response.ok) throw new Error('Failed to mark notifications as read');
 
@@ -97,24 +100,23 @@ async function markAllNotificationsAsRead() {
 }
 
 
-// This function fetches the full list of notifications for the current user from the API.
+// This function fetches the most recent page of notifications for the current user from the API.
 // It then uses a helper function to generate the HTML and display the list in the notification dropdown.
+// Older notifications are fetched page by page through the "Load more" button.
 // It is part of the notification system.
 // It does not return anything but updates the notifications-list element's innerHTML.
-// Fetch the user's full notification list from the server's API.
 async function loadNotifications() {
     const notificationsList = document.getElementById('notifications-list');
 
     try {
-        const response = await fetch('/api/notifications');
-        if (!response.ok) throw new Error('Failed to load notifications');
-
-        const notifications = await response.json();
+        const url = '/api/notifications';
+        const { items: notifications, nextCursor } = await fetchInitialPage(url, 'notifications');
 
         if (notifications.length === 0) {
             notificationsList.innerHTML = '<div class="empty-list-msg" style="padding: 1rem;">No notifications</div>';
         } else {
             notificationsList.innerHTML = notifications.map(createNotificationHTML).join('');
+            renderLoadMore(notificationsList, url, nextCursor, createNotificationHTML);
         }
     } catch (error) {
         console.error('Error loading notifications:', error);
@@ -146,41 +148,67 @@ function createNotificationHTML(notification) {
 }
 
 
-// This function fetches all notifications to get the count of unread ones.
-// It updates the notification badge on the bell icon, showing the count or hiding the badge if the count is zero.
-// It is a lightweight check for the notification system.
+// This function shows the unread count on the notification badge, or hides the badge when the count is zero.
+// It is a helper for loadNotificationCount() and the notification stream.
 // It does not return anything but updates the notification badge UI.
-// A more lightweight version of loadNotifications() function.
-// This function only fetches the number of unread notifications.
-// It then updates the small badge on the bell icon, showing the count if it's greater than zero and hiding it otherwise.
-async function loadNotificationCount() {
-    try {
-        const response = await fetch('/api/notifications');
-        if (!response.ok) throw new Error('Failed to load notifications');
+function updateNotificationBadge(unreadCount) {
+    const badge = document.getElementById('notification-badge');
+    if (badge) {
+        if (unreadCount > 0) {
+            badge.textContent = unreadCount;
+            badge.style.display = 'flex';
+        } else {
+            badge.style.display = 'none';
+        }
+    }
+}
 
-        const notifications = await response.json();
-        const unreadCount = notifications.filter(n => !n.is_read).length;
 
-        const badge = document.getElementById('notification-badge');
-        if (badge) {
-            if (unreadCount > 0) {
-                badge.textContent = unreadCount;
-                badge.style.display = 'flex';
-            } else {
-                badge.style.display = 'none';
-            }
-        }
+// This function fetches only the number of unread notifications from the count endpoint.
+// It updates the notification badge on the bell icon.
+// It is used on page load and as a polling fallback for browsers without EventSource.
+// It does not return anything but updates the notification badge UI.
+async function loadNotificationCount() {
+    try {
+        const { count } = await fetchInitial('/api/notifications/unread-count', 'unread_count');
+        updateNotificationBadge(count);
     } catch (error) {
         console.error('Error loading notification count:', error);
     }
 }
 
 
+// This function subscribes to the server's notification stream (Server-Sent Events).
+// The server pushes 'unread-count' events whenever the count changes and a 'notification' event for each new notification,
+// so the dashboard no longer needs to poll. The browser reconnects automatically if the stream drops.
+// It does not return anything.
+function subscribeToNotificationStream() {
+    if (!window.EventSource) {
+        setInterval(loadNotificationCount, 5000);
+        return;
+    }
+
+    const source = new EventSource('/api/notifications/stream');
+
+    source.addEventListener('unread-count', (event) => {
+        updateNotificationBadge(JSON.parse(event.data).count);
+    });
+
+    source.addEventListener('notification', (event) => {
+        const notificationsList = document.getElementById('notifications-list');
+        if (!notificationsList) return;
+        // Drop the "No notifications" placeholder before adding the first item
+        notificationsList.querySelector('.empty-list-msg')?.remove();
+        notificationsList.insertAdjacentHTML('afterbegin', createNotificationHTML(JSON.parse(event.data)));
+    });
+}
+
+
 // Export the initialization function to be used in main
 export function initNotifications() {
     addNotificationBell();
     loadNotifications();
-    setInterval(loadNotificationCount, 5000);
+    subscribeToNotificationStream();
 
     document.getElementById('notifications-list').addEventListener('click', (event) => {
         const notificationItem = event.target.closest('.notification-item');
@@ -191,4 +219,4 @@ export function initNotifications() {
             }
         }
     });
-}
\ No newline at end of file
+}
@@ -1,5 +1,5 @@
 import { dom, state } from './state.js';
-import { fetchAndDisplay } from './utils.js';
+import { fetchAndDisplay, fetchInitial } from './utils.js';
 
 // =================================================================
 // Profile Section
@@ -90,10 +90,7 @@ export async function loadProfileContent() {
 // This function loads profile items for the skill form
 async function loadProfileItemsForSkillForm() {
     try {
-        const response = await fetch('/api/user/profile-items');
-        if (!response.ok) throw new Error('Failed to load profile items');
-
-        const items = await response.json();
+        const items = await fetchInitial('/api/user/profile-items', 'profile_items');
         const container = document.getElementById('acquired-at-sources');
 
         if (items.length === 0) {
@@ -1,4 +1,5 @@
 import { dom } from './state.js';
+import { fetchInitial, discardBootstrap } from './utils.js';
 
 // This function generates the HTML structure for the "Settings" page.
 // It creates sections for Notification Preferences and Account Settings, then triggers the loading of content for each.
@@ -33,9 +34,7 @@ export function loadSettingsContent() {
 async function loadNotificationSettings() {
     const settingsDiv = document.getElementById('notification-settings');
     try {
-        const response = await fetch('/api/notification-settings');
-        if (!response.ok) throw new Error('Failed to load settings');
-        const settings = await response.json();
+        const settings = await fetchInitial('/api/notification-settings', 'notification_settings');
         const isEmailEnabled = settings.delivery_method === 'email_and_in_app';
 
         settingsDiv.innerHTML = `
@@ -73,9 +72,7 @@ async function loadAccountSettings() {
     if (!card) return;
     card.innerHTML = '<p class="loading">Loading account information...</p>';
     try {
-        const response = await fetch('/api/account');
-        if (!response.ok) throw new Error('Failed to fetch account data.');
-        const accountData = await response.json();
+        const accountData = await fetchInitial('/api/account', 'account');
 
         // Store the data on the element for easy access
         card.dataset.accountData = JSON.stringify(accountData);
@@ -166,6 +163,7 @@ export async function saveAccountChanges() {
     };
 
     try {
+        discardBootstrap();
         const response = await fetch('/api/account', {
             method: 'PUT',
             headers: { 'Content-Type': 'application/json' },
@@ -217,6 +215,7 @@ async function saveNotificationSettings() {
 
     try {
         const deliveryMethod = toggle.checked ? 'email_and_in_app' : 'in_app';
+        discardBootstrap();
         const response = await fetch('/api/notification-settings', {
             method: 'PUT',
             headers: { 'Content-Type': 'application/json' },
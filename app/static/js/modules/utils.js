@@ -112,14 +112,18 @@ export function setupGenericForm(modal, onSuccessfulSubmit) {
                 let questionData = {
                     question_text: item.querySelector('[name="question_text"]').value
                 };
+                // Questions loaded for editing send their id back, so the server keeps them instead of re-creating them
+                if (item.dataset.questionId) questionData.id = parseInt(item.dataset.questionId);
 
                 if (item.querySelector('.mc-options-list')) {
                     // Logic for Multiple Choice Questions
                     questionData.question_type = 'multiple-choice';
-                    // Extract option values and filter out empty inputs
+                    // Extract option values (with the ids of existing options) and filter out empty inputs
                     questionData.answers = Array.from(item.querySelectorAll('[name="mc_option"]'))
-                                         .map(input => input.value)
-                                         .filter(Boolean);
+                                         .filter(input => input.value)
+                                         .map(input => input.dataset.answerId ?
+                                             { id: parseInt(input.dataset.answerId), answer_text: input.value } :
+                                             input.value);
                 } else {
                     // Logic for Descriptive Questions
                     questionData.question_type = 'descriptive';
@@ -149,6 +153,7 @@ export function setupGenericForm(modal, onSuccessfulSubmit) {
 
         // --- 6. API Call ---
         try {
+            discardBootstrap();
             const response = await fetch(url, {
                 method: method,
                 headers: { 'Content-Type': 'application/json' },
@@ -198,9 +203,7 @@ function addDynamicInput(type, listId, value = '') {
 // It does not return anything but updates the specified list element's innerHTML.
 export async function fetchAndDisplay(type, listId, createHTML) {
     try {
-        const response = await fetch(`/api/${type}s`);
-        if (!response.ok) throw new Error(`Failed to load ${type}s.`);
-        const items = await response.json();
+        const items = await fetchInitial(`/api/${type}s`, `${type}s`);
         const listElement = document.getElementById(listId);
         if (listElement) {
             listElement.innerHTML = items.length > 0 ? items.map(item => createHTML(item, false)).join('') : `<p class="empty-list-msg">No ${type}s added yet.</p>`;
@@ -210,3 +213,122 @@ export async function fetchAndDisplay(type, listId, createHTML) {
     }
 }
 
+
+
+// --- Dashboard Bootstrap ---
+// The first paint of the dashboard is served by a single /api/bootstrap request that returns every section at once.
+// Each section is handed out once: the first loader that asks for it gets the bootstrap data,
+// and every later call (a refresh after an edit, revisiting a tab) goes to the section's own endpoint.
+// Once the user writes anything, the sections not used yet are discarded (see discardBootstrap), since the write
+// may have changed them (e.g. applying to a job changes "My applications").
+// Sections older than BOOTSTRAP_MAX_AGE_MS are not used either, so a tab opened much later shows changes made by others.
+const BOOTSTRAP_MAX_AGE_MS = 60000;
+let bootstrapRequest = null;
+let bootstrapLoadedAt = 0;
+let bootstrapDiscarded = false;
+const usedBootstrapSections = new Set();
+
+// This function discards the bootstrap sections not used yet, so their loaders go to their own endpoints instead.
+// Every write calls it before sending its request, since the write may change any section.
+// It does not return anything.
+export function discardBootstrap() {
+    bootstrapDiscarded = true;
+}
+
+// This function starts the bootstrap request. It is called once, as early as possible, when the dashboard loads.
+// It returns a promise of the bootstrap data, or of null when the request fails (loaders then use their own endpoints).
+export function loadBootstrap() {
+    if (!bootstrapRequest) {
+        bootstrapRequest = fetch('/api/bootstrap')
+            .then(response => {
+                if (!response.ok) throw new Error('Failed to load the dashboard');
+                return response.json();
+            })
+            .then(data => {
+                bootstrapLoadedAt = Date.now();
+                return data;
+            })
+            .catch(error => {
+                console.error('Error loading the dashboard bootstrap:', error);
+                return null;
+            });
+    }
+    return bootstrapRequest;
+}
+
+// This function returns one section of the bootstrap data the first time it is asked for.
+// It returns null if the section was already used, was discarded by a write, is too old,
+// or the bootstrap request failed.
+async function takeBootstrapSection(section) {
+    if (!bootstrapRequest || bootstrapDiscarded || usedBootstrapSections.has(section)) return null;
+    usedBootstrapSections.add(section);
+    const data = await bootstrapRequest;
+    if (!data || bootstrapDiscarded || Date.now() - bootstrapLoadedAt > BOOTSTRAP_MAX_AGE_MS) return null;
+    return data[section] ?? null;
+}
+
+// This function returns the JSON for `url`, served from the bootstrap `section` on first paint.
+// It is used by loaders that render a whole (unpaged) resource, such as the account or the profile lists.
+export async function fetchInitial(url, section) {
+    const data = await takeBootstrapSection(section);
+    if (data !== null) return data;
+
+    const response = await fetch(url);
+    if (!response.ok) throw new Error(`Failed to load ${url}`);
+    return response.json();
+}
+
+// This function is the fetchPage() counterpart of fetchInitial() for paged lists.
+// It returns the first page as { items, nextCursor }, served from the bootstrap `section` on first paint.
+export async function fetchInitialPage(url, section) {
+    const page = await takeBootstrapSection(section);
+    if (page !== null) return { items: page.items, nextCursor: page.next_cursor };
+    return fetchPage(url);
+}
+
+
+// --- Paged Lists ---
+// List endpoints use cursor pagination: the client sends `limit` (and `cursor` for later pages),
+// and the server returns the cursor of the next page in the X-Next-Cursor header (absent on the last page).
+export const PAGE_SIZE = 25;
+
+// This function fetches a single page from a paginated list endpoint.
+// It is the shared building block for every paged list in the dashboard.
+// It returns an object with the page's `items` and the `nextCursor` (null on the last page).
+export async function fetchPage(url, cursor = null, limit = PAGE_SIZE) {
+    const pageUrl = new URL(url, window.location.origin);
+    pageUrl.searchParams.set('limit', limit);
+    if (cursor) pageUrl.searchParams.set('cursor', cursor);
+
+    const response = await fetch(pageUrl);
+    if (!response.ok) throw new Error(`Failed to load ${url}`);
+    return { items: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+}
+
+// This function adds a "Load more" button to the end of a list when there is a next page.
+// Clicking it fetches the next page from `url`, appends the items rendered with `createHTML`, and moves the button along.
+// It is used by every list that is loaded with fetchPage().
+// It does not return anything but updates the given list element.
+export function renderLoadMore(listElement, url, nextCursor, createHTML) {
+    listElement.querySelector('.load-more-btn')?.remove();
+    if (!nextCursor) return;
+
+    const button = document.createElement('button');
+    button.type = 'button';
+    button.className = 'btn btn-secondary load-more-btn';
+    button.textContent = 'Load more';
+    button.addEventListener('click', async (event) => {
+        // Keep dropdowns (e.g. notifications) open while paging
+        event.stopPropagation();
+        button.disabled = true;
+        try {
+            const page = await fetchPage(url, nextCursor);
+            button.insertAdjacentHTML('beforebegin', page.items.map(item => createHTML(item)).join(''));
+            renderLoadMore(listElement, url, page.nextCursor, createHTML);
+        } catch (error) {
+            console.error('Error loading the next page:', error);
+            button.disabled = false;
+        }
+    });
+    listElement.appendChild(button);
+}
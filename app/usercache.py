@@ -0,0 +1,90 @@
+"""
+Per-process cache of the user identity that Flask-Login restores on every request.
+
+Authenticated requests only need to know who the user is, not their whole
+profile. The login manager's user_loader therefore returns a small UserIdentity
+from this LRU cache instead of loading the User row every time. Endpoints that
+need the full profile load it themselves.
+
+Entries expire after ttl_seconds, which bounds how long a change made by another
+worker process can go unnoticed. Changes made by this process call invalidate().
+"""
+from collections import OrderedDict
+import logging
+import threading
+import time
+
+from flask_login import UserMixin
+
+
+logger = logging.getLogger(__name__)
+
+# Log the cache statistics once every this many lookups.
+STATS_LOG_INTERVAL = 10000
+
+
+class UserIdentity(UserMixin):
+    """What current_user is on authenticated requests."""
+
+    def __init__(self, id, email, confirmed):
+        self.id = id
+        self.email = email
+        self.confirmed = confirmed
+
+
+class UserCache:
+
+    def __init__(self, max_size, ttl_seconds):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # user_id -> (expires_at, identity), least recently used first
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, user_id, load):
+        """Returns the cached identity, or calls load(user_id) and caches its result unless it is None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                self._maybe_log_stats()
+                return entry[1]
+            self.misses += 1
+            self._maybe_log_stats()
+
+        identity = load(user_id)
+        if identity is not None:
+            with self._lock:
+                self._entries[user_id] = (now + self.ttl_seconds, identity)
+                self._entries.move_to_end(user_id)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return identity
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def _maybe_log_stats(self):
+        if (self.hits + self.misses) % STATS_LOG_INTERVAL == 0:
+            logger.info('user cache stats', extra={'fields': self.stats()})
@@ -0,0 +1,217 @@
+"""
+Synthetic marketplace data for the benchmarks.
+
+seed_marketplace() fills an empty database with employers and their job postings
+(with requirements), job seekers with full profiles, applications, notifications
+and tests. Rows are written with multi-row INSERTs and explicit ids, so seeding
+time is dominated by the eligibility rebuild, not by round-trips. The same seed
+always produces the same data.
+"""
+from datetime import date, datetime, timedelta
+import random
+
+from sqlalchemy import insert, text
+
+
+SCALES = {
+    # employers, jobs per employer, seekers, applications per seeker
+    'small': (20, 25, 200, 8),
+    'medium': (100, 30, 1000, 10),
+    'large': (200, 50, 5000, 12),
+}
+
+WORDS = ['Python', 'Java', 'SQL', 'Go', 'Rust', 'AWS', 'Docker', 'Kubernetes', 'React', 'Data', 'Machine Learning',
+         'Security', 'Cloud', 'Mobile', 'DevOps', 'Analytics', 'Frontend', 'Backend', 'Platform', 'QA']
+ROLES = ['Engineer', 'Developer', 'Analyst', 'Architect', 'Manager', 'Consultant', 'Scientist', 'Administrator']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Vandelay', 'Stark', 'Wayne', 'Tyrell', 'Soylent']
+COUNTRIES = ['Canada', 'USA', 'UK', 'Germany', 'India', None]
+CITIES = ['Toronto', 'Vancouver', 'New York', 'London', 'Berlin', 'Remote']
+ISSUERS = ['AWS', 'Google', 'Microsoft', 'Oracle', 'Cisco', 'CompTIA']
+EMPLOYMENT_TYPES = ['Full-Time', 'Part-Time', 'Contract', 'Internship']
+ARRANGEMENTS = ['On-Site', 'Remote', 'Hybrid']
+STATUSES = ['Submitted', 'Under Review', 'Rejected', 'Offer Sent', 'Accepted']
+LOREM = ("We are looking for a motivated professional to join our growing team. You will design, build and "
+         "maintain services used by thousands of customers, collaborate with product and design, and mentor "
+         "others. ").split()
+
+BATCH_SIZE = 5000
+
+
+def _text(rnd, words):
+    return ' '.join(rnd.choice(LOREM) for _ in range(words))
+
+
+def _title(rnd):
+    return f"{rnd.choice(WORDS)} {rnd.choice(ROLES)}"
+
+
+class _Writer:
+    """Buffers rows per model and writes them with executemany INSERTs."""
+
+    def __init__(self, db):
+        self.db = db
+        self.rows = {}
+        self.next_ids = {}
+
+    def add(self, model, **values):
+        row_id = self.next_ids.get(model, 1)
+        self.next_ids[model] = row_id + 1
+        values.setdefault('id', row_id)
+        self.rows.setdefault(model, []).append(values)
+        if len(self.rows[model]) >= BATCH_SIZE:
+            self.flush(model)
+        return values['id']
+
+    def add_without_id(self, model, **values):
+        self.rows.setdefault(model, []).append(values)
+        if len(self.rows[model]) >= BATCH_SIZE:
+            self.flush(model)
+
+    def flush(self, model=None):
+        for target in [model] if model else list(self.rows):
+            if self.rows.get(target):
+                self.db.session.execute(insert(target), self.rows[target])
+                self.rows[target] = []
+
+
+def seed_marketplace(main, scale='small', seed=42):
+    """
+    Seeds the database of the given app module (main.py) and returns a summary dict.
+    Must run inside an app context on an empty database.
+    """
+    employers, jobs_per_employer, seekers, applications_per_seeker = SCALES[scale]
+    rnd = random.Random(seed)
+    db = main.db
+    writer = _Writer(db)
+    now = datetime(2026, 1, 1)
+    # Benchmarks never log in with a password, so every user shares one precomputed hash.
+    password = main.password_hasher.hash('benchmark')
+
+    employer_ids = []
+    for i in range(employers):
+        employer_ids.append(writer.add(
+            main.User, email=f'employer{i}@bench.example', password=password, confirmed=True,
+            first_name=f'Employer{i}', last_name='Bench', company_name=f"{rnd.choice(COMPANIES)} {i}",
+            company_description=_text(rnd, 30), industry=rnd.choice(WORDS)))
+    seeker_ids = []
+    for i in range(seekers):
+        seeker_ids.append(writer.add(
+            main.User, email=f'seeker{i}@bench.example', password=password, confirmed=True,
+            first_name=f'Seeker{i}', last_name='Bench', country=rnd.choice(COUNTRIES), city=rnd.choice(CITIES),
+            bio=_text(rnd, 60)))
+    for user_id in employer_ids + seeker_ids:
+        writer.add(main.NotificationSettings, user_id=user_id,
+                   delivery_method=rnd.choice(['email_and_in_app', 'in_app']))
+
+    # Job postings with requirements
+    active_job_ids = []
+    job_owner = {}
+    for employer_id in employer_ids:
+        for _ in range(jobs_per_employer):
+            created_at = now - timedelta(minutes=rnd.randint(0, 60 * 24 * 365))
+            status = rnd.choices(['active', 'closed', 'draft'], weights=[8, 1, 1])[0]
+            salary_min = rnd.randrange(40000, 150000, 5000)
+            job_id = writer.add(
+                main.JobPosting, title=_title(rnd), description=_text(rnd, rnd.randint(150, 400)),
+                company_name=rnd.choice(COMPANIES), location=rnd.choice(CITIES), salary_min=salary_min,
+                salary_max=salary_min + rnd.randrange(0, 50000, 5000), employment_type=rnd.choice(EMPLOYMENT_TYPES),
+                employment_arrangement=rnd.choice(ARRANGEMENTS), status=status,
+                application_deadline=(created_at + timedelta(days=60)).date(), posted_by=employer_id,
+                created_at=created_at, updated_at=created_at)
+            job_owner[job_id] = employer_id
+            if status == 'active':
+                active_job_ids.append(job_id)
+            for _ in range(rnd.randint(2, 6)):
+                writer.add(main.JobRequiredSkill, job_id=job_id, skill_title=rnd.choice(WORDS),
+                           skill_type=rnd.choice(['Technical', 'Behavioral', 'Conceptual']),
+                           title_match_type=rnd.choice(['exact', 'including']), is_required=rnd.random() < 0.7)
+            for _ in range(rnd.randint(0, 2)):
+                writer.add(main.JobRequiredExperience, job_id=job_id, years_required=rnd.randint(0, 8),
+                           role_title=rnd.choice([None, rnd.choice(ROLES)]), role_title_match_type='including',
+                           country=rnd.choice(COUNTRIES), country_match_type='including',
+                           is_required=rnd.random() < 0.7)
+            for _ in range(rnd.randint(0, 2)):
+                writer.add(main.JobRequiredCertificate, job_id=job_id, certificate_title=rnd.choice(WORDS),
+                           title_match_type='including', issuer=rnd.choice([None] + ISSUERS),
+                           issuer_match_type='including', is_required=rnd.random() < 0.7)
+            if rnd.random() < 0.5:
+                writer.add(main.JobRequiredDegree, job_id=job_id,
+                           degree_level=rnd.choice([level.value for level in main.DegreeEnum]),
+                           field_of_study=rnd.choice([None, 'Computer Science']), is_required=rnd.random() < 0.8)
+
+    # Seeker profiles, applications and notifications
+    applications = 0
+    for seeker_id in seeker_ids:
+        experience_ids = []
+        for _ in range(rnd.randint(1, 4)):
+            start = date(rnd.randint(2005, 2023), rnd.randint(1, 12), 1)
+            is_present = rnd.random() < 0.2
+            experience_ids.append(writer.add(
+                main.Experience, position_title=_title(rnd), employer=rnd.choice(COMPANIES),
+                country=rnd.choice(COUNTRIES), city=rnd.choice(CITIES), start_date=start,
+                end_date=None if is_present else start + timedelta(days=rnd.randint(180, 1800)),
+                is_present=is_present, employment_type=rnd.choice(EMPLOYMENT_TYPES),
+                employment_arrangement=rnd.choice(ARRANGEMENTS), user_id=seeker_id, is_public=rnd.random() < 0.9,
+                responsibilities=_text(rnd, 80), achievements=_text(rnd, 40)))
+        for _ in range(rnd.randint(0, 3)):
+            writer.add(main.Certificate, title=f"{rnd.choice(WORDS)} Certification", issuer=rnd.choice(ISSUERS),
+                       issue_date=date(rnd.randint(2015, 2025), 1, 1), user_id=seeker_id,
+                       is_public=rnd.random() < 0.9)
+        for _ in range(rnd.randint(0, 2)):
+            start = date(rnd.randint(2000, 2018), 9, 1)
+            writer.add(main.Degree, degree=rnd.choice(list(main.DegreeEnum)), field_of_study='Computer Science',
+                       school='Bench University', start_date=start, end_date=start + timedelta(days=365 * 4),
+                       user_id=seeker_id, is_public=True)
+        for _ in range(rnd.randint(3, 8)):
+            skill_id = writer.add(main.Skill, type=rnd.choice(['Technical', 'Behavioral', 'Conceptual']),
+                                  title=rnd.choice(WORDS), status='Claimed', attestation_count=0, user_id=seeker_id,
+                                  is_public=rnd.random() < 0.9)
+            if rnd.random() < 0.5:
+                writer.add_without_id(main.SkillSource, skill_id=skill_id, source_id=rnd.choice(experience_ids),
+                                      source_type='experience')
+
+        for job_id in rnd.sample(active_job_ids, min(applications_per_seeker, len(active_job_ids))):
+            applied_at = now + timedelta(minutes=rnd.randint(0, 60 * 24 * 90))
+            writer.add(main.JobApplication, user_id=seeker_id, job_id=job_id, cover_letter=_text(rnd, 120),
+                       status=rnd.choice(STATUSES), applied_at=applied_at, is_archived=rnd.random() < 0.1)
+            # The same pair of notifications apply_to_job creates
+            for user_id, title in ((seeker_id, 'Application Submitted'), (job_owner[job_id], 'New Application')):
+                writer.add(main.Notification, user_id=user_id, title=title, message=_text(rnd, 12),
+                           is_read=rnd.random() < 0.6, link='/dashboard', created_at=applied_at,
+                           digested_at=applied_at)
+            applications += 1
+
+    # A few tests per employer
+    for employer_id in employer_ids:
+        for t in range(3):
+            test_id = writer.add(main.Test, user_id=employer_id, test_type=rnd.choice(['Questionnaire', 'Exam']),
+                                 title=f"Screening test {t}", created_at=now - timedelta(days=t))
+            for q in range(rnd.randint(3, 10)):
+                multiple_choice = rnd.random() < 0.5
+                question_id = writer.add(main.Question, test_id=test_id,
+                                         question_type='multiple-choice' if multiple_choice else 'descriptive',
+                                         question_text=f"Question {q}: {_text(rnd, 15)}",
+                                         char_limit=None if multiple_choice else 500)
+                if multiple_choice:
+                    for a in range(4):
+                        writer.add(main.Answer, question_id=question_id, answer_text=f"Answer {a}")
+
+    writer.flush()
+    if db.engine.dialect.name == 'postgresql':
+        # Rows were inserted with explicit ids: move the id sequences past them.
+        for model in writer.next_ids:
+            table = model.__table__.name
+            db.session.execute(text(f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                                    f"(SELECT MAX(id) FROM \"{table}\"))"))
+    # The eligibility table and the application counters are derived data: build them the way the app does.
+    main.rebuild_eligibility_table()
+    main.recount_application_counts()
+    db.session.commit()
+
+    return {
+        'employers': employers,
+        'seekers': seekers,
+        'jobs': employers * jobs_per_employer,
+        'active_jobs': len(active_job_ids),
+        'applications': applications,
+    }
@@ -0,0 +1,33 @@
+"""Add job_eligibility table
+
+Revision ID: 5f3b9d2c7a41
+Revises: 678be95dcd32
+Create Date: 2026-10-17 09:12:05.418233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f3b9d2c7a41'
+down_revision = '678be95dcd32'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('job_eligibility',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['job_posting.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'job_id')
+    )
+    op.create_index(op.f('ix_job_eligibility_job_id'), 'job_eligibility', ['job_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_job_eligibility_job_id'), table_name='job_eligibility')
+    op.drop_table('job_eligibility')
@@ -0,0 +1,23 @@
+"""Add (user_id, is_read) index to notifications
+
+Revision ID: 9c1e4a7b2d58
+Revises: 5f3b9d2c7a41
+Create Date: 2026-10-17 10:02:41.187554
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9c1e4a7b2d58'
+down_revision = '5f3b9d2c7a41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_notifications_user_id_is_read', 'notifications', ['user_id', 'is_read'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_id_is_read', table_name='notifications')
@@ -0,0 +1,32 @@
+"""Add version counters for conditional GETs
+
+Revision ID: a8c4e1f7b352
+Revises: f5b2d8e6a193
+Create Date: 2026-10-17 14:02:19.318455
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c4e1f7b352'
+down_revision = 'f5b2d8e6a193'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('user', sa.Column('profile_version', sa.Integer(), server_default='0', nullable=False))
+
+    version_counter = op.create_table('version_counter',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(version_counter, [{'name': 'job_catalog', 'value': 0}])
+
+
+def downgrade():
+    op.drop_table('version_counter')
+    op.drop_column('user', 'profile_version')
@@ -0,0 +1,46 @@
+"""Add denormalized application counters to job postings
+
+Revision ID: c3f9a2d6b417
+Revises: a8c4e1f7b352
+Create Date: 2026-10-17 15:26:41.904217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f9a2d6b417'
+down_revision = 'a8c4e1f7b352'
+branch_labels = None
+depends_on = None
+
+
+COUNTERS = {
+    'application_count': None,
+    'submitted_count': 'Submitted',
+    'under_review_count': 'Under Review',
+    'rejected_count': 'Rejected',
+    'offer_sent_count': 'Offer Sent',
+    'accepted_count': 'Accepted',
+}
+
+
+def upgrade():
+    for column in COUNTERS:
+        op.add_column('job_posting', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill from the existing non-archived applications
+    assignments = []
+    for column, status in COUNTERS.items():
+        status_filter = f" AND job_application.status = '{status}'" if status else ''
+        assignments.append(
+            f"{column} = (SELECT count(job_application.id) FROM job_application"
+            f" WHERE job_application.job_id = job_posting.id AND NOT job_application.is_archived{status_filter})"
+        )
+    op.execute(f"UPDATE job_posting SET {', '.join(assignments)}")
+
+
+def downgrade():
+    for column in reversed(list(COUNTERS)):
+        op.drop_column('job_posting', column)
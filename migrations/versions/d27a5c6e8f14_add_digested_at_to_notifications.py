@@ -0,0 +1,29 @@
+"""Add digested_at to notifications
+
+Revision ID: d27a5c6e8f14
+Revises: b4e8f1a09c3d
+Create Date: 2026-10-17 11:31:56.904312
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd27a5c6e8f14'
+down_revision = 'b4e8f1a09c3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('notifications', sa.Column('digested_at', sa.DateTime(), nullable=True))
+    # Existing notifications predate email digests: mark them as handled so they are never emailed.
+    op.execute(sa.text('UPDATE notifications SET digested_at = CURRENT_TIMESTAMP'))
+    op.create_index('ix_notifications_undigested', 'notifications', ['user_id'], unique=False,
+                    postgresql_where=sa.text('digested_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_notifications_undigested', table_name='notifications')
+    op.drop_column('notifications', 'digested_at')
@@ -0,0 +1,27 @@
+"""Add positions to questions and answers
+
+Revision ID: d7e2b5f1c9a4
+Revises: c3f9a2d6b417
+Create Date: 2026-10-17 16:48:05.217630
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7e2b5f1c9a4'
+down_revision = 'c3f9a2d6b417'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows all start at 0 and are ordered by id among equals, which is the order they were created in
+    op.add_column('questions', sa.Column('position', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('answers', sa.Column('position', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('answers', 'position')
+    op.drop_column('questions', 'position')
@@ -0,0 +1,37 @@
+"""Add full-text search vector to job_posting
+
+Revision ID: e3a7c9d41b62
+Revises: d27a5c6e8f14
+Create Date: 2026-10-17 12:04:18.215634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a7c9d41b62'
+down_revision = 'd27a5c6e8f14'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Generated tsvector columns are PostgreSQL-only; other databases search through the in-process index.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.text(
+        "ALTER TABLE job_posting ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(company_name, '')), 'B') || "
+        "setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')) STORED"
+    ))
+    op.create_index('ix_job_posting_search_vector', 'job_posting', ['search_vector'], unique=False,
+                    postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_job_posting_search_vector', table_name='job_posting')
+    op.drop_column('job_posting', 'search_vector')
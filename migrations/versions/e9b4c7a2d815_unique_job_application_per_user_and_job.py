@@ -0,0 +1,53 @@
+"""One application per user and job, and idempotency keys for applying
+
+Revision ID: e9b4c7a2d815
+Revises: d7e2b5f1c9a4
+Create Date: 2026-10-17 18:11:37.562904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9b4c7a2d815'
+down_revision = 'd7e2b5f1c9a4'
+branch_labels = None
+depends_on = None
+
+
+STATUS_COUNTERS = {
+    'submitted_count': 'Submitted',
+    'under_review_count': 'Under Review',
+    'rejected_count': 'Rejected',
+    'offer_sent_count': 'Offer Sent',
+    'accepted_count': 'Accepted',
+}
+
+
+def _count(status=None):
+    status_filter = f" AND job_application.status = '{status}'" if status else ''
+    return (f"(SELECT count(job_application.id) FROM job_application"
+            f" WHERE job_application.job_id = job_posting.id AND NOT job_application.is_archived{status_filter})")
+
+
+def upgrade():
+    op.add_column('job_application', sa.Column('idempotency_key', sa.String(length=64), nullable=True))
+
+    # Concurrent applies could store the same application twice: keep the first of each
+    deleted = op.get_bind().execute(sa.text(
+        "DELETE FROM job_application WHERE id NOT IN "
+        "(SELECT min(id) FROM job_application GROUP BY user_id, job_id)"
+    )).rowcount
+    if deleted:
+        # The duplicates were counted in the job application counters
+        assignments = [f"application_count = {_count()}"]
+        assignments += [f"{column} = {_count(status)}" for column, status in STATUS_COUNTERS.items()]
+        op.execute(f"UPDATE job_posting SET {', '.join(assignments)}")
+
+    op.create_index('uq_job_application_user_id_job_id', 'job_application', ['user_id', 'job_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_job_application_user_id_job_id', table_name='job_application')
+    op.drop_column('job_application', 'idempotency_key')
@@ -0,0 +1,73 @@
+"""Add indexes for hot lookup paths
+
+Revision ID: f5b2d8e6a193
+Revises: e3a7c9d41b62
+Create Date: 2026-10-17 12:27:43.508176
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5b2d8e6a193'
+down_revision = 'e3a7c9d41b62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Profile items and job requirements are always loaded by their owner.
+    op.create_index(op.f('ix_skill_user_id'), 'skill', ['user_id'], unique=False)
+    op.create_index(op.f('ix_experience_user_id'), 'experience', ['user_id'], unique=False)
+    op.create_index(op.f('ix_certificate_user_id'), 'certificate', ['user_id'], unique=False)
+    op.create_index(op.f('ix_degree_user_id'), 'degree', ['user_id'], unique=False)
+    op.create_index('ix_skill_sources_source', 'skill_sources', ['source_type', 'source_id'], unique=False)
+    op.create_index(op.f('ix_job_required_skill_job_id'), 'job_required_skill', ['job_id'], unique=False)
+    op.create_index(op.f('ix_job_required_experience_job_id'), 'job_required_experience', ['job_id'], unique=False)
+    op.create_index(op.f('ix_job_required_certificate_job_id'), 'job_required_certificate', ['job_id'], unique=False)
+    op.create_index(op.f('ix_job_required_degree_job_id'), 'job_required_degree', ['job_id'], unique=False)
+    op.create_index(op.f('ix_questions_test_id'), 'questions', ['test_id'], unique=False)
+    op.create_index(op.f('ix_answers_question_id'), 'answers', ['question_id'], unique=False)
+
+    # Lists paginated newest first: the trailing (created_at, id) columns match the keyset order.
+    op.create_index('ix_job_posting_status_created_at', 'job_posting', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_job_posting_posted_by_created_at', 'job_posting', ['posted_by', 'created_at', 'id'], unique=False)
+    op.create_index('ix_job_application_user_id_applied_at', 'job_application', ['user_id', 'applied_at', 'id'],
+                    unique=False)
+    op.create_index('ix_job_application_job_id_applied_at', 'job_application', ['job_id', 'applied_at'], unique=False)
+    op.create_index('ix_job_application_job_id_active', 'job_application', ['job_id', 'applied_at'], unique=False,
+                    postgresql_where=sa.text('NOT is_archived'))
+    op.create_index('ix_tests_user_id_created_at', 'tests', ['user_id', 'created_at', 'id'], unique=False)
+
+    # The unread badge only ever looks at unread rows; the list index replaces (user_id, is_read).
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at', 'id'],
+                    unique=False)
+    op.create_index('ix_notifications_unread', 'notifications', ['user_id'], unique=False,
+                    postgresql_where=sa.text('NOT is_read'))
+    op.drop_index('ix_notifications_user_id_is_read', table_name='notifications')
+
+
+def downgrade():
+    op.create_index('ix_notifications_user_id_is_read', 'notifications', ['user_id', 'is_read'], unique=False)
+    op.drop_index('ix_notifications_unread', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_created_at', table_name='notifications')
+
+    op.drop_index('ix_tests_user_id_created_at', table_name='tests')
+    op.drop_index('ix_job_application_job_id_active', table_name='job_application')
+    op.drop_index('ix_job_application_job_id_applied_at', table_name='job_application')
+    op.drop_index('ix_job_application_user_id_applied_at', table_name='job_application')
+    op.drop_index('ix_job_posting_posted_by_created_at', table_name='job_posting')
+    op.drop_index('ix_job_posting_status_created_at', table_name='job_posting')
+
+    op.drop_index(op.f('ix_answers_question_id'), table_name='answers')
+    op.drop_index(op.f('ix_questions_test_id'), table_name='questions')
+    op.drop_index(op.f('ix_job_required_degree_job_id'), table_name='job_required_degree')
+    op.drop_index(op.f('ix_job_required_certificate_job_id'), table_name='job_required_certificate')
+    op.drop_index(op.f('ix_job_required_experience_job_id'), table_name='job_required_experience')
+    op.drop_index(op.f('ix_job_required_skill_job_id'), table_name='job_required_skill')
+    op.drop_index('ix_skill_sources_source', table_name='skill_sources')
+    op.drop_index(op.f('ix_degree_user_id'), table_name='degree')
+    op.drop_index(op.f('ix_certificate_user_id'), table_name='certificate')
+    op.drop_index(op.f('ix_experience_user_id'), table_name='experience')
+    op.drop_index(op.f('ix_skill_user_id'), table_name='skill')
@@ -0,0 +1,67 @@
+"""
+Shared fixtures for the test suite.
+
+main.py reads its configuration when it is imported, so the database URL is set
+first: tests run against a SQLite file of their own, created fresh for every test.
+"""
+import os
+import sys
+import tempfile
+
+import pytest
+
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='meritus-tests-'), 'test.db')
+os.environ.setdefault('LOG_LEVEL', 'ERROR')
+os.environ['BACKGROUND_WORKERS'] = '0'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app'))
+
+import main  # noqa: E402
+from eligibility import MatcherCatalog  # noqa: E402
+from search import InvertedIndex  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """
+    The app with empty tables. Set up data inside `with app.app_context():` and make requests outside it:
+    a request reuses an app context that is already pushed, and with it `g` and the logged-in user.
+    """
+    main.app.config['TESTING'] = True
+    # In-process caches would otherwise carry rows of an earlier test over to reused ids
+    main.user_cache.clear()
+    main.job_matchers = MatcherCatalog()
+    main.job_search_index = InvertedIndex()
+    with main.app.app_context():
+        main.db.drop_all()
+        main.db.create_all()
+    return main.app
+
+
+@pytest.fixture
+def db(app):
+    return main.db
+
+
+@pytest.fixture
+def make_user(app, db):
+    """Creates a confirmed user and returns its id."""
+    def make(email, **fields):
+        with app.app_context():
+            defaults = {'password': 'unused', 'confirmed': True, 'first_name': email.split('@')[0], 'last_name': 'Test'}
+            user = main.User(email=email, **{**defaults, **fields})
+            db.session.add(user)
+            db.session.commit()
+            return user.id
+    return make
+
+
+@pytest.fixture
+def client_for(app):
+    """Returns a test client logged in as the given user."""
+    def client(user_id):
+        test_client = app.test_client()
+        with test_client.session_transaction() as session:
+            session['_user_id'] = str(user_id)
+            session['_fresh'] = True
+        return test_client
+    return client
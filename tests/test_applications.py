@@ -0,0 +1,70 @@
+"""Applying to a job: duplicates, retries and concurrent submissions."""
+import threading
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def job(app, db, make_user, client_for):
+    """An active job, and a seeker who has not applied to it yet."""
+    employer_id = make_user('employer@example.com')
+    seeker_id = make_user('seeker@example.com')
+    with app.app_context():
+        job = main.JobPosting(title='Python Engineer', description='Builds things.', company_name='Acme',
+                              location='Toronto', employment_type='Full-Time', status='active',
+                              posted_by=employer_id)
+        db.session.add(job)
+        db.session.commit()
+        job_id = job.id
+    return {'id': job_id, 'seeker_id': seeker_id, 'seeker': client_for(seeker_id)}
+
+
+def stored_applications(app, db, job_id):
+    with app.app_context():
+        applications = db.session.query(main.JobApplication).filter_by(job_id=job_id).all()
+        submitted_count = db.session.get(main.JobPosting, job_id).submitted_count
+        return len(applications), submitted_count
+
+
+def test_second_application_is_rejected(app, db, job):
+    first = job['seeker'].post(f"/api/jobs/{job['id']}/apply", json={'cover_letter': 'Hi'})
+    second = job['seeker'].post(f"/api/jobs/{job['id']}/apply", json={'cover_letter': 'Hi again'})
+
+    assert first.status_code == 201
+    assert second.status_code == 409
+    assert stored_applications(app, db, job['id']) == (1, 1)
+
+
+def test_retry_with_the_same_idempotency_key_returns_the_original_application(app, db, job):
+    headers = {'Idempotency-Key': 'apply-1'}
+    first = job['seeker'].post(f"/api/jobs/{job['id']}/apply", json={'cover_letter': 'Hi'}, headers=headers)
+    retry = job['seeker'].post(f"/api/jobs/{job['id']}/apply", json={'cover_letter': 'Hi'}, headers=headers)
+    other_key = job['seeker'].post(f"/api/jobs/{job['id']}/apply", json={'cover_letter': 'Hi'},
+                                   headers={'Idempotency-Key': 'apply-2'})
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.get_json() == first.get_json()
+    assert other_key.status_code == 409
+    assert stored_applications(app, db, job['id']) == (1, 1)
+
+
+def test_simultaneous_applications_leave_one_row(app, db, job, client_for):
+    clients = [client_for(job['seeker_id']) for _ in range(2)]
+    barrier = threading.Barrier(len(clients))
+    statuses = []
+
+    def apply(client):
+        barrier.wait()
+        statuses.append(client.post(f"/api/jobs/{job['id']}/apply", json={'cover_letter': 'Hi'}).status_code)
+
+    threads = [threading.Thread(target=apply, args=(client,)) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(statuses) == [201, 409]
+    assert stored_applications(app, db, job['id']) == (1, 1)
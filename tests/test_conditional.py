@@ -0,0 +1,31 @@
+"""ETags of browse_jobs, versioned by the job catalog counter."""
+import main
+from test_write_queries import JOB_PAYLOAD
+
+
+def browse(client, etag=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    return client.get('/api/jobs/browse?limit=25', headers=headers)
+
+
+def test_job_writes_change_the_browse_etag(app, db, make_user, client_for):
+    employer = client_for(make_user('employer@example.com'))
+    seeker = client_for(make_user('seeker@example.com'))
+
+    etag = browse(seeker).headers['ETag']
+    assert browse(seeker, etag).status_code == 304
+
+    # The first job write creates the counter row, the next ones increment it
+    job_id = employer.post('/api/jobs', json=JOB_PAYLOAD).get_json()['id']
+    response = browse(seeker, etag)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert browse(seeker, etag).status_code == 304
+
+    employer.put(f'/api/jobs/{job_id}/status', json={'status': 'closed'})
+    response = browse(seeker, etag)
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+    with app.app_context():
+        assert db.session.get(main.VersionCounter, main.JOB_CATALOG_VERSION).value == 2
@@ -0,0 +1,59 @@
+"""Notification digests: one email per user for each batch of new notifications."""
+import main
+
+
+def notify(app, db, user_id, *titles, is_read=False):
+    with app.app_context():
+        db.session.add_all(main.Notification(user_id=user_id, title=title, message=f'{title} happened.',
+                                             is_read=is_read) for title in titles)
+        db.session.commit()
+
+
+def send_digests(app):
+    with app.app_context():
+        return main.send_notification_digests()
+
+
+def queued_emails(app, db):
+    """(recipient, subject, body) of every queued email, oldest first."""
+    with app.app_context():
+        return [(row.recipient, row.subject, row.body)
+                for row in db.session.query(main.EmailOutbox).order_by(main.EmailOutbox.id)]
+
+
+def test_each_notification_is_digested_once(app, db, make_user):
+    user_id = make_user('seeker@example.com')
+    notify(app, db, user_id, 'Application viewed', 'Interview invite')
+
+    assert send_digests(app) == 1
+    assert send_digests(app) == 0
+    [(recipient, subject, body)] = queued_emails(app, db)
+    assert recipient == 'seeker@example.com'
+    assert subject == 'You have 2 new notifications'
+    assert 'Application viewed' in body and 'Interview invite' in body
+
+    # The next period's digest only covers what arrived since
+    notify(app, db, user_id, 'Offer sent')
+    assert send_digests(app) == 1
+    (_, subject, body) = queued_emails(app, db)[-1]
+    assert subject == 'You have 1 new notification'
+    assert 'Offer sent' in body and 'Interview invite' not in body
+
+    with app.app_context():
+        assert db.session.query(main.Notification).filter(main.Notification.digested_at.is_(None)).count() == 0
+
+
+def test_read_notifications_and_in_app_only_users_are_not_emailed(app, db, make_user):
+    reader_id = make_user('reader@example.com')
+    in_app_id = make_user('in-app@example.com')
+    with app.app_context():
+        db.session.add(main.NotificationSettings(user_id=in_app_id, delivery_method='in_app'))
+        db.session.commit()
+    notify(app, db, reader_id, 'Already seen', is_read=True)
+    notify(app, db, in_app_id, 'Interview invite')
+
+    assert send_digests(app) == 0
+    assert queued_emails(app, db) == []
+    # Both are settled, so they are not reconsidered by later runs
+    with app.app_context():
+        assert db.session.query(main.Notification).filter(main.Notification.digested_at.is_(None)).count() == 0
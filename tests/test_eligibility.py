@@ -0,0 +1,91 @@
+"""The materialized job_eligibility table."""
+from datetime import date, datetime
+
+import main
+from querybudget import count_queries
+
+
+def add_job(db, employer_id, **fields):
+    job = main.JobPosting(title='Python Engineer', description='Builds things.', company_name='Acme',
+                          location='Toronto', employment_type='Full-Time', status='active', posted_by=employer_id,
+                          **fields)
+    db.session.add(job)
+    db.session.commit()
+    return job
+
+
+def eligible_pairs(db):
+    return {(row.user_id, row.job_id) for row in db.session.query(main.JobEligibility)}
+
+
+def test_pair_written_by_a_concurrent_refresh_is_skipped(app, db, make_user):
+    employer_id = make_user('employer@example.com')
+    seeker_id = make_user('seeker@example.com')
+    with app.app_context():
+        job = add_job(db, employer_id)
+
+        # A job refresh and a user refresh both decide the seeker is eligible (no requirements)
+        main.refresh_job_eligibility(job)
+        main.refresh_user_eligibility(seeker_id)
+        main._write_eligibility([(seeker_id, job.id)])
+        db.session.commit()
+
+        assert db.session.query(main.JobEligibility).filter_by(user_id=seeker_id).count() == 1
+
+
+def test_user_refresh_loads_requirements_only_for_changed_jobs(app, db, make_user):
+    employer_id = make_user('employer@example.com')
+    seeker_id = make_user('seeker@example.com')
+    with app.app_context():
+        jobs = [add_job(db, employer_id) for _ in range(3)]
+        main.refresh_user_eligibility(seeker_id)
+        db.session.commit()
+
+        with count_queries() as statements:
+            main.refresh_user_eligibility(seeker_id)
+        assert not [s for s in statements if 'job_required_' in s]
+
+        jobs[0].updated_at = datetime.utcnow()
+        db.session.commit()
+        with count_queries() as statements:
+            main.refresh_user_eligibility(seeker_id)
+        # One query per requirement table, for the edited job only
+        assert len([s for s in statements if 'job_required_' in s]) == 4
+
+
+def test_job_refresh_covers_every_batch_of_users(app, db, make_user, monkeypatch):
+    monkeypatch.setattr(main, 'ELIGIBILITY_BATCH_SIZE', 2)
+    employer_id = make_user('employer@example.com')
+    seeker_ids = [make_user(f'seeker{i}@example.com') for i in range(5)]
+    with app.app_context():
+        job = add_job(db, employer_id)
+        main.refresh_job_eligibility(job)
+        db.session.commit()
+
+        assert eligible_pairs(db) == {(seeker_id, job.id) for seeker_id in seeker_ids}
+
+
+def test_eligibility_is_refreshed_when_the_year_changes(app, db, make_user):
+    employer_id = make_user('employer@example.com')
+    seeker_id = make_user('seeker@example.com')
+    this_year = datetime.now().year
+    with app.app_context():
+        db.session.add(main.Experience(user_id=seeker_id, position_title='Engineer', employer='Initech',
+                                       start_date=date(this_year - 3, 1, 1), country='Canada'))
+        job = add_job(db, employer_id)
+        db.session.add(main.JobRequiredExperience(job_id=job.id, years_required=3, role_title='Engineer',
+                                                  role_title_match_type='including', is_required=True))
+        db.session.commit()
+        main.rebuild_eligibility_table()
+        db.session.commit()
+        assert eligible_pairs(db) == {(seeker_id, job.id)}
+
+        # As computed a year ago, with one year less of the ongoing experience
+        db.session.query(main.JobEligibility).delete()
+        main.set_eligibility_year(this_year - 1)
+        db.session.commit()
+
+        assert main.refresh_eligibility_year() == 1
+        db.session.commit()
+        assert eligible_pairs(db) == {(seeker_id, job.id)}
+        assert main.refresh_eligibility_year() == 0
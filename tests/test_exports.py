@@ -0,0 +1,97 @@
+"""Streamed CSV and JSON Lines exports."""
+import csv
+from datetime import datetime, timedelta
+from functools import partial
+import io
+import json
+
+import pytest
+
+import exports
+import main
+
+
+TRICKY_TEXT = [
+    'Plain',
+    'Comma, separated',
+    'She said "hi"',
+    'Line one\nLine two\r\nLine three',
+    'Café 東京 ✓',
+    '=HYPERLINK("http://example.com")',
+    '',
+]
+
+
+def read_csv(chunks):
+    return list(csv.reader(io.StringIO(b''.join(chunks).decode(), newline='')))
+
+
+def read_jsonl(chunks):
+    return [json.loads(line) for line in b''.join(chunks).decode().splitlines()]
+
+
+def test_csv_escapes_delimiters_quotes_newlines_and_non_ascii():
+    rows = [{'id': index, 'text': text} for index, text in enumerate(TRICKY_TEXT)] + [{'id': 99, 'text': None}]
+
+    header, *cells = read_csv(exports.stream_export(rows, ['id', 'text'], 'csv'))
+
+    assert header == ['id', 'text']
+    expected = [text if not text.startswith('=') else "'" + text for text in TRICKY_TEXT] + ['']
+    assert cells == [[str(row['id']), text] for row, text in zip(rows, expected)]
+
+
+def test_jsonl_keeps_text_as_is():
+    rows = [{'id': index, 'text': text, 'unused': 1} for index, text in enumerate(TRICKY_TEXT)]
+
+    assert read_jsonl(exports.stream_export(rows, ['id', 'text'], 'jsonl')) == [
+        {'id': row['id'], 'text': row['text']} for row in rows
+    ]
+
+
+@pytest.mark.parametrize('export_format', ['csv', 'jsonl'])
+def test_rows_are_complete_and_in_order_across_chunks(export_format):
+    rows = [{'id': index, 'text': f'row {index}'} for index in range(7)]
+
+    chunks = list(exports.stream_export(iter(rows), ['id', 'text'], export_format, chunk_rows=3))
+
+    assert len(chunks) == 3
+    if export_format == 'csv':
+        assert read_csv(chunks)[1:] == [[str(row['id']), row['text']] for row in rows]
+    else:
+        assert read_jsonl(chunks) == rows
+
+
+def test_application_export_streams_every_row_newest_first(app, db, make_user, client_for, monkeypatch):
+    monkeypatch.setitem(app.config, 'EXPORT_YIELD_PER', 2)
+    monkeypatch.setattr(main, 'stream_export', partial(exports.stream_export, chunk_rows=3))
+    employer_id = make_user('employer@example.com')
+    applicant_ids = [make_user(f'applicant{index}@example.com', first_name=text or None)
+                     for index, text in enumerate(TRICKY_TEXT)]
+    started = datetime(2030, 1, 1)
+    with app.app_context():
+        job = main.JobPosting(title='Engineer, "Platform"', description='Builds things.', company_name='Acme',
+                              status='active', posted_by=employer_id)
+        db.session.add(job)
+        db.session.flush()
+        applications = [main.JobApplication(user_id=user_id, job_id=job.id, status='Submitted', cover_letter=text,
+                                            applied_at=started + timedelta(minutes=index))
+                        for index, (user_id, text) in enumerate(zip(applicant_ids, TRICKY_TEXT))]
+        db.session.add_all(applications)
+        db.session.commit()
+        newest_first = [application.id for application in reversed(applications)]
+
+    employer = client_for(employer_id)
+    response = employer.get('/api/applications/export?format=csv&include_cover_letter=true')
+    header, *cells = read_csv([response.get_data()])
+    exported = [dict(zip(header, row)) for row in cells]
+
+    assert [int(row['application_id']) for row in exported] == newest_first
+    assert {row['job_title'] for row in exported} == {'Engineer, "Platform"'}
+    assert [row['cover_letter'] for row in exported] == [
+        text if not text.startswith('=') else "'" + text for text in reversed(TRICKY_TEXT)
+    ]
+
+    response = employer.get('/api/applications/export?format=jsonl&include_cover_letter=true')
+    exported = read_jsonl([response.get_data()])
+    assert [row['application_id'] for row in exported] == newest_first
+    assert [row['cover_letter'] for row in exported] == list(reversed(TRICKY_TEXT))
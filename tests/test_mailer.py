@@ -0,0 +1,111 @@
+"""The email outbox: sending, retries and giving up."""
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import smtplib
+
+import pytest
+
+import main
+
+
+class FakeMail:
+    """Stands in for Flask-Mail. fail(recipient, error) makes the next sends to recipient raise error."""
+
+    def __init__(self):
+        self.sent = []
+        self.failures = {}
+
+    def fail(self, recipient, error, times=1):
+        self.failures[recipient] = [error] * times
+
+    @contextmanager
+    def connect(self):
+        yield self
+
+    def send(self, message):
+        recipient = message.recipients[0]
+        if self.failures.get(recipient):
+            raise self.failures[recipient].pop(0)
+        self.sent.append(recipient)
+
+
+@pytest.fixture
+def mail(app, monkeypatch):
+    fake = FakeMail()
+    monkeypatch.setattr(main.outbox, 'mail', fake)
+    return fake
+
+
+def enqueue(app, db, *recipients):
+    with app.app_context():
+        for recipient in recipients:
+            main.outbox.enqueue(recipient, 'Hello', 'Body')
+        db.session.commit()
+
+
+def outbox_rows(app, db):
+    """recipient -> (status, attempts, last_error)"""
+    with app.app_context():
+        return {row.recipient: (row.status, row.attempts, row.last_error)
+                for row in db.session.query(main.EmailOutbox)}
+
+
+def make_due(app, db):
+    """Moves every scheduled retry into the past, as if its backoff delay had passed."""
+    with app.app_context():
+        db.session.query(main.EmailOutbox).update({'next_attempt_at': datetime.utcnow() - timedelta(seconds=1)})
+        db.session.commit()
+
+
+def send_batch(app):
+    with app.app_context():
+        return main.outbox.send_batch()
+
+
+def test_failed_send_is_retried_after_the_backoff_and_then_marked_sent(app, db, mail):
+    enqueue(app, db, 'ok@example.com', 'flaky@example.com')
+    mail.fail('flaky@example.com', smtplib.SMTPRecipientsRefused({'flaky@example.com': (450, b'Try later')}))
+
+    assert send_batch(app) == 2
+    rows = outbox_rows(app, db)
+    assert rows['ok@example.com'] == ('sent', 0, None)
+    assert rows['flaky@example.com'][:2] == ('pending', 1)
+    assert 'Try later' in rows['flaky@example.com'][2]
+
+    # Not due again until the backoff delay has passed
+    assert send_batch(app) == 0
+    make_due(app, db)
+    assert send_batch(app) == 1
+
+    assert outbox_rows(app, db)['flaky@example.com'] == ('sent', 1, None)
+    assert mail.sent == ['ok@example.com', 'flaky@example.com']
+
+
+def test_lost_connection_retries_the_rest_of_the_batch(app, db, mail):
+    enqueue(app, db, 'first@example.com', 'second@example.com', 'third@example.com')
+    mail.fail('second@example.com', smtplib.SMTPServerDisconnected('Connection lost'))
+
+    send_batch(app)
+    assert {recipient: row[:2] for recipient, row in outbox_rows(app, db).items()} == {
+        'first@example.com': ('sent', 0), 'second@example.com': ('pending', 1), 'third@example.com': ('pending', 1),
+    }
+
+    make_due(app, db)
+    send_batch(app)
+    assert {row[0] for row in outbox_rows(app, db).values()} == {'sent'}
+    assert mail.sent == ['first@example.com', 'second@example.com', 'third@example.com']
+
+
+def test_message_is_marked_failed_after_max_attempts(app, db, mail, monkeypatch):
+    monkeypatch.setitem(app.config, 'MAIL_OUTBOX_MAX_ATTEMPTS', 2)
+    enqueue(app, db, 'broken@example.com')
+    mail.fail('broken@example.com', smtplib.SMTPDataError(554, b'Rejected'), times=5)
+
+    send_batch(app)
+    make_due(app, db)
+    send_batch(app)
+    make_due(app, db)
+
+    assert send_batch(app) == 0
+    assert outbox_rows(app, db)['broken@example.com'][:2] == ('failed', 2)
+    assert mail.sent == []
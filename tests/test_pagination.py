@@ -0,0 +1,51 @@
+"""Keyset pagination of the list endpoints."""
+import pytest
+from sqlalchemy import text
+
+import main
+
+
+def page_through(client, path, limit):
+    """Follows X-Next-Cursor from the first page to the last and returns the pages."""
+    pages, cursor = [], None
+    while len(pages) < 50:
+        query_string = {'limit': limit, **({'cursor': cursor} if cursor else {})}
+        response = client.get(path, query_string=query_string)
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            return pages
+    pytest.fail(f"{path} kept returning a next cursor")
+
+
+@pytest.fixture
+def employer_with_tied_applications(app, db, make_user):
+    """An employer with one job and six applications stored with the same second-precision timestamp."""
+    employer_id = make_user('employer@example.com')
+    seeker_ids = [make_user(f'seeker{number}@example.com') for number in range(6)]
+    with app.app_context():
+        job = main.JobPosting(title='Python Engineer', description='Builds things.', company_name='Acme',
+                              location='Toronto', employment_type='Full-Time', status='active',
+                              posted_by=employer_id)
+        db.session.add(job)
+        db.session.flush()
+        db.session.add_all(main.JobApplication(user_id=seeker_id, job_id=job.id) for seeker_id in seeker_ids)
+        db.session.commit()
+        # The format SQLite's CURRENT_TIMESTAMP server default writes
+        db.session.execute(text("UPDATE job_application SET applied_at = '2025-01-01 10:00:00'"))
+        db.session.commit()
+    return employer_id
+
+
+@pytest.mark.parametrize('path', ['/api/applications', '/api/applicants'])
+@pytest.mark.parametrize('limit', [1, 2, 4])
+def test_pages_through_rows_sharing_a_timestamp(client_for, employer_with_tied_applications, path, limit):
+    client = client_for(employer_with_tied_applications)
+    full_list = client.get(path).get_json()
+    assert len(full_list) == 6
+
+    pages = page_through(client, path, limit)
+
+    assert len(pages) == -(-6 // limit)
+    assert [row for page in pages for row in page] == full_list
@@ -0,0 +1,56 @@
+"""Password hashing and the upgrade of stored hashes at login."""
+import pytest
+from werkzeug.security import check_password_hash, generate_password_hash
+
+import main
+from passwords import PasswordHasher
+
+
+# Low costs keep the tests fast; only their order matters
+CONFIGURED = 'pbkdf2:sha256:2000'
+
+
+@pytest.fixture
+def hasher(monkeypatch):
+    hasher = PasswordHasher(CONFIGURED, workers=2, max_pending=4, wait_seconds=1)
+    monkeypatch.setattr(main, 'password_hasher', hasher)
+    return hasher
+
+
+@pytest.mark.parametrize('stored_method, upgraded', [
+    ('pbkdf2:sha256:2000', False),
+    ('pbkdf2:sha256:4000', False),
+    ('pbkdf2:sha256:1000', True),
+    ('pbkdf2:sha512:4000', True),
+    ('scrypt:32768:8:1', True),
+])
+def test_needs_rehash_compares_algorithm_and_cost(hasher, stored_method, upgraded):
+    assert hasher.needs_rehash(generate_password_hash('secret', method=stored_method)) is upgraded
+
+
+def login(app, email, password):
+    """Returns where the login form redirects to: the dashboard on success."""
+    response = app.test_client().post('/login', data={'email': email, 'password': password})
+    return response.headers['Location']
+
+
+def stored_hash(app, db, user_id):
+    with app.app_context():
+        return db.session.get(main.User, user_id).password
+
+
+def test_login_leaves_a_stronger_hash_alone(app, db, make_user, hasher):
+    stronger = generate_password_hash('secret', method='pbkdf2:sha256:4000')
+    user_id = make_user('seeker@example.com', password=stronger)
+
+    assert login(app, 'seeker@example.com', 'secret') == '/dashboard'
+    assert stored_hash(app, db, user_id) == stronger
+
+
+def test_login_upgrades_a_weaker_hash(app, db, make_user, hasher):
+    user_id = make_user('seeker@example.com', password=generate_password_hash('secret', method='pbkdf2:sha256:1000'))
+
+    assert login(app, 'seeker@example.com', 'secret') == '/dashboard'
+    upgraded = stored_hash(app, db, user_id)
+    assert upgraded.startswith(CONFIGURED + '$')
+    assert check_password_hash(upgraded, 'secret')
@@ -0,0 +1,53 @@
+"""Job search: PostgreSQL's tsvector column, and the in-process index used on other databases."""
+from sqlalchemy.dialects import postgresql
+
+import main
+
+
+def add_jobs(app, db, employer_id, *titles):
+    with app.app_context():
+        jobs = [main.JobPosting(title=title, description='Builds things.', company_name='Acme', location='Toronto',
+                                employment_type='Full-Time', status='active', posted_by=employer_id)
+                for title in titles]
+        db.session.add_all(jobs)
+        db.session.commit()
+        return [job.id for job in jobs]
+
+
+def search(client, term):
+    response = client.get('/api/jobs/browse', query_string={'search': term})
+    assert response.status_code == 200, response.get_json()
+    return [job['title'] for job in response.get_json()]
+
+
+def test_fallback_search_ranks_prefix_matches(app, db, make_user, client_for):
+    employer_id = make_user('employer@example.com')
+    add_jobs(app, db, employer_id, 'Python Developer', 'Python Python Developer', 'Java Developer', 'Gardener')
+    seeker = client_for(make_user('seeker@example.com'))
+
+    assert search(seeker, 'pyth dev') == ['Python Python Developer', 'Python Developer']
+    assert search(seeker, 'developer') == ['Java Developer', 'Python Python Developer', 'Python Developer']
+    assert search(seeker, 'cobol') == []
+
+
+def test_fallback_search_binds_only_the_best_matches(app, db, make_user, client_for, monkeypatch):
+    monkeypatch.setitem(app.config, 'SEARCH_FALLBACK_MAX_RESULTS', 2)
+    employer_id = make_user('employer@example.com')
+    add_jobs(app, db, employer_id, 'Developer', 'Developer Developer', 'Developer Developer Developer', 'Developer')
+    seeker = client_for(make_user('seeker@example.com'))
+
+    assert search(seeker, 'developer') == ['Developer Developer Developer', 'Developer Developer']
+
+
+def test_postgres_search_matches_and_ranks_on_the_tsvector_column(app, monkeypatch):
+    monkeypatch.setattr(main, '_uses_postgres_search', lambda: True)
+    with app.app_context():
+        query, rank = main.apply_job_search(main.JobPosting.query, 'Pyth dev!')
+        compiled = query.add_columns(rank).statement.compile(dialect=postgresql.dialect())
+
+    sql = str(compiled)
+    assert 'job_posting.search_vector @@ to_tsquery(' in sql
+    assert 'ts_rank(job_posting.search_vector, to_tsquery(' in sql
+    assert 'pyth:* & dev:*' in compiled.params.values()
+    # The in-process index is not touched
+    assert not main.job_search_index.is_built
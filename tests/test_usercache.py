@@ -0,0 +1,57 @@
+"""The cached identity that the login manager restores on every request."""
+from werkzeug.security import generate_password_hash
+
+import main
+import usercache
+from passwords import PasswordHasher
+
+
+def cached_identity(app, user_id):
+    """What current_user is on the user's next request."""
+    with app.app_context():
+        return main.load_user(str(user_id))
+
+
+def test_confirming_the_email_is_seen_on_the_next_request(app, make_user, client_for):
+    user_id = make_user('seeker@example.com', confirmed=False)
+    client_for(user_id).get('/api/account')
+    assert cached_identity(app, user_id).confirmed is False
+
+    with app.app_context():
+        token = main.s.dumps('seeker@example.com', salt='email-confirm')
+    app.test_client().get(f'/confirm_email/{token}')
+
+    assert cached_identity(app, user_id).confirmed is True
+
+
+def test_change_made_by_another_worker_is_seen_once_the_entry_expires(app, db, make_user, client_for, monkeypatch):
+    user_id = make_user('seeker@example.com')
+    now = [1000.0]
+    monkeypatch.setattr(usercache.time, 'monotonic', lambda: now[0])
+    client_for(user_id).get('/api/account')
+
+    # Another process commits the change, so this one's cache is not invalidated
+    with app.app_context():
+        db.session.get(main.User, user_id).email = 'renamed@example.com'
+        db.session.commit()
+    assert cached_identity(app, user_id).email == 'seeker@example.com'
+
+    now[0] += app.config['USER_CACHE_TTL_SECONDS']
+    assert cached_identity(app, user_id).email == 'renamed@example.com'
+
+
+def test_password_change_is_not_masked_by_the_cached_identity(app, db, make_user, client_for, monkeypatch):
+    monkeypatch.setattr(main, 'password_hasher', PasswordHasher('pbkdf2:sha256:2000', 2, 4, 1))
+    user_id = make_user('seeker@example.com', password=generate_password_hash('old', method='pbkdf2:sha256:2000'))
+    client_for(user_id).get('/api/account')
+
+    with app.app_context():
+        db.session.get(main.User, user_id).password = generate_password_hash('new', method='pbkdf2:sha256:2000')
+        db.session.commit()
+
+    def login(password):
+        response = app.test_client().post('/login', data={'email': 'seeker@example.com', 'password': password})
+        return response.headers['Location']
+
+    assert login('old') == '/login'
+    assert login('new') == '/dashboard'
@@ -0,0 +1,198 @@
+"""
+SQL statements run by the write endpoints.
+
+These endpoints commit with commit_keeping_state() and serialize the objects they
+just wrote, so nothing is loaded again after the commit. Each budget is the
+number of statements the endpoint runs today; reloading the written rows after
+the commit would push it over.
+"""
+from datetime import date
+
+import pytest
+
+import main
+from querybudget import assert_max_queries, count_queries
+
+
+JOB_PAYLOAD = {
+    'title': 'Backend Engineer', 'description': 'Builds APIs.', 'company_name': 'Acme', 'location': 'Toronto',
+    'salary_min': 90000, 'salary_max': 110000, 'employment_type': 'Full-Time', 'employment_arrangement': 'Remote',
+    'application_deadline': '2030-01',
+    'required_skills': [{'title': 'Python', 'type': 'Technical', 'title_match_type': 'exact', 'is_required': True}],
+    'required_experiences': [{'years_required': 2, 'industry': None, 'role_title': 'Engineer',
+                              'role_title_match_type': 'including', 'country': 'Canada',
+                              'country_match_type': 'exact', 'is_required': True}],
+    'required_certificates': [{'title': 'AWS', 'title_match_type': 'including', 'issuer': None,
+                               'issuer_match_type': 'exact', 'is_required': False}],
+    'required_degrees': [{'level': "Bachelor's", 'field_of_study': None, 'is_required': True}],
+}
+
+
+@pytest.fixture
+def profile(app, db, make_user, client_for):
+    """A seeker with one item of each kind, and an employer with a job that has requirements."""
+    employer_id = make_user('employer@example.com')
+    seeker_id = make_user('seeker@example.com')
+    with app.app_context():
+        items = {
+            'experience_id': main.Experience(user_id=seeker_id, position_title='Engineer', employer='Initech',
+                                             start_date=date(2018, 1, 1), end_date=date(2022, 1, 1),
+                                             country='Canada'),
+            'certificate_id': main.Certificate(user_id=seeker_id, title='AWS Developer', issuer='AWS',
+                                               issue_date=date(2021, 1, 1)),
+            'degree_id': main.Degree(user_id=seeker_id, degree=main.DegreeEnum.BACHELOR, field_of_study='CS',
+                                     school='U', start_date=date(2012, 9, 1), end_date=date(2016, 6, 1)),
+            'skill_id': main.Skill(user_id=seeker_id, type='Technical', title='Python', status='Claimed'),
+        }
+        db.session.add_all(items.values())
+        db.session.commit()
+        item_ids = {key: item.id for key, item in items.items()}
+
+    employer = client_for(employer_id)
+    job_id = employer.post('/api/jobs', json=JOB_PAYLOAD).get_json()['id']
+    seeker = client_for(seeker_id)
+    # Restores the logged-in identities once, so that is not counted below
+    seeker.get('/api/account')
+    return {'seeker': seeker, 'employer': employer, 'job_id': job_id, **item_ids}
+
+
+EXPERIENCE = {'position_title': 'Senior Engineer', 'employer': 'Initech', 'start_date': '2018-01',
+              'end_date': '2023-01', 'country': 'Canada'}
+CERTIFICATE = {'title': 'AWS Architect', 'issuer': 'AWS', 'issue_date': '2022-01'}
+DEGREE = {'degree': "Master's", 'field_of_study': 'CS', 'school': 'U', 'start_date': '2016-09',
+          'end_date': '2018-06'}
+
+
+def skill_payload(profile):
+    return {'type': 'Technical', 'title': 'Go', 'is_public': True,
+            'acquired_at_sources': [{'id': profile['experience_id'], 'type': 'experience'}]}
+
+
+WRITES = [
+    # (name, role, method, path, body, max statements)
+    ('add_skill', 'seeker', 'post', lambda p: '/api/skills', skill_payload, 13),
+    ('update_skill', 'seeker', 'put', lambda p: f"/api/skills/{p['skill_id']}", skill_payload, 14),
+    ('add_experience', 'seeker', 'post', lambda p: '/api/experiences', lambda p: EXPERIENCE, 10),
+    ('edit_experience', 'seeker', 'put', lambda p: f"/api/experiences/{p['experience_id']}",
+     lambda p: EXPERIENCE, 11),
+    ('add_certificate', 'seeker', 'post', lambda p: '/api/certificates', lambda p: CERTIFICATE, 10),
+    ('edit_certificate', 'seeker', 'put', lambda p: f"/api/certificates/{p['certificate_id']}",
+     lambda p: CERTIFICATE, 11),
+    ('add_degree', 'seeker', 'post', lambda p: '/api/degrees', lambda p: DEGREE, 10),
+    ('edit_degree', 'seeker', 'put', lambda p: f"/api/degrees/{p['degree_id']}", lambda p: DEGREE, 11),
+    ('update_account', 'seeker', 'put', lambda p: '/api/account', lambda p: {'bio': 'Writes tests.'}, 2),
+    ('create_job', 'employer', 'post', lambda p: '/api/jobs', lambda p: JOB_PAYLOAD, 13),
+    ('update_job', 'employer', 'put', lambda p: f"/api/jobs/{p['job_id']}",
+     lambda p: dict(JOB_PAYLOAD, salary_min=95000), 7),
+]
+
+
+@pytest.mark.parametrize('name, role, method, path, body, max_queries', WRITES, ids=[write[0] for write in WRITES])
+def test_write_does_not_reload_after_commit(profile, name, role, method, path, body, max_queries):
+    client = profile[role]
+    with assert_max_queries(max_queries):
+        response = getattr(client, method)(path(profile), json=body(profile))
+    assert response.status_code < 300, response.get_json()
+
+
+def requirement_writes(statements):
+    """The INSERT, UPDATE and DELETE statements run against the job_required_* tables."""
+    return [s for s in statements if s.split()[0] in ('INSERT', 'UPDATE', 'DELETE') and 'job_required_' in s]
+
+
+SKILLS = [{'title': title, 'type': 'Technical', 'title_match_type': 'exact', 'is_required': True}
+          for title in ('Python', 'SQL', 'Docker')]
+
+
+@pytest.fixture
+def job_with_skills(profile):
+    profile['employer'].put(f"/api/jobs/{profile['job_id']}", json=dict(JOB_PAYLOAD, required_skills=SKILLS))
+    return profile
+
+
+def save_skills(profile, skills):
+    with count_queries() as statements:
+        response = profile['employer'].put(f"/api/jobs/{profile['job_id']}",
+                                           json=dict(JOB_PAYLOAD, required_skills=skills))
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['required_skills'], requirement_writes(statements)
+
+
+def test_unchanged_requirements_are_not_written(job_with_skills):
+    skills, writes = save_skills(job_with_skills, SKILLS)
+
+    assert writes == []
+    assert [skill['skill_title'] for skill in skills] == ['Python', 'SQL', 'Docker']
+
+
+def test_requirement_edit_writes_only_the_edited_rows(job_with_skills):
+    before, _ = save_skills(job_with_skills, SKILLS)
+    skills, writes = save_skills(job_with_skills, [SKILLS[0], dict(SKILLS[1], title='PostgreSQL'), SKILLS[2]])
+
+    assert len(writes) == 1 and writes[0].startswith('UPDATE job_required_skill')
+    assert [skill['id'] for skill in skills] == [skill['id'] for skill in before]
+    assert [skill['skill_title'] for skill in skills] == ['Python', 'PostgreSQL', 'Docker']
+
+
+def test_requirements_keep_the_submitted_order(job_with_skills):
+    reordered = [SKILLS[2], SKILLS[0], SKILLS[1]]
+    skills, _ = save_skills(job_with_skills, reordered)
+    assert [skill['skill_title'] for skill in skills] == ['Docker', 'Python', 'SQL']
+
+    reloaded = job_with_skills['employer'].get(f"/api/jobs/{job_with_skills['job_id']}").get_json()
+    assert [skill['skill_title'] for skill in reloaded['required_skills']] == ['Docker', 'Python', 'SQL']
+
+
+
+QUESTIONS = [
+    {'question_type': 'multiple-choice', 'question_text': 'Favourite language?', 'answers': ['Python', 'Go', 'Rust']},
+    {'question_type': 'descriptive', 'question_text': 'Tell us about a project.', 'char_limit': 500},
+]
+
+
+@pytest.fixture
+def questionnaire(profile):
+    response = profile['employer'].post('/api/tests', json={'test_type': 'Questionnaire', 'title': 'Screening',
+                                                             'questions': QUESTIONS})
+    assert response.status_code == 201, response.get_json()
+    return dict(profile, test=response.get_json())
+
+
+def save_questions(profile, questions):
+    body = {'test_type': 'Questionnaire', 'title': 'Screening', 'questions': questions}
+    response = profile['employer'].put(f"/api/tests/{profile['test']['id']}", json=body)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['questions']
+
+
+def test_questions_keep_their_ids_across_edits(questionnaire):
+    choice, descriptive = questionnaire['test']['questions']
+    questions = save_questions(questionnaire, [
+        dict(descriptive, question_text='Tell us about your best project.'),
+        {'id': choice['id'], 'question_type': 'multiple-choice', 'question_text': 'Favourite language?',
+         'answers': choice['answers']},
+        {'question_type': 'descriptive', 'question_text': 'Anything else?', 'char_limit': 200},
+    ])
+
+    assert [q['id'] for q in questions[:2]] == [descriptive['id'], choice['id']]
+    assert questions[2]['id'] not in (choice['id'], descriptive['id'])
+    assert [q['question_text'] for q in questions] == [
+        'Tell us about your best project.', 'Favourite language?', 'Anything else?']
+
+
+def test_reordered_options_keep_pointing_at_their_question(app, db, questionnaire):
+    choice = questionnaire['test']['questions'][0]
+    # What a candidate's stored choice refers to: an option id, with the question and text it was chosen from
+    chosen = {answer['id']: (choice['id'], answer['answer_text']) for answer in choice['answers']}
+    python, go, rust = choice['answers']
+
+    questions = save_questions(questionnaire, [
+        {'id': choice['id'], 'question_type': 'multiple-choice', 'question_text': 'Favourite language?',
+         'answers': [rust, python, go]},
+        QUESTIONS[1] | {'id': questionnaire['test']['questions'][1]['id']},
+    ])
+
+    assert questions[0]['answers'] == [rust, python, go]
+    with app.app_context():
+        stored = {row.id: (row.question_id, row.answer_text) for row in db.session.query(main.Answer)}
+    assert stored == chosen